@@ -158,6 +158,7 @@ from xtgeo.surface.regular_surface import surface_from_file
 from xtgeo.surface.regular_surface import surface_from_roxar
 from xtgeo.surface.regular_surface import surface_from_cube
 from xtgeo.surface.regular_surface import surface_from_grid3d
+from xtgeo.surface.surfaces import surfaces_catalog
 
 from xtgeo.grid3d.grid import grid_from_file
 from xtgeo.grid3d.grid import grid_from_roxar
@@ -194,6 +194,49 @@ import_array();
 %apply (long* ARGOUT_ARRAY1, long DIM1) {(long *swig_np_lng_aout_v1,
                                           long n_swig_np_lng_aout_v1)};
 
+// ==POINTER OR NUMPY===================================================================
+
+// Pointer arguments for grid property values, which accept either a SWIG carray
+// (as before) or a numpy array. A numpy array must have the exact C type, native
+// byte order, be C or F contiguous and be writeable, as the C routines may update
+// values in place; the C routine then works directly on the numpy data (no copy).
+// Cf. _gridprop_lowlevel.get_buffer() in Python.
+%define %xtg_carray_or_numpy(TYPE, NPYTYPE, NAME)
+%typemap(in, fragment="NumPy_Fragments") TYPE *NAME (PyArrayObject* array=NULL) {
+  if (is_array($input)) {
+    array = obj_to_array_no_conversion($input, NPYTYPE);
+    if (!array || !require_native(array)) SWIG_fail;
+    if (!PyArray_ISONESEGMENT(array)) {
+      PyErr_SetString(PyExc_TypeError, "Array must be C or Fortran contiguous");
+      SWIG_fail;
+    }
+    if (!PyArray_ISWRITEABLE(array)) {
+      PyErr_SetString(PyExc_ValueError,
+                      "Array must be writeable, as it may be updated in place");
+      SWIG_fail;
+    }
+    $1 = (TYPE *) array_data(array);
+  }
+  else {
+    int res = SWIG_ConvertPtr($input, (void **) &$1, $descriptor(TYPE *), 0);
+    if (!SWIG_IsOK(res)) {
+      SWIG_exception_fail(SWIG_ArgError(res),
+                          "in method '$symname', argument $argnum of type '$type'");
+    }
+  }
+}
+%enddef
+
+%xtg_carray_or_numpy(double, NPY_DOUBLE, p_prop_v)
+%xtg_carray_or_numpy(double, NPY_DOUBLE, p_val_v)
+%xtg_carray_or_numpy(double, NPY_DOUBLE, p_double_v)
+%xtg_carray_or_numpy(double, NPY_DOUBLE, p_dprop_v)
+%xtg_carray_or_numpy(float, NPY_FLOAT, p_fprop_v)
+%xtg_carray_or_numpy(int, NPY_INT, p_int_v)
+%xtg_carray_or_numpy(int, NPY_INT, p_iprop_v)
+%xtg_carray_or_numpy(int, NPY_INT, p_zon_v)
+%xtg_carray_or_numpy(int, NPY_INT, p_prop1)
+
 //======================================================================================
 // Inline tranforms
 //======================================================================================
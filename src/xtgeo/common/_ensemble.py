@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Private helpers for loading many files (e.g. realisations) concurrently."""
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import os
+import tempfile
+import multiprocessing
+from collections import OrderedDict
+
+import numpy as np
+
+from xtgeo.common.xtgeo_dialog import XTGeoDialog
+
+xtg = XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+EXECUTORS = ("process", "thread")
+
+SHMDIR = "/dev/shm"  # memory backed file system (Linux), if present
+ALIGN = 64  # byte alignment of each array in a shared file
+
+
+def load_many(func, items, workers=1, executor="process"):
+    """Apply func on each item in a process or thread pool.
+
+    The results are returned as a list in the same order as items. Exceptions
+    in func are raised in the caller. With executor="process", func and the
+    items must be picklable, i.e. func must be a module level function.
+
+    The pool is opt-in: by default (workers=1) func is applied serially, in
+    the calling thread, and no pool is started. Note that a process pool on
+    platforms that spawn processes (Windows, macOS) needs the usual
+    ``if __name__ == "__main__":`` guard in the calling script.
+
+    Processes are the default executor since the C routines (via SWIG) and most of the
+    file parsing keep the Python GIL, so threads will mostly run one at the
+    time. Use threads for closures, or when func shall modify the items.
+
+    Args:
+        func: Function taking one item as argument
+        items (list): Items, typically file names
+        workers (int): Number of workers (limited by number of items); default
+            is 1, which means serial, in the calling thread. None means number
+            of CPUs.
+        executor (str): "process" (default) or "thread".
+    """
+
+    items = list(items)
+
+    if executor not in EXECUTORS:
+        raise ValueError(
+            "Invalid executor {}, must be one of {}".format(
+                executor, list(EXECUTORS)
+            )
+        )
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if workers < 1:
+        raise ValueError("Number of workers must be 1 or more, got {}".format(workers))
+
+    workers = min(workers, len(items))
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    except ImportError as err:  # python 2.7 needs the futures backport
+        raise ImportError(
+            "Using {} workers requires concurrent.futures ({}); install the "
+            "'futures' package, or use workers=1".format(workers, err)
+        )
+
+    pooltype = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+
+    logger.info("Load %s items with %s %s workers", len(items), workers, executor)
+    with pooltype(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def stack_values(arrays):
+    """Stack a list of (masked) arrays of same shape along a new first axis.
+
+    Returns a masked array where the first axis is the realisation; the stacked
+    array is allocated once and each input is copied into it.
+
+    Raises:
+        ValueError: If arrays differ in shape.
+    """
+
+    if not arrays:
+        raise ValueError("Nothing to stack")
+
+    first = arrays[0]
+    for num, arr in enumerate(arrays):
+        if arr.shape != first.shape:
+            raise ValueError(
+                "Cannot stack, shape {} for no. {} differs from {}".format(
+                    arr.shape, num, first.shape
+                )
+            )
+
+    dtype = np.result_type(*arrays)
+    stacked = np.ma.empty((len(arrays),) + first.shape, dtype=dtype)
+    stacked.mask = np.zeros(stacked.shape, dtype=bool)
+    for num, arr in enumerate(arrays):
+        stacked.data[num] = np.ma.getdata(arr)
+        stacked.mask[num] = np.ma.getmaskarray(arr)
+
+    return stacked
+
+
+class SharedArrays(object):
+    """Numpy arrays in one memory mapped file, shared by processes in a pool.
+
+    The arrays are written once. Only the file name and the layout are
+    pickled, and each process maps the file (copy on write), so the values
+    are in memory once, in the OS page cache. The owner shall call remove().
+
+    Args:
+        arrays (list): Pairs of (name, array)
+    """
+
+    def __init__(self, arrays):
+        self.layout = []  # (name, dtype, shape, offset) per array
+        nbytes = 0
+        for name, arr in arrays:
+            self.layout.append((name, arr.dtype.str, arr.shape, nbytes))
+            nbytes += -(-arr.nbytes // ALIGN) * ALIGN
+        nbytes = max(nbytes, ALIGN)
+
+        fdesc, self.filename = tempfile.mkstemp(
+            prefix="xtgeo_shared_", suffix=".bin", dir=shared_dir(nbytes)
+        )
+
+        try:
+            # reserve the space, so a full file system gives an error here instead
+            # of a bus error (SIGBUS) when the memory map is written
+            mode = "w+"
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fdesc, 0, nbytes)
+                mode = "r+"
+            os.close(fdesc)
+            fdesc = None
+
+            shared = np.memmap(self.filename, dtype=np.uint8, mode=mode, shape=nbytes)
+            for (_name, dtype, shape, offset), (_, arr) in zip(self.layout, arrays):
+                size = arr.nbytes
+                view = shared[offset : offset + size].view(dtype).reshape(shape)
+                view[...] = arr
+            shared.flush()
+            del shared
+        except BaseException:
+            if fdesc is not None:
+                os.close(fdesc)
+            self.remove()
+            raise
+
+    def arrays(self):
+        """Return an ordered dict of the arrays, mapped from the shared file."""
+
+        result = OrderedDict()
+        for name, dtype, shape, offset in self.layout:
+            if int(np.prod(shape)) == 0:
+                result[name] = np.empty(shape, dtype=dtype)
+                continue
+            result[name] = np.memmap(
+                self.filename, dtype=dtype, mode="c", offset=offset, shape=shape
+            )
+        return result
+
+    def remove(self):
+        """Remove the shared file."""
+        try:
+            os.remove(self.filename)
+        except OSError:
+            logger.warning("Could not remove %s", self.filename)
+
+
+def shared_dir(nbytes):
+    """Directory for a shared file; SHMDIR if it has room, else the temp dir."""
+
+    if os.path.isdir(SHMDIR) and hasattr(os, "statvfs"):
+        stat = os.statvfs(SHMDIR)
+        if stat.f_bavail * stat.f_frsize >= nbytes:
+            return SHMDIR
+        logger.info("Too little space in %s, use %s", SHMDIR, tempfile.gettempdir())
+
+    return tempfile.gettempdir()
@@ -16,3 +16,4 @@ VERYLARGEPOSITIVE = 10E30
 VERYLARGENEGATIVE = -10E30
 
 UNDEF_MAP_IRAPB = 1E30
+UNDEF_MAP_IRAPB_LIMIT = 0.99E30
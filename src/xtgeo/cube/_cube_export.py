@@ -132,7 +132,7 @@ def _export_segy_xtgeo(self, sfile):
 
     ilns = self._ilines.astype(np.int32)
     xlns = self._xlines.astype(np.int32)
-    trid = self._traceidcodes.flatten().astype(np.int32)
+    trid = self.traceidcodes.flatten().astype(np.int32)
 
     _cxtgeo.swig_numpy_to_carr_i1d(ilns, ilinesp)
     _cxtgeo.swig_numpy_to_carr_i1d(xlns, xlinesp)
@@ -5,20 +5,21 @@ import segyio
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 import xtgeo.common.calc as xcalc
 from xtgeo.common import XTGeoDialog
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def import_segy(self, sfile, engine="segyio"):
+def import_segy(self, sfile, engine="segyio", lazy=False):
     if engine == "segyio":
-        _import_segy_io(self, sfile)
+        _import_segy_io(self, sfile, lazy=lazy)
     else:
         pass
         # _import_segy_xtgeo()
 
 
-def _import_segy_io(self, sfile):
+def _import_segy_io(self, sfile, lazy=False):
     """Import SEGY via Statoils FOSS SegyIO library.
 
     Args:
@@ -26,6 +27,8 @@ def _import_segy_io(self, sfile):
         sfile (str): File name of SEGY file
         undef (float): If None, dead traces (undef) are read as is, but
             if a a value, than dead traces get this value.
+        lazy (bool): If True, only the geometry is read here, and values are
+            read on demand later (see _cube_lazy).
     """
 
     # pylint: disable=too-many-statements
@@ -36,21 +39,34 @@ def _import_segy_io(self, sfile):
     with segyio.open(sfile, "r") as segyfile:
         segyfile.mmap()
 
-        values = segyio.tools.cube(segyfile)
-
-        if np.isnan(np.sum(values)):
-            raise ValueError("The input contains NaN values which is trouble!")
-
         logger.debug(segyfile.fast)
         logger.debug(segyfile.ilines)
         logger.debug(len(segyfile.ilines))
         ilines = segyfile.ilines
         xlines = segyfile.xlines
 
-        ncol, nrow, nlay = values.shape
+        if lazy:
+            # same shape and trace order as segyio.tools.cube()
+            if len(segyfile.offsets) > 1:
+                raise ValueError("Lazy import of prestack SEGY is not supported")
+
+            ncol, nrow = len(ilines), len(xlines)
+            if segyfile.sorting != segyio.TraceSortingFormat.INLINE_SORTING:
+                ncol, nrow = nrow, ncol
+            nlay = len(segyfile.samples)
+
+            values = _cube_lazy.SegyValues(sfile, (ncol, nrow, nlay))
+            traceidcodes = None  # read on demand
+        else:
+            values = segyio.tools.cube(segyfile)
+
+            if np.isnan(np.sum(values)):
+                raise ValueError("The input contains NaN values which is trouble!")
+
+            ncol, nrow, nlay = values.shape
 
-        trcode = segyio.TraceField.TraceIdentificationCode
-        traceidcodes = segyfile.attributes(trcode)[:].reshape(ncol, nrow)
+            trcode = segyio.TraceField.TraceIdentificationCode
+            traceidcodes = segyfile.attributes(trcode)[:].reshape(ncol, nrow)
 
         logger.info("NRCL  %s %s %s", ncol, nrow, nlay)
 
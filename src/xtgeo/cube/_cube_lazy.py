@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""Private module, lazy (out of core) Cube values, read from SEG-Y on demand."""
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import math
+import operator
+import threading
+
+import numpy as np
+
+import segyio
+
+import xtgeo
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+CHUNKBYTES = 256 * 1024 ** 2  # max size of blocks read at once, e.g. statistics
+MARGIN = 2  # extra nodes around a region, for trilinear sampling near edges
+
+
+class SegyValues(object):
+    """A read only, numpy like view of the values in a SEG-Y file.
+
+    The view has shape (ncol, nrow, nlay) as Cube values, and the traces are
+    ordered as in segyio.tools.cube(). Basic indexing (integers and slices),
+    e.g. an inline ``view[10]``, a crossline ``view[:, 5]``, a time slice
+    ``view[:, :, 100]`` or a trace ``view[10, 5]``, reads only the traces that
+    are touched, through the memory mapped file. Since SEG-Y is stored trace
+    by trace, a time slice must still touch all traces.
+
+    Conversion to a numpy array (e.g. ``np.asarray(view)``) reads all values.
+    Statistics (min, max, mean, std) are computed block by block.
+    """
+
+    def __init__(self, sfile, shape):
+        self._sfile = sfile
+        self.shape = tuple(int(num) for num in shape)
+        self.dtype = np.dtype(np.float32)
+        self._segyfile = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the file is reopened when needed, e.g. in another process
+        state = self.__dict__.copy()
+        state["_segyfile"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    def __repr__(self):
+        return "{} (shape={}, file={})".format(
+            self.__class__.__name__, self.shape, self._sfile
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def ndim(self):
+        """Number of dimensions, always 3."""
+        return 3
+
+    @property
+    def size(self):
+        """Number of values."""
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        """Number of bytes the values will use in memory, if all are read."""
+        return self.size * self.dtype.itemsize
+
+    @property
+    def filesrc(self):
+        """The SEG-Y file name."""
+        return self._sfile
+
+    def close(self):
+        """Close the SEG-Y file, if open (it is reopened if needed)."""
+        segyfile = getattr(self, "_segyfile", None)
+        if segyfile is not None:
+            segyfile.close()
+            self._segyfile = None
+
+    def _open(self):
+        if self._segyfile is None:
+            # geometry is known already; skip the geometry scan of segyio
+            self._segyfile = segyio.open(self._sfile, "r", ignore_geometry=True)
+            self._segyfile.mmap()
+        return self._segyfile
+
+    def read(self, icols, jrows, klays):
+        """Read a block of values, given as (start, stop) index ranges.
+
+        Only the traces in the block are read, one trace range per column.
+        """
+
+        (icol1, icol2), (jrow1, jrow2), (klay1, klay2) = icols, jrows, klays
+
+        _ncol, nrow, nlay = self.shape
+        ntrace = jrow2 - jrow1
+
+        out = np.empty((icol2 - icol1, ntrace, klay2 - klay1), dtype=self.dtype)
+        if out.size == 0:
+            return out
+
+        logger.debug("Read block %s %s %s from %s", icols, jrows, klays, self._sfile)
+        with self._lock:
+            segyfile = self._open()
+            for icol in range(icol1, icol2):
+                first = icol * nrow + jrow1
+                traces = segyfile.trace.raw[first : first + ntrace]
+                traces = np.asarray(traces).reshape(ntrace, nlay)
+                out[icol - icol1] = traces[:, klay1:klay2]
+
+        return out
+
+    def traceidcodes(self, icols=None, jrows=None):
+        """Read the trace identification codes (ncol, nrow), or a block of them."""
+
+        ncol, nrow, _nlay = self.shape
+        icol1, icol2 = icols if icols is not None else (0, ncol)
+        jrow1, jrow2 = jrows if jrows is not None else (0, nrow)
+
+        field = segyio.TraceField.TraceIdentificationCode
+        codes = np.empty((icol2 - icol1, jrow2 - jrow1), dtype=np.int32)
+        with self._lock:
+            segyfile = self._open()
+            for icol in range(icol1, icol2):
+                first = icol * nrow
+                codes[icol - icol1] = segyfile.attributes(field)[
+                    first + jrow1 : first + jrow2
+                ]
+        return codes
+
+    def __getitem__(self, key):
+
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        if any(item is Ellipsis for item in key):
+            pos = [item is Ellipsis for item in key].index(True)
+            fill = (slice(None),) * (3 - len(key) + 1)
+            key = key[:pos] + fill + key[pos + 1 :]
+
+        basic = (int, np.integer, slice)
+        if len(key) > 3 or not all(isinstance(item, basic) for item in key):
+            logger.warning("Advanced indexing of lazy cube values reads all values")
+            return np.asarray(self)[key]
+
+        key = key + (slice(None),) * (3 - len(key))
+
+        ranges = []
+        local = []
+        for item, num in zip(key, self.shape):
+            if isinstance(item, slice):
+                idx = range(*item.indices(num))
+                if not idx:
+                    ranges.append((0, 0))
+                    local.append(slice(None))
+                    continue
+                low, high = min(idx), max(idx) + 1
+                stop = idx.stop - low
+                if stop < 0:
+                    stop = None
+                local.append(slice(idx.start - low, stop, idx.step))
+            else:
+                pos = operator.index(item)
+                if pos < 0:
+                    pos += num
+                if not 0 <= pos < num:
+                    raise IndexError(
+                        "Index {} is out of bounds for size {}".format(item, num)
+                    )
+                low, high = pos, pos + 1
+                local.append(0)
+            ranges.append((low, high))
+
+        return self.read(*ranges)[tuple(local)]
+
+    def __array__(self, dtype=None, copy=None):
+        logger.info("Read all values (%s bytes) from %s", self.nbytes, self._sfile)
+        values = self[:, :, :]
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return values
+
+    def copy(self):
+        """Return all values as a numpy array."""
+        return np.asarray(self)
+
+    def reshape(self, *args, **kwargs):
+        """As numpy reshape; all values are read."""
+        return np.asarray(self).reshape(*args, **kwargs)
+
+    def _blocks(self):
+        """Yield all values, as blocks of columns within CHUNKBYTES."""
+        ncol, nrow, nlay = self.shape
+        ncolblock = max(1, CHUNKBYTES // max(1, nrow * nlay * self.dtype.itemsize))
+        for icol in range(0, ncol, ncolblock):
+            yield self.read((icol, min(icol + ncolblock, ncol)), (0, nrow), (0, nlay))
+
+    def min(self):
+        """Minimum value, computed block by block."""
+        return min(block.min() for block in self._blocks() if block.size)
+
+    def max(self):
+        """Maximum value, computed block by block."""
+        return max(block.max() for block in self._blocks() if block.size)
+
+    def mean(self):
+        """Mean value, computed block by block."""
+        return self._moments()[1]
+
+    def std(self):
+        """Standard deviation (ddof=0), computed block by block."""
+        return math.sqrt(self._moments()[2])
+
+    def _moments(self):
+        """Return count, mean and variance; blocks are combined as Chan et al."""
+
+        count, mean, msq = 0, 0.0, 0.0
+        for block in self._blocks():
+            if not block.size:
+                continue
+            bcount = block.size
+            bmean = block.mean(dtype=np.float64)
+            bmsq = ((block - bmean) ** 2).sum(dtype=np.float64)
+
+            delta = bmean - mean
+            total = count + bcount
+            mean += delta * bcount / total
+            msq += bmsq + delta ** 2 * count * bcount / total
+            count = total
+
+        if count == 0:
+            return 0, np.nan, np.nan
+        return count, mean, msq / count
+
+
+def cube_region(cube, xcoords, ycoords, zmin, zmax, margin=MARGIN):
+    """Return a Cube with the values needed around some XY points and a Z range.
+
+    For a cube with values in memory, the cube itself is returned. For a lazy
+    cube, a new in memory Cube is made from the block of nodes covering the
+    points and Z range (plus margin nodes), so that C routines working on the
+    full array can be applied without reading all values.
+    """
+
+    if cube.isloaded:
+        return cube
+
+    ncol, nrow, nlay = cube.ncol, cube.nrow, cube.nlay
+
+    icoords, jcoords = _ij_from_xy(cube, np.asarray(xcoords), np.asarray(ycoords))
+    icols = _index_range(icoords, margin, ncol)
+    jrows = _index_range(jcoords, margin, nrow)
+
+    kcoords = (np.array([zmin, zmax], dtype=np.float64) - cube.zori) / cube.zinc
+    klays = _index_range(kcoords, margin, nlay)
+
+    logger.info("Read region %s %s %s of lazy cube", icols, jrows, klays)
+
+    xori, yori = _xy_from_ij(cube, icols[0], jrows[0])
+
+    region = xtgeo.Cube(
+        ncol=icols[1] - icols[0],
+        nrow=jrows[1] - jrows[0],
+        nlay=klays[1] - klays[0],
+        xinc=cube.xinc,
+        yinc=cube.yinc,
+        zinc=cube.zinc,
+        xori=xori,
+        yori=yori,
+        zori=cube.zori + klays[0] * cube.zinc,
+        yflip=cube.yflip,
+        rotation=cube.rotation,
+        segyfile=cube.segyfile,
+        values=cube._values.read(icols, jrows, klays),
+    )
+    region.ilines = cube.ilines[icols[0] : icols[1]].copy()
+    region.xlines = cube.xlines[jrows[0] : jrows[1]].copy()
+
+    if cube._traceidcodes is not None:
+        codes = cube._traceidcodes[icols[0] : icols[1], jrows[0] : jrows[1]].copy()
+    else:
+        codes = cube._values.traceidcodes(icols, jrows)
+    region.traceidcodes = codes
+
+    return region
+
+
+def xy_corners(ncol, nrow, xori, yori, xinc, yinc, rotation, yflip):
+    """Return X and Y arrays of the 4 corner nodes of a rotated regular grid."""
+
+    icols = np.array([0, ncol - 1, 0, ncol - 1], dtype=np.float64)
+    jrows = np.array([0, 0, nrow - 1, nrow - 1], dtype=np.float64)
+
+    return _rotate(icols * xinc, jrows * yinc * yflip, xori, yori, rotation)
+
+
+def _rotate(xdist, ydist, xori, yori, rotation):
+    angle = math.radians(rotation)
+    xcoords = xori + xdist * math.cos(angle) - ydist * math.sin(angle)
+    ycoords = yori + xdist * math.sin(angle) + ydist * math.cos(angle)
+    return xcoords, ycoords
+
+
+def _xy_from_ij(cube, icol, jrow):
+    """X Y of cube node (icol, jrow), zero based."""
+    xcoord, ycoord = _rotate(
+        np.float64(icol) * cube.xinc,
+        np.float64(jrow) * cube.yinc * cube.yflip,
+        cube.xori,
+        cube.yori,
+        cube.rotation,
+    )
+    return float(xcoord), float(ycoord)
+
+
+def _ij_from_xy(cube, xcoords, ycoords):
+    """Zero based, fractional cube I J of XY points (as cube_xy_from_ij inverse)."""
+
+    angle = math.radians(cube.rotation)
+    xdist = xcoords - cube.xori
+    ydist = ycoords - cube.yori
+
+    icoords = (xdist * math.cos(angle) + ydist * math.sin(angle)) / cube.xinc
+    jcoords = (-xdist * math.sin(angle) + ydist * math.cos(angle)) / cube.yinc
+    return icoords, jcoords * cube.yflip
+
+
+def _index_range(coords, margin, num):
+    """Index range (start, stop) covering fractional coords, with margin."""
+
+    coords = coords[np.isfinite(coords)]
+    if coords.size == 0:
+        return (0, num)
+
+    start = int(math.floor(coords.min())) - margin
+    stop = int(math.ceil(coords.max())) + margin + 1
+
+    start = min(max(start, 0), num - 1)
+    stop = max(min(stop, num), start + 1)
+    return (start, stop)
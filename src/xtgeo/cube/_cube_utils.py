@@ -7,6 +7,7 @@ import numpy as np
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 
@@ -20,6 +21,8 @@ logger = xtg.functionlogger(__name__)
 def swapaxes(self):
     """Swap the axes inline vs xline, keep origin."""
 
+    self.load_values()
+
     ncol = _cxtgeo.new_intpointer()
     nrow = _cxtgeo.new_intpointer()
     yflip = _cxtgeo.new_intpointer()
@@ -75,11 +78,10 @@ def thinning(self, icol, jrow, klay):
                 "existing ranges <{}>".format(inputs, ranges)
             )
 
-    # just simple numpy operations, and changing some cube props
-
-    val = self.values.copy()
+    # just simple numpy operations, and changing some cube props; slicing
+    # first, so that only the kept values are copied (or read, if lazy)
 
-    val = val[::icol, ::jrow, ::klay]
+    val = self.values[::icol, ::jrow, ::klay].copy()
     self._ncol = val.shape[0]
     self._nrow = val.shape[1]
     self._nlay = val.shape[2]
@@ -88,7 +90,7 @@ def thinning(self, icol, jrow, klay):
     self._zinc *= klay
     self._ilines = self._ilines[::icol]
     self._xlines = self._xlines[::jrow]
-    self._traceidcodes = self._traceidcodes[::icol, ::jrow]
+    self._traceidcodes = self.traceidcodes[::icol, ::jrow]
 
     self.values = val
 
@@ -100,14 +102,14 @@ def cropping(self, icols, jrows, klays):
     jrow1, jrow2 = jrows
     klay1, klay2 = klays
 
-    val = self.values.copy()
     ncol = self.ncol
     nrow = self.nrow
     nlay = self.nlay
 
-    val = val[
+    # slice first, so that only the kept values are copied (or read, if lazy)
+    val = self.values[
         0 + icol1 : ncol - icol2, 0 + jrow1 : nrow - jrow2, 0 + klay1 : nlay - klay2
-    ]
+    ].copy()
 
     self._ncol = val.shape[0]
     self._nrow = val.shape[1]
@@ -149,6 +151,22 @@ def resample(self, other, sampling="nearest", outside_value=None):
     """Resample another cube to the current self"""
     # TODO: traceidcodes
 
+    self.load_values()
+
+    # if other is lazy, read only the part covering self
+    xcorners, ycorners = _cube_lazy.xy_corners(
+        self.ncol,
+        self.nrow,
+        self.xori,
+        self.yori,
+        self.xinc,
+        self.yinc,
+        self.rotation,
+        self.yflip,
+    )
+    zmax = self.zori + (self.nlay - 1) * self.zinc
+    other = _cube_lazy.cube_region(other, xcorners, ycorners, self.zori, zmax)
+
     values1a = self.values.reshape(-1)
     values2a = other.values.reshape(-1)
 
@@ -286,6 +304,9 @@ def get_randomline(
 
     nzsam = int((zmax - zmin) / zincrement) + 1
 
+    # if lazy, read only the part of the cube along the fence
+    cube = _cube_lazy.cube_region(self, xcoords, ycoords, zmin, zmax)
+
     nsamples = xcoords.shape[0] * nzsam
 
     option = 0
@@ -298,18 +319,18 @@ def get_randomline(
         zmin,
         zmax,
         nzsam,
-        self._xori,
-        self._xinc,
-        self._yori,
-        self._yinc,
-        self._zori,
-        self._zinc,
-        self._rotation,
-        self._yflip,
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._values.reshape(-1),
+        cube._xori,
+        cube._xinc,
+        cube._yori,
+        cube._yinc,
+        cube._zori,
+        cube._zinc,
+        cube._rotation,
+        cube._yflip,
+        cube._ncol,
+        cube._nrow,
+        cube._nlay,
+        cube._values.reshape(-1),
         nsamples,
         option,
     )
@@ -14,6 +14,7 @@ from xtgeo.common import XTGDescription
 import xtgeo.common.sys as xtgeosys
 
 from xtgeo.cube import _cube_import
+from xtgeo.cube import _cube_lazy
 from xtgeo.cube import _cube_export
 from xtgeo.cube import _cube_utils
 from xtgeo.cube import _cube_roxapi
@@ -27,22 +28,25 @@ logger = xtg.functionlogger(__name__)
 # METHODS as wrappers to class init + import
 
 
-def cube_from_file(mfile, fformat="guess"):
+def cube_from_file(mfile, fformat="guess", lazy=False):
     """This makes an instance of a Cube directly from file import.
 
     Args:
         mfile (str): Name of file
         fformat (str): See :meth:`Cube.from_file`
+        lazy (bool): See :meth:`Cube.from_file`
 
     Example::
 
         import xtgeo
         mycube = xtgeo.cube_from_file('some_cube.segy')
+
+    .. versionchanged:: 2.8.0 Added lazy key
     """
 
     obj = Cube()
 
-    obj.from_file(mfile, fformat=fformat)
+    obj.from_file(mfile, fformat=fformat, lazy=lazy)
 
     return obj
 
@@ -278,6 +282,8 @@ class Cube(object):  # pylint: disable=too-many-public-methods
     @property
     def traceidcodes(self):
         """The trace identifaction codes array (ncol, nrow)."""
+        if self._traceidcodes is None and not self.isloaded:
+            self._traceidcodes = self._values.traceidcodes()
         return self._traceidcodes
 
     @traceidcodes.setter
@@ -310,9 +316,41 @@ class Cube(object):  # pylint: disable=too-many-public-methods
 
     @property
     def values(self):
-        """The values, as a 3D numpy (ncol, nrow, nlay), 4 byte float."""
+        """The values, as a 3D numpy (ncol, nrow, nlay), 4 byte float.
+
+        For a cube imported with ``lazy=True`` this is a read only, numpy like
+        view of the SEG-Y file, where e.g. ``values[10]`` (an inline) or
+        ``values[:, :, 100]`` (a time slice) reads only the traces needed.
+        Use :meth:`load_values` to get all values in memory.
+        """
         return self._values
 
+    @property
+    def isloaded(self):
+        """Returns True if all values are in memory (False if lazy) (read only).
+
+        .. versionadded:: 2.8.0
+        """
+        return not isinstance(self._values, _cube_lazy.SegyValues)
+
+    def load_values(self):
+        """Read all values into memory, if the cube is lazy (imported as lazy).
+
+        Methods that modify values (e.g. :meth:`values_dead_traces`) or
+        export them, will call this first.
+
+        .. versionadded:: 2.8.0
+        """
+        if self.isloaded:
+            return
+
+        logger.info("Load all values of lazy cube from %s", self._segyfile)
+        lazyvalues = self._values
+        if self._traceidcodes is None:
+            self._traceidcodes = lazyvalues.traceidcodes()
+        self._values = np.ascontiguousarray(lazyvalues, dtype=np.float32)
+        lazyvalues.close()
+
     @values.setter
     def values(self, values):
 
@@ -347,7 +385,10 @@ class Cube(object):  # pylint: disable=too-many-public-methods
         dsc.txt("Inlines vector", self._ilines)
         dsc.txt("Xlines vector", self._xlines)
         dsc.txt("Time or depth slices vector", self.zslices)
-        dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
+        if self.isloaded:
+            dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
+        else:
+            dsc.txt("Values", self._values, self._values.dtype)
         np.set_printoptions(threshold=1000)
         dsc.txt(
             "Values, mean, stdev, minimum, maximum",
@@ -356,7 +397,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             self.values.min(),
             self.values.max(),
         )
-        dsc.txt("Trace ID codes", self._traceidcodes.reshape(-1))
+        dsc.txt("Trace ID codes", self.traceidcodes.reshape(-1))
         msize = float(self.values.size * 4) / (1024 * 1024 * 1024)
         dsc.txt("Minimum memory usage of array (GB)", msize)
 
@@ -389,14 +430,17 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             yflip=self.yflip,
             segyfile=self.segyfile,
             rotation=self.rotation,
-            values=self.values.copy(),
+            values=self.values.copy() if self.isloaded else self._values,
         )
 
         xcube.filesrc = self._filesrc
 
         xcube.ilines = self._ilines.copy()
         xcube.xlines = self._xlines.copy()
-        xcube.traceidcodes = self._traceidcodes.copy()
+        if self._traceidcodes is not None:
+            xcube.traceidcodes = self._traceidcodes.copy()
+        else:
+            xcube._traceidcodes = None
 
         return xcube
 
@@ -524,6 +568,8 @@ class Cube(object):  # pylint: disable=too-many-public-methods
                 be returned. If no dead traces, then None will be returned.
         """
 
+        self.load_values()
+
         try:
             logger.info(self._values.shape)
             logger.info(self._traceidcodes.shape)
@@ -639,7 +685,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
     # Import and export
     # =========================================================================
 
-    def from_file(self, sfile, fformat="guess", engine="segyio"):
+    def from_file(self, sfile, fformat="guess", engine="segyio", lazy=False):
         """Import cube data from file.
 
         If fformat is not provided, the file type will be guessed based
@@ -653,6 +699,10 @@ class Cube(object):  # pylint: disable=too-many-public-methods
                 while 'segyio' uses the SEGYIO library (default)
             deadtraces (float): Set 'dead' trace values to this value (SEGY
                 only). Default is UNDEF value (a very large number)
+            lazy (bool): If True (SEGY with 'segyio' engine only), the values
+                are not read at import, but on demand from the (memory mapped)
+                file, see :attr:`values`. Slicing by surfaces, random lines
+                and resampling then read only the part of the cube needed.
 
         Raises:
             IOError if the file cannot be read (e.g. not found)
@@ -662,7 +712,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
             >>> zz = Cube()
             >>> zz.from_file('some.segy')
 
-
+        .. versionchanged:: 2.8.0 Added lazy key
         """
         fobj = xtgeosys._XTGeoCFile(sfile)
         fobj.check_file(raiseerror=IOError)
@@ -679,7 +729,7 @@ class Cube(object):  # pylint: disable=too-many-public-methods
         if "rms" in fformat:
             _cube_import.import_rmsregular(self, fobj.name)
         elif fformat == "segy" or fformat == "sgy":
-            _cube_import.import_segy(self, fobj.name, engine=engine)
+            _cube_import.import_segy(self, fobj.name, engine=engine, lazy=lazy)
         elif fformat == "storm":
             _cube_import.import_stormcube(self, fobj.name)
         else:
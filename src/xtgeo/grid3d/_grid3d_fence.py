@@ -8,7 +8,7 @@ import numpy as np
 
 import xtgeo
 from xtgeo.grid3d import _gridprop_lowlevel as gl
-from xtgeo.surface import _regsurf_lowlevel as rl
+from xtgeo.grid3d import _grid_cellindex
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -32,7 +32,7 @@ def get_randomline(
 
     logger.info("Enter get_randomline from Grid...")
 
-    _update_tmpvars(self)
+    index = _grid_cellindex.get_cellindex(self)
 
     if hincrement is None and isinstance(fencespec, xtgeo.Polygons):
         logger.info("Estimate hincrement from Polygons instance...")
@@ -48,43 +48,49 @@ def get_randomline(
     hcoords = fencespec[:, 3]
 
     if zmin is None:
-        zmin = self._tmp["topd"].values.min()
+        zmin = index.zrange[0]
     if zmax is None:
-        zmax = self._tmp["basd"].values.max()
+        zmax = index.zrange[1]
 
     nzsam = int((zmax - zmin) / float(zincrement)) + 1
     nsamples = xcoords.shape[0] * nzsam
 
     logger.info("Running C routine to get randomline...")
-    _ier, values = _cxtgeo.grd3d_get_randomline(
-        xcoords,
-        ycoords,
-        zmin,
-        zmax,
-        nzsam,
-        self._tmp["topd"].ncol,
-        self._tmp["topd"].nrow,
-        self._tmp["topd"].xori,
-        self._tmp["topd"].yori,
-        self._tmp["topd"].xinc,
-        self._tmp["topd"].yinc,
-        self._tmp["topd"].rotation,
-        self._tmp["topd"].yflip,
-        self._tmp["topi_carr"],
-        self._tmp["topj_carr"],
-        self._tmp["basi_carr"],
-        self._tmp["basj_carr"],
-        self.ncol,
-        self.nrow,
-        self.nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-        gl.update_carray(prop),
-        self._tmp["onegrid"]._zcornsv,
-        self._tmp["onegrid"]._actnumsv,
-        nsamples,
-    )
+    spec = index.mapspec
+    carrs = _grid_cellindex._map_carrays(index.maps)
+    try:
+        _ier, values = _cxtgeo.grd3d_get_randomline(
+            xcoords,
+            ycoords,
+            zmin,
+            zmax,
+            nzsam,
+            spec["ncol"],
+            spec["nrow"],
+            spec["xori"],
+            spec["yori"],
+            spec["xinc"],
+            spec["yinc"],
+            spec["rotation"],
+            spec["yflip"],
+            carrs[0],
+            carrs[1],
+            carrs[2],
+            carrs[3],
+            self.ncol,
+            self.nrow,
+            self.nlay,
+            self._coordsv,
+            self._zcornsv,
+            self._actnumsv,
+            gl.get_buffer(prop, discrete=False),
+            index.onezcornsv,
+            index.oneactnumsv,
+            nsamples,
+        )
+    finally:
+        for carr in carrs:
+            _cxtgeo.delete_doublearray(carr)
 
     logger.info("Running C routine to get randomline... DONE")
 
@@ -95,44 +101,6 @@ def get_randomline(
     return (hcoords[0], hcoords[-1], zmin, zmax, arr)
 
 
-def _update_tmpvars(self, force=False):
-    """The self._tmp variables are needed to speed up calculations.
-
-    If they are already created, the no need to recreate
-    """
-
-    if "onegrid" not in self._tmp or force:
-        logger.info("Make a tmp onegrid instance...")
-        self._tmp["onegrid"] = self.copy()
-        self._tmp["onegrid"].reduce_to_one_layer()
-        one = self._tmp["onegrid"]
-        logger.info("Make a tmp onegrid instance... DONE")
-        logger.info("Make a set of tmp surfaces for I J locations + depth...")
-        self._tmp["topd"] = xtgeo.RegularSurface()
-        self._tmp["topi"], self._tmp["topj"] = self._tmp["topd"].from_grid3d(
-            one, where="top", rfactor=4
-        )
-
-        self._tmp["basd"] = xtgeo.RegularSurface()
-        self._tmp["basi"], self._tmp["basj"] = self._tmp["basd"].from_grid3d(
-            one, where="base", rfactor=4
-        )
-
-        self._tmp["topi"].fill()
-        self._tmp["topj"].fill()
-        self._tmp["basi"].fill()
-        self._tmp["basj"].fill()
-
-        self._tmp["topi_carr"] = rl.get_carr_double(self._tmp["topi"])
-        self._tmp["topj_carr"] = rl.get_carr_double(self._tmp["topj"])
-        self._tmp["basi_carr"] = rl.get_carr_double(self._tmp["basi"])
-        self._tmp["basj_carr"] = rl.get_carr_double(self._tmp["basj"])
-
-        logger.info("Make a set of tmp surfaces for I J locations + depth... DONE")
-    else:
-        logger.info("Re-use existing onegrid and tmp surfaces for I J")
-
-
 def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
     """Compute a resampled fence from a Polygons instance"""
 
@@ -4,6 +4,11 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
+import json
+import hashlib
+
+import numpy as np
 import pandas as pd
 
 import xtgeo
@@ -12,6 +17,13 @@ import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 xtg = xtgeo.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
+# Scans of Eclipse binary files can be stored in a sidecar file (opt-in), by
+# setting the environment variable XTG_ECLSCAN_CACHE to 1 (sidecar next to the
+# file, e.g. CASE.UNRST.xtgidx) or to a folder name (sidecars in that folder).
+SCANCACHE_ENV = "XTG_ECLSCAN_CACHE"
+SCANCACHE_SUFFIX = ".xtgidx"
+SCANCACHE_VERSION = 1
+
 
 def scan_keywords(pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=False):
     """Quick scan of keywords in Eclipse binary restart/init/... file,
@@ -21,22 +33,22 @@ def scan_keywords(pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=
     """
 
     local_fhandle = False
-    fhandle = pfile
     if isinstance(pfile, str):
         pfile = xtgeo._XTGeoCFile(pfile)
         local_fhandle = True
-        fhandle = pfile.fhandle
 
     if fformat == "xecl":
         if dates:
             data = _scan_ecl_keywords_w_dates(
-                fhandle, maxkeys=maxkeys, dataframe=dataframe
+                pfile, maxkeys=maxkeys, dataframe=dataframe
             )
         else:
-            data = _scan_ecl_keywords(fhandle, maxkeys=maxkeys, dataframe=dataframe)
+            data = _scan_ecl_keywords(pfile, maxkeys=maxkeys, dataframe=dataframe)
 
     else:
-        data = _scan_roff_keywords(fhandle, maxkeys=maxkeys, dataframe=dataframe)
+        data = _scan_roff_keywords(
+            _fhandle(pfile), maxkeys=maxkeys, dataframe=dataframe
+        )
 
     if local_fhandle:
         pfile.close(cond=local_fhandle)
@@ -50,23 +62,48 @@ def scan_dates(pfile, maxdates=1000, dataframe=False):
     Cf. grid_properties.py description
     """
 
-    seq = _cxtgeo.new_intarray(maxdates)
-    day = _cxtgeo.new_intarray(maxdates)
-    mon = _cxtgeo.new_intarray(maxdates)
-    yer = _cxtgeo.new_intarray(maxdates)
-
     local_fhandle = False
-    fhandle = pfile
     if isinstance(pfile, str):
         pfile = xtgeo._XTGeoCFile(pfile)
-        fhandle = pfile.fhandle
         local_fhandle = True
 
-    nstat = _cxtgeo.grd3d_ecl_tsteps(fhandle, seq, day, mon, yer, maxdates)
+    cache = _EclScanCache.from_source(pfile)
+    cachekey = "dates_{}".format(maxdates)
+    zdates = cache.get(cachekey) if cache else None
+
+    if zdates is None:
+        zdates = _scan_ecl_dates(_fhandle(pfile), maxdates=maxdates)
+        if cache:
+            cache.put(cachekey, zdates)
 
     if local_fhandle:
         pfile.close(cond=local_fhandle)
 
+    if dataframe:
+        cols = ["SEQNUM", "DATE"]
+        df = pd.DataFrame.from_records(zdates, columns=cols)
+        return df
+
+    return zdates
+
+
+def _fhandle(pfile):
+    """Return the SWIG file handle, where pfile is a _XTGeoCFile or a file handle"""
+
+    if isinstance(pfile, xtgeo._XTGeoCFile):
+        return pfile.fhandle
+    return pfile
+
+
+def _scan_ecl_dates(fhandle, maxdates=1000):
+
+    seq = _cxtgeo.new_intarray(maxdates)
+    day = _cxtgeo.new_intarray(maxdates)
+    mon = _cxtgeo.new_intarray(maxdates)
+    yer = _cxtgeo.new_intarray(maxdates)
+
+    nstat = _cxtgeo.grd3d_ecl_tsteps(fhandle, seq, day, mon, yer, maxdates)
+
     sq = []
     da = []
     for i in range(nstat):
@@ -80,20 +117,32 @@ def scan_dates(pfile, maxdates=1000, dataframe=False):
     for item in [seq, day, mon, yer]:
         _cxtgeo.delete_intarray(item)
 
-    zdates = list(zip(sq, da))  # list for PY3
+    return list(zip(sq, da))  # list for PY3
+
+
+def _scan_ecl_keywords(pfile, maxkeys=100000, dataframe=False):
+
+    # pfile is a _XTGeoCFile instance or a swig pointer to a file handle; the file
+    # must not be closed here
+
+    cache = _EclScanCache.from_source(pfile)
+    cachekey = "keywords_{}".format(maxkeys)
+    result = cache.get(cachekey) if cache else None
+
+    if result is None:
+        result = _scan_ecl_keywords_c(_fhandle(pfile), maxkeys=maxkeys)
+        if cache and result:
+            cache.put(cachekey, result)
 
     if dataframe:
-        cols = ["SEQNUM", "DATE"]
-        df = pd.DataFrame.from_records(zdates, columns=cols)
+        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART"]
+        df = pd.DataFrame.from_records(result, columns=cols)
         return df
 
-    return zdates
-
+    return result
 
-def _scan_ecl_keywords(fhandle, maxkeys=100000, dataframe=False):
 
-    # In case fhandle is not a file name but a swig pointer to a file handle,
-    # the file must not be closed
+def _scan_ecl_keywords_c(fhandle, maxkeys=100000):
 
     ultramax = int(1000000 / 9)  # cf *swig_bnd_char_1m in cxtgeo.i
     if maxkeys > ultramax:
@@ -133,44 +182,302 @@ def _scan_ecl_keywords(fhandle, maxkeys=100000, dataframe=False):
     _cxtgeo.delete_longarray(reclens)
     _cxtgeo.delete_longarray(recstarts)
 
-    result = list(zip(keywords, rc, rl, rs))
+    return list(zip(keywords, rc, rl, rs))
 
-    if dataframe:
-        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART"]
-        df = pd.DataFrame.from_records(result, columns=cols)
-        return df
 
-    return result
+def scan_ecl_catalog(pfile, maxkeys=100000):
+    """Scan an Eclipse binary file once, and return an EclKeywordCatalog.
+
+    The catalog is the preferred structure for import routines that need to
+    look up several keywords (and dates), as lookups are constant time.
+    """
+
+    local_fhandle = False
+    if isinstance(pfile, str):
+        pfile = xtgeo._XTGeoCFile(pfile)
+        local_fhandle = True
 
+    catalog = _scan_ecl_keywords_w_dates(pfile, maxkeys=maxkeys, catalog=True)
 
-def _scan_ecl_keywords_w_dates(fhandle, maxkeys=100000, dataframe=False):
+    if local_fhandle:
+        pfile.close(cond=local_fhandle)
+
+    return catalog
+
+
+def _scan_ecl_keywords_w_dates(pfile, maxkeys=100000, dataframe=False, catalog=False):
 
-    """Add a date column to the keyword"""
+    """Add a date column to the keyword; optionally return a keyword catalog"""
 
     logger.info("Scan keywords with dates...")
-    xkeys = _scan_ecl_keywords(fhandle, maxkeys=maxkeys, dataframe=False)
+    xkeys = _scan_ecl_keywords(pfile, maxkeys=maxkeys, dataframe=False)
 
-    xdates = scan_dates(fhandle, maxdates=maxkeys, dataframe=False)
+    xdates = scan_dates(pfile, maxdates=maxkeys, dataframe=False)
 
-    result = []
-    # now merge these two:
-    nv = -1
-    date = 0
-    for item in xkeys:
-        name, dtype, reclen, bytepos = item
-        if name == "SEQNUM":
-            nv += 1
-            date = xdates[nv][1]
+    result = EclKeywordCatalog(xkeys, xdates)
 
-        entry = (name, dtype, reclen, bytepos, date)
-        result.append(entry)
+    if catalog:
+        return result
 
     if dataframe:
-        cols = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART", "DATE"]
-        df = pd.DataFrame.from_records(result, columns=cols)
-        return df
+        return result.dataframe()
 
-    return result
+    return result.records
+
+
+class EclKeywordCatalog(object):
+    """Index of records in an Eclipse binary file (INIT, UNRST, ...).
+
+    The catalog is made once from a keyword scan, and gives constant time
+    lookup of records on (keyword, date, occurrence), where occurrence is the
+    running number of a keyword within the same date (usually 0). Dates are
+    on YYYYMMDD form; records prior to the first SEQNUM (and all records in
+    e.g. INIT files) have date 0.
+
+    Args:
+        keywords: List of tuples (keyword, type, nitems, bytestart) as
+            returned from the keyword scan.
+        dates: List of tuples (seqnum, date) as returned from scan_dates.
+    """
+
+    COLUMNS = ["KEYWORD", "TYPE", "NITEMS", "BYTESTART", "DATE"]
+
+    def __init__(self, keywords, dates=None):
+
+        dates = dates if dates else []
+
+        nrec = len(keywords)
+        self._keywords = []
+        self._types = []
+        self._nitems = np.zeros(nrec, dtype=np.int64)
+        self._bytestart = np.zeros(nrec, dtype=np.int64)
+        self._dates = np.zeros(nrec, dtype=np.int64)
+        self._seqnums = [item[0] for item in dates]
+        self._reportdates = [item[1] for item in dates]
+        self._reportdateset = {str(item[1]) for item in dates}
+
+        self._index = {}  # (keyword, str(date), occurrence) -> record number
+        self._first = {}  # keyword -> first record number, any date
+        counts = {}  # (keyword, str(date)) -> occurrences so far
+
+        nv = -1
+        date = 0
+        for irec, (name, dtype, reclen, bytepos) in enumerate(keywords):
+            if name == "SEQNUM":
+                nv += 1
+                date = self._reportdates[nv]
+
+            self._keywords.append(name)
+            self._types.append(dtype)
+            self._nitems[irec] = reclen
+            self._bytestart[irec] = bytepos
+            self._dates[irec] = date
+
+            key = (name, str(date))
+            occurrence = counts.get(key, 0)
+            counts[key] = occurrence + 1
+            self._index[key + (occurrence,)] = irec
+            self._first.setdefault(name, irec)
+
+    def __len__(self):
+        return len(self._keywords)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    @property
+    def records(self):
+        """List of tuples (keyword, type, nitems, bytestart, date), file order"""
+        return list(
+            zip(
+                self._keywords,
+                self._types,
+                self._nitems.tolist(),
+                self._bytestart.tolist(),
+                self._dates.tolist(),
+            )
+        )
+
+    @property
+    def keywords(self):
+        """Unique keywords, in order of first appearance in file"""
+        return list(self._first.keys())
+
+    @property
+    def dates(self):
+        """Report dates (YYYYMMDD) as found from SEQNUM/INTEHEAD, in file order"""
+        return list(self._reportdates)
+
+    @property
+    def seqnums(self):
+        """Report step numbers (SEQNUM) matching the dates property"""
+        return list(self._seqnums)
+
+    @property
+    def nitems(self):
+        """Numpy array with number of items per record (read only view)"""
+        view = self._nitems.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def bytestart(self):
+        """Numpy array with byte start of each record header (read only view)"""
+        view = self._bytestart.view()
+        view.flags.writeable = False
+        return view
+
+    def has_keyword(self, keyword):
+        """Return True if keyword is present for any date"""
+        return keyword in self._first
+
+    def has_date(self, date):
+        """Return True if date is a report date in the file"""
+        return str(date) in self._reportdateset
+
+    def has(self, keyword, date=0):
+        """Return True if keyword is present at the given date"""
+        return (keyword, str(date), 0) in self._index
+
+    def get(self, keyword, date=0, occurrence=0):
+        """Return (keyword, type, nitems, bytestart, date) for a record.
+
+        None is returned if the combination is not present.
+        """
+        irec = self._index.get((keyword, str(date), occurrence))
+        if irec is None:
+            return None
+        return self._record(irec)
+
+    def get_first(self, keyword):
+        """Return the first record for keyword regardless of date, or None"""
+        irec = self._first.get(keyword)
+        if irec is None:
+            return None
+        return self._record(irec)
+
+    def dataframe(self):
+        """Return the catalog as a Pandas dataframe (legacy scan layout)"""
+        return pd.DataFrame.from_records(self.records, columns=self.COLUMNS)
+
+    def _record(self, irec):
+        return (
+            self._keywords[irec],
+            self._types[irec],
+            int(self._nitems[irec]),
+            int(self._bytestart[irec]),
+            int(self._dates[irec]),
+        )
+
+
+class _EclScanCache(object):
+    """Sidecar file holding keyword and date scans for an Eclipse binary file.
+
+    The sidecar is a JSON file named as the source file plus SCANCACHE_SUFFIX,
+    either next to the source file or in a cache folder, see SCANCACHE_ENV. It
+    is valid as long as path, size and modification time of the source file are
+    unchanged; otherwise it is silently rebuilt. Failing to write the sidecar
+    (e.g. in a read-only folder) is not an error.
+    """
+
+    def __init__(self, fname, folder=None):
+        self._fname = fname
+        self._idxname = fname + SCANCACHE_SUFFIX
+        if folder:
+            # unique name in cache folder, from the full path of the source
+            fullname = os.path.abspath(fname).encode("utf-8")
+            self._idxname = os.path.join(
+                folder,
+                "{}_{}{}".format(
+                    os.path.basename(fname),
+                    hashlib.sha1(fullname).hexdigest()[:16],
+                    SCANCACHE_SUFFIX,
+                ),
+            )
+        self._signature = self._file_signature(fname)
+        self._data = self._load()
+
+    @classmethod
+    def from_source(cls, pfile):
+        """Return a cache instance for a _XTGeoCFile, or None if not applicable"""
+
+        setting = os.environ.get(SCANCACHE_ENV, "0")
+        if setting in ("", "0"):
+            return None
+
+        folder = None
+        if setting != "1":
+            folder = os.path.expanduser(setting)
+            if not os.path.isdir(folder):
+                logger.warning("No such scan cache folder: %s", folder)
+                return None
+
+        if not isinstance(pfile, xtgeo._XTGeoCFile) or pfile.memstream:
+            return None
+
+        fname = pfile.name
+        if not os.path.isfile(fname):
+            return None
+
+        return cls(fname, folder=folder)
+
+    @staticmethod
+    def _file_signature(fname):
+        fstat = os.stat(fname)
+        mtime = getattr(fstat, "st_mtime_ns", None)  # python 3 only
+        if mtime is None:
+            mtime = int(fstat.st_mtime * 1.0e9)
+        return {
+            "file": os.path.abspath(fname),
+            "size": fstat.st_size,
+            "mtime": mtime,
+        }
+
+    def _load(self):
+        try:
+            with open(self._idxname, "r") as stream:
+                data = json.load(stream)
+        except (OSError, IOError, ValueError):
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SCANCACHE_VERSION
+            or data.get("signature") != self._signature
+        ):
+            logger.info("Scan cache %s is outdated, will rebuild", self._idxname)
+            return {}
+
+        logger.info("Using scan cache %s", self._idxname)
+        return data
+
+    def get(self, key):
+        """Return cached list of tuples for key (e.g. 'keywords_100'), or None"""
+
+        entries = self._data.get(key)
+        if entries is None:
+            return None
+        return [tuple(entry) for entry in entries]
+
+    def put(self, key, entries):
+        """Store list of tuples for key and write sidecar file (atomic replace)"""
+
+        self._data["version"] = SCANCACHE_VERSION
+        self._data["signature"] = self._signature
+        self._data[key] = [list(entry) for entry in entries]
+
+        # file mode is given by the umask, as for other files written
+        tmpname = "{}.tmp{}".format(self._idxname, os.getpid())
+        replace = getattr(os, "replace", os.rename)  # os.replace is python 3 only
+        try:
+            fds = os.open(tmpname, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            with os.fdopen(fds, "w") as stream:
+                json.dump(self._data, stream)
+            replace(tmpname, self._idxname)
+        except (OSError, IOError) as err:
+            logger.info("Could not write scan cache %s: %s", self._idxname, err)
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
 
 
 def _scan_roff_keywords(fhandle, maxkeys=100000, dataframe=False):
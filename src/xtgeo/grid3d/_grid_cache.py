@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Private module, cache of values derived from the Grid geometry."""
+
+from __future__ import print_function, absolute_import, division
+
+import numpy as np
+
+from xtgeo.common import XTGeoDialog
+from .grid_property import GridProperty
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+
+class _GeometryCache(dict):
+    """A dict for items derived from the geometry (COORD, ZCORN, ACTNUM) of a grid.
+
+    The generation is a counter which is increased, and the items cleared,
+    every time the geometry changes (see Grid methods). Hence an item is valid
+    as long as it is present.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_GeometryCache, self).__init__(*args, **kwargs)
+        self.generation = 0
+
+    def bump(self):
+        """Geometry has changed; increase generation and forget all items."""
+        self.generation += 1
+        self.clear()
+
+    def info(self):
+        """Return a dict with the generation, the keys and the size of the items."""
+        return {
+            "generation": self.generation,
+            "keys": list(self.keys()),
+            "nbytes": sum(_nbytes(item) for item in self.values()),
+        }
+
+
+def memoized(grid, key, func, *args, **kwargs):
+    """Return func(grid, ...) for the current geometry, computed only once.
+
+    The cached result is kept in the grid's geometry cache under key, and a
+    copy is returned (GridProperty instances are copied, so the caller is free
+    to modify the values).
+    """
+
+    cache = grid._tmp
+    if key not in cache:
+        cache[key] = func(grid, *args, **kwargs)
+    else:
+        logger.info("Re-use %s from geometry generation %s", key, cache.generation)
+
+    return _copy(cache[key])
+
+
+def _copy(item):
+    if isinstance(item, GridProperty):
+        return item.copy()
+    if isinstance(item, (tuple, list)):
+        return type(item)(_copy(elem) for elem in item)
+    if isinstance(item, dict):
+        return type(item)((name, _copy(elem)) for name, elem in item.items())
+    return item
+
+
+def _nbytes(item):
+    if isinstance(item, GridProperty):
+        return item.values.nbytes
+    if isinstance(item, np.ndarray):
+        return item.nbytes
+    if isinstance(item, (tuple, list)):
+        return sum(_nbytes(elem) for elem in item)
+    if isinstance(item, dict):
+        return sum(_nbytes(elem) for elem in item.values())
+    return getattr(item, "nbytes", 0)
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""Private module, an index for locating XYZ points in Grid cells."""
+
+from __future__ import print_function, absolute_import, division
+
+import zlib
+
+import numpy as np
+
+import xtgeo
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+from xtgeo.common import XTGeoDialog
+from xtgeo.common import _ensemble
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+MAPKEYS = ("topi", "topj", "basi", "basj")
+MAPSPEC = ("ncol", "nrow", "xori", "yori", "xinc", "yinc", "rotation", "yflip")
+INDEXVERSION = 1
+
+
+def geometry_fingerprint(grid):
+    """A cheap checksum of the grid geometry (dimensions, COORD, ZCORN, ACTNUM)."""
+
+    fingerprint = [grid.ncol, grid.nrow, grid.nlay]
+    for arr in (grid._coordsv, grid._zcornsv, grid._actnumsv):
+        fingerprint.append(zlib.adler32(np.ascontiguousarray(arr)))
+
+    return tuple(int(num) for num in fingerprint)
+
+
+def get_cellindex(grid):
+    """Return the cell index of the grid, (re)made only if geometry has changed.
+
+    The index is kept in the grid's geometry cache (grid._tmp), and is valid
+    for the geometry generation it was made for. The (costly) geometry
+    fingerprint is only used when the index is stored to or read from file.
+    """
+
+    index = grid._tmp.get("cellindex")
+
+    if index is None or index.generation != grid.geometry_generation:
+        index = _CellIndex.from_grid(grid)
+        grid._tmp["cellindex"] = index
+    else:
+        logger.info("Re-use existing cell index")
+
+    return index
+
+
+def cellindex_to_file(grid, mfile):
+    """Store the cell index of the grid to file, with a geometry fingerprint."""
+
+    get_cellindex(grid).to_file(mfile, geometry_fingerprint(grid))
+
+
+def cellindex_from_file(grid, mfile):
+    """Read a cell index from file, and use it for grid if it fits."""
+
+    index = _CellIndex.from_file(mfile)
+
+    if index.fingerprint != geometry_fingerprint(grid):
+        raise ValueError("The cell index is not made for this grid (geometry differs)")
+
+    index.generation = grid.geometry_generation
+    grid._tmp["cellindex"] = index
+
+
+class _CellIndex(object):
+    """Index for locating points in the cells of a corner point grid.
+
+    This holds a one layer version of the grid (its ZCORN and ACTNUM), and
+    maps (regular surfaces, refined 4 times relative to the grid) of the I and J
+    column index at top and base. The maps give the I J range of columns to
+    search for a point, the one layer grid pins the column, and then K is found
+    in the full grid.
+
+    The index can be stored to file (numpy npz) and read back; a fingerprint
+    of the grid geometry is stored with it, to check that it fits the grid.
+    In memory, the index is tied to the geometry generation of the grid.
+    """
+
+    def __init__(self, generation, mapspec, maps, onezcornsv, oneactnumsv, zrange):
+        self.generation = generation
+        self.fingerprint = None  # only for index read from file
+        self.mapspec = dict(mapspec)
+        self.maps = maps
+        self.onezcornsv = onezcornsv
+        self.oneactnumsv = oneactnumsv
+        self.zrange = tuple(zrange)
+
+    @property
+    def nbytes(self):
+        """Approximate memory use of the index."""
+        arrays = list(self.maps.values()) + [self.onezcornsv, self.oneactnumsv]
+        return sum(arr.nbytes for arr in arrays)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Make the index from a Grid instance."""
+
+        logger.info("Make a one layer grid and I J maps for the cell index...")
+
+        one = grid.copy()
+        one.reduce_to_one_layer()
+
+        topd = xtgeo.RegularSurface()
+        topi, topj = topd.from_grid3d(one, where="top", rfactor=4)
+
+        basd = xtgeo.RegularSurface()
+        basi, basj = basd.from_grid3d(one, where="base", rfactor=4)
+
+        maps = dict()
+        for key, surf in zip(MAPKEYS, (topi, topj, basi, basj)):
+            surf.fill()
+            maps[key] = surf.get_values1d()
+
+        mapspec = {key: getattr(topd, key) for key in MAPSPEC}
+
+        logger.info("Make a one layer grid and I J maps for the cell index... DONE")
+
+        return cls(
+            grid.geometry_generation,
+            mapspec,
+            maps,
+            one._zcornsv,
+            one._actnumsv,
+            (topd.values.min(), basd.values.max()),
+        )
+
+    @classmethod
+    def from_file(cls, mfile):
+        """Read an index stored by to_file()."""
+
+        with np.load(mfile) as stream:
+            if int(stream["indexversion"]) != INDEXVERSION:
+                raise ValueError("Unsupported cell index file version")
+
+            mapspec = dict(zip(MAPSPEC, stream["mapspec"].tolist()))
+            for key in ("ncol", "nrow", "yflip"):
+                mapspec[key] = int(mapspec[key])
+
+            index = cls(
+                None,
+                mapspec,
+                {key: stream[key] for key in MAPKEYS},
+                stream["onezcornsv"],
+                stream["oneactnumsv"],
+                stream["zrange"].tolist(),
+            )
+            index.fingerprint = tuple(stream["fingerprint"].tolist())
+            return index
+
+    def to_file(self, mfile, fingerprint):
+        """Store the index as numpy npz file, with the grid geometry fingerprint."""
+
+        np.savez(
+            mfile,
+            indexversion=INDEXVERSION,
+            fingerprint=np.array(fingerprint, dtype=np.int64),
+            mapspec=np.array([self.mapspec[key] for key in MAPSPEC], dtype=np.float64),
+            onezcornsv=self.onezcornsv,
+            oneactnumsv=self.oneactnumsv,
+            zrange=np.array(self.zrange, dtype=np.float64),
+            **self.maps
+        )
+
+
+def _map_carrays(maps):
+    """Return the I J maps (dict, cf. MAPKEYS) as list of SWIG carrays.
+
+    The carrays must be deleted by the caller.
+    """
+
+    carrs = []
+    for key in MAPKEYS:
+        carr = _cxtgeo.new_doublearray(maps[key].size)
+        _cxtgeo.swig_numpy_to_carr_1d(maps[key], carr)
+        carrs.append(carr)
+
+    return carrs
+
+
+def points_ijk(grid, xcv, ycv, zcv, activeonly=True, workers=1, executor="process"):
+    """Return I J K (1 based, UNDEF_INT if outside) arrays for XYZ points.
+
+    The points are split in chunks, one per worker, and located in parallel.
+    The C routine holds the GIL, so a process pool is used by default. The
+    index and grid geometry are then shared once by all workers (see
+    _run_chunks), and only the points are sent with each chunk.
+    """
+
+    index = get_cellindex(grid)
+
+    actnumoption = 1
+    if not activeonly:
+        actnumoption = 0
+
+    flip = 1
+    if grid.ijk_handedness == "left":
+        flip = -1
+
+    logger.info("Grid is FLIP %s", flip)
+
+    xcv = np.ascontiguousarray(xcv, dtype=np.float64)
+    ycv = np.ascontiguousarray(ycv, dtype=np.float64)
+    zcv = np.ascontiguousarray(zcv, dtype=np.float64)
+
+    geometry = _geometry_arrays(grid, index) + [
+        (key, index.maps[key]) for key in MAPKEYS
+    ]
+    fixed = (grid.ncol, grid.nrow, grid.nlay, index.mapspec, actnumoption, flip)
+
+    nchunk = max(1, min(workers or 1, xcv.size))
+    bounds = np.linspace(0, xcv.size, nchunk + 1).astype(np.int64)
+    chunks = [
+        (xcv[start:stop], ycv[start:stop], zcv[start:stop])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+    logger.info("Locate %s points in %s chunk(s)", xcv.size, len(chunks))
+    result = _run_chunks(_points_ijk_chunk, geometry, fixed, chunks, executor)
+
+    iarr, jarr, karr = (np.concatenate(arrs) for arrs in zip(*result))
+    return iarr, jarr, karr
+
+
+def _points_ijk_chunk(job):
+    """Locate a chunk of points by C; module level so it can run in a process."""
+
+    source, fixed, (xcv, ycv, zcv) = job
+    ncol, nrow, nlay, spec, actnumoption, flip = fixed
+    geom = _arrays(source)
+
+    arrsize = xcv.size
+
+    carrs = _map_carrays(geom)
+    try:
+        _ier, iarr, jarr, karr = _cxtgeo.grd3d_points_ijk_cells(
+            xcv,
+            ycv,
+            zcv,
+            spec["ncol"],
+            spec["nrow"],
+            spec["xori"],
+            spec["yori"],
+            spec["xinc"],
+            spec["yinc"],
+            spec["rotation"],
+            spec["yflip"],
+            carrs[0],
+            carrs[1],
+            carrs[2],
+            carrs[3],
+            ncol,
+            nrow,
+            nlay,
+            geom["coordsv"],
+            geom["zcornsv"],
+            geom["actnumsv"],
+            geom["onezcornsv"],
+            actnumoption,
+            flip,
+            arrsize,
+            arrsize,
+            arrsize,
+        )
+    finally:
+        for carr in carrs:
+            _cxtgeo.delete_doublearray(carr)
+
+    return iarr, jarr, karr
+
+
+def wells_ijk(grid, xcv, ycv, zcv, offsets=None, workers=1, executor="process"):
+    """Return I J K (1 based, 0 if outside or inactive) arrays for well points.
+
+    This is the trajectory search of grd3d_well_ijk, where the one layer grid is
+    taken from the cell index, hence made only once for a grid. Points of many
+    wells can be given in one go; then offsets (length number of wells + 1)
+    tells where each well starts, and chunks (one per worker) are split at well
+    boundaries. In a process pool, the geometry is shared once by all workers,
+    and only the well coordinates are sent with each chunk.
+    """
+
+    index = get_cellindex(grid)
+
+    xcv = np.ascontiguousarray(xcv, dtype=np.float64)
+    ycv = np.ascontiguousarray(ycv, dtype=np.float64)
+    zcv = np.ascontiguousarray(zcv, dtype=np.float64)
+
+    if offsets is None:
+        offsets = [0, xcv.size]
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    if xcv.size == 0:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy()
+
+    geometry = _geometry_arrays(grid, index)
+    fixed = (grid.ncol, grid.nrow, grid.nlay)
+
+    # chunk bounds are at the well starts nearest (above) an even split
+    nchunk = max(1, min(workers or 1, offsets.size - 1))
+    nearest = np.searchsorted(offsets, np.linspace(0, xcv.size, nchunk + 1))
+    bounds = np.unique(offsets[np.minimum(nearest, offsets.size - 1)])
+    chunks = [
+        (xcv[start:stop], ycv[start:stop], zcv[start:stop])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+    logger.info("Locate %s well points in %s chunk(s)", xcv.size, len(chunks))
+    result = _run_chunks(_wells_ijk_chunk, geometry, fixed, chunks, executor)
+
+    iarr, jarr, karr = (np.concatenate(arrs) for arrs in zip(*result))
+    return iarr, jarr, karr
+
+
+def _wells_ijk_chunk(job):
+    """Search a chunk of well points by C; module level so it can run in a process."""
+
+    source, (ncol, nrow, nlay), (xcv, ycv, zcv) = job
+    geom = _arrays(source)
+
+    nlen = xcv.size
+
+    carrs = []
+    for arr in (xcv, ycv, zcv):
+        carr = _cxtgeo.new_doublearray(nlen)
+        _cxtgeo.swig_numpy_to_carr_1d(arr, carr)
+        carrs.append(carr)
+
+    ivec = _cxtgeo.new_intarray(nlen)
+    jvec = _cxtgeo.new_intarray(nlen)
+    kvec = _cxtgeo.new_intarray(nlen)
+
+    try:
+        cstatus = _cxtgeo.grd3d_well_ijk(
+            ncol,
+            nrow,
+            nlay,
+            geom["coordsv"],
+            geom["zcornsv"],
+            geom["actnumsv"],
+            geom["onezcornsv"],
+            geom["oneactnumsv"],
+            nlen,
+            carrs[0],
+            carrs[1],
+            carrs[2],
+            ivec,
+            jvec,
+            kvec,
+            0,
+        )
+
+        if cstatus != 0:
+            raise RuntimeError("Error from C routine, code is {}".format(cstatus))
+
+        iarr = _cxtgeo.swig_carr_to_numpy_i1d(nlen, ivec)
+        jarr = _cxtgeo.swig_carr_to_numpy_i1d(nlen, jvec)
+        karr = _cxtgeo.swig_carr_to_numpy_i1d(nlen, kvec)
+    finally:
+        for carr in carrs:
+            _cxtgeo.delete_doublearray(carr)
+        for carr in (ivec, jvec, kvec):
+            _cxtgeo.delete_intarray(carr)
+
+    return iarr, jarr, karr
+
+
+def _geometry_arrays(grid, index):
+    """Return the grid and one layer grid arrays as list of (name, array)."""
+
+    return [
+        ("coordsv", grid._coordsv),
+        ("zcornsv", grid._zcornsv),
+        ("actnumsv", grid._actnumsv),
+        ("onezcornsv", index.onezcornsv),
+        ("oneactnumsv", index.oneactnumsv),
+    ]
+
+
+def _run_chunks(func, geometry, fixed, chunks, executor):
+    """Apply func on jobs (geometry source, fixed, chunk) for each chunk.
+
+    For more than one chunk in a process pool, the geometry arrays are written
+    once to a shared memory file (mapped by each worker), instead of being
+    pickled with every chunk. Otherwise the arrays are given as they are.
+    """
+
+    source = geometry
+    try:
+        if executor == "process" and len(chunks) > 1:
+            logger.info("Put grid geometry in shared memory for %s chunks", len(chunks))
+            source = _ensemble.SharedArrays(geometry)
+
+        jobs = [(source, fixed, chunk) for chunk in chunks]
+        return _ensemble.load_many(func, jobs, workers=len(jobs), executor=executor)
+    finally:
+        if isinstance(source, _ensemble.SharedArrays):
+            source.remove()
+
+
+def _arrays(source):
+    """Return dict of geometry arrays, from a list of pairs or a shared file."""
+
+    if isinstance(source, _ensemble.SharedArrays):
+        return source.arrays()
+    return dict(source)
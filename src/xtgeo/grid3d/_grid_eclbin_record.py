@@ -12,8 +12,154 @@ xtg = xtgeo.common.XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# Eclipse binary files are big-endian; LOGI is stored as 4 byte int (-1 is True)
+ECLDTYPES = {"INTE": ">i4", "REAL": ">f4", "DOUB": ">f8", "LOGI": ">i4"}
+NATIVEDTYPES = {
+    "INTE": np.int32,
+    "REAL": np.float32,
+    "DOUB": np.float64,
+    "LOGI": np.int32,
+}
 
-def eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte):
+RECHEADLEN = 24  # [ftn KEYWORD nlen TYPE ftn] in bytes
+
+
+def eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte):
+    """Read a single binary Eclipse record, given kwbyte from keyword scan.
+
+    If pfile is a _XTGeoCFile instance for a file on disk, the record is read
+    through a memory map; otherwise (SWIG file handle or memory stream) through
+    cxtgeo. The returned dtype is int32 (INTE, LOGI as 0/1), float32 or float64.
+    """
+
+    if isinstance(pfile, xtgeo._XTGeoCFile):
+        if not pfile.memstream:
+            return eclbin_record_mmap(pfile.name, kwname, kwlen, kwtype, kwbyte)
+
+        pfile = pfile.fhandle
+
+    return _eclbin_record_cxtgeo(pfile, kwname, kwlen, kwtype, kwbyte)
+
+
+def eclbin_record_mmap(fname, kwname, kwlen, kwtype, kwbyte, dtype=None):
+    """Read a single binary Eclipse record by memory map, native byte order.
+
+    Only the bytes of the record itself are touched. The Fortran block markers
+    are skipped by strided views, and the byte swap (and optional cast to dtype)
+    is done in one copy directly from the mapped file.
+    """
+
+    blocks, tail = eclbin_record_views(fname, kwname, kwlen, kwtype, kwbyte)
+
+    if dtype is None:
+        dtype = NATIVEDTYPES[kwtype]
+
+    values = np.empty(kwlen, dtype=dtype)
+    nfull = blocks.size
+    values[:nfull].reshape(blocks.shape)[...] = blocks
+    values[nfull:] = tail
+
+    if kwtype == "LOGI":
+        values *= -1  # store True as 1, as in cxtgeo
+
+    return values
+
+
+def eclbin_record_views(fname, kwname, kwlen, kwtype, kwbyte):
+    """Return zero-copy, memory mapped big-endian views of an Eclipse record.
+
+    The data of a record is split in Fortran blocks of (normally) 1000 items,
+    where each block has a 4 byte marker before and after. This returns a
+    tuple (blocks, tail), where blocks is a 2D strided view (nblocks, nper)
+    over all full size blocks and tail is a 1D view of the remaining items.
+    Conversion to native byte order is left to the caller, e.g. by astype().
+
+    Args:
+        fname (str): Name of file
+        kwname (str): Keyword name, used to verify the record header
+        kwlen (int): Number of items in record
+        kwtype (str): INTE, REAL, DOUB or LOGI
+        kwbyte (int): Byte position of record header (from keyword scan)
+    """
+
+    if kwtype not in ECLDTYPES:
+        raise ValueError(
+            "Wrong type of kwtype {} for {}, must be INTE, REAL, DOUB "
+            "or LOGI".format(kwtype, kwname)
+        )
+
+    dtype = np.dtype(ECLDTYPES[kwtype])
+    kwbyte = int(kwbyte)
+    kwlen = int(kwlen)
+
+    with open(fname, "rb") as stream:
+        stream.seek(kwbyte)
+        head = stream.read(RECHEADLEN + 4)
+
+    kwhead = head[4:12].decode("ascii", "replace").strip()
+    if len(head) < RECHEADLEN or kwhead != kwname.strip():
+        raise RuntimeError(
+            "Record header for {} not found at byte {} in {}".format(
+                kwname, kwbyte, fname
+            )
+        )
+
+    empty = np.empty(0, dtype=dtype)
+    if kwlen == 0:
+        return empty.reshape(0, 0), empty
+
+    # the first block marker gives the number of bytes per (full) block
+    layouterror = "Unexpected Fortran block layout for {} at byte {} in {}".format(
+        kwname, kwbyte, fname
+    )
+    if len(head) < RECHEADLEN + 4:
+        raise RuntimeError(layouterror)
+
+    nper = int(np.frombuffer(head[RECHEADLEN:], dtype=">i4")[0]) // dtype.itemsize
+    if nper <= 0:
+        raise RuntimeError(layouterror)
+
+    nper = min(nper, kwlen)
+    nfull = kwlen // nper
+    ntail = kwlen - nfull * nper
+    blockbytes = nper * dtype.itemsize + 8
+    nbytes = RECHEADLEN + nfull * blockbytes
+    if ntail:
+        nbytes += ntail * dtype.itemsize + 8
+
+    fmap = np.memmap(fname, dtype=np.uint8, mode="r", offset=kwbyte, shape=(nbytes,))
+
+    markers = np.ndarray(
+        shape=(nfull,),
+        dtype=">i4",
+        buffer=fmap,
+        offset=RECHEADLEN,
+        strides=(blockbytes,),
+    )
+    if not (markers == nper * dtype.itemsize).all():
+        raise RuntimeError(layouterror)
+
+    blocks = np.ndarray(
+        shape=(nfull, nper),
+        dtype=dtype,
+        buffer=fmap,
+        offset=RECHEADLEN + 4,
+        strides=(blockbytes, dtype.itemsize),
+    )
+
+    tail = empty
+    if ntail:
+        tail = np.ndarray(
+            shape=(ntail,),
+            dtype=dtype,
+            buffer=fmap,
+            offset=RECHEADLEN + nfull * blockbytes + 4,
+        )
+
+    return blocks, tail
+
+
+def _eclbin_record_cxtgeo(fhandle, kwname, kwlen, kwtype, kwbyte):
     # generic: read a single binary Eclipse record via cxtgeo
 
     ilen = flen = dlen = 1
@@ -20,7 +20,7 @@ from xtgeo.xyz.polygons import Polygons
 from xtgeo.well import Well
 from . import _gridprop_lowlevel
 from .grid_property import GridProperty
-from ._grid3d_fence import _update_tmpvars
+from . import _grid_cellindex
 
 xtg = XTGeoDialog()
 
@@ -222,59 +222,33 @@ def get_ijk(self, names=("IX", "JY", "KZ"), asmasked=True, zerobased=False):
 
 
 def get_ijk_from_points(
-    self, points, activeonly=True, zerobased=False, dataframe=True, includepoints=True
+    self,
+    points,
+    activeonly=True,
+    zerobased=False,
+    dataframe=True,
+    includepoints=True,
+    workers=1,
+    executor="process",
 ):
     """Get I J K indices as a list of tuples or a dataframe
 
     It is here tried to get fast execution. This requires a preprosessing
-    of the grid to store a onlayer version, and maps with IJ positions
+    of the grid to store a onlayer version, and maps with IJ positions; this
+    cell index is kept with the grid and reused until the geometry changes.
     """
 
     logger.info("Getting IJK indices from Points...")
 
-    actnumoption = 1
-    if not activeonly:
-        actnumoption = 0
-
-    _update_tmpvars(self, force=True)
-
-    arrsize = points.dataframe[points.xname].values.size
-
-    flip = 1
-    if self.ijk_handedness == "left":
-        flip = -1
-
-    logger.info("Grid is FLIP %s", flip)
-
     logger.info("Running C routine...")
-    _ier, iarr, jarr, karr = _cxtgeo.grd3d_points_ijk_cells(
+    iarr, jarr, karr = _grid_cellindex.points_ijk(
+        self,
         points.dataframe[points.xname].values,
         points.dataframe[points.yname].values,
         points.dataframe[points.zname].values,
-        self._tmp["topd"].ncol,
-        self._tmp["topd"].nrow,
-        self._tmp["topd"].xori,
-        self._tmp["topd"].yori,
-        self._tmp["topd"].xinc,
-        self._tmp["topd"].yinc,
-        self._tmp["topd"].rotation,
-        self._tmp["topd"].yflip,
-        self._tmp["topi_carr"],
-        self._tmp["topj_carr"],
-        self._tmp["basi_carr"],
-        self._tmp["basj_carr"],
-        self.ncol,
-        self.nrow,
-        self.nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-        self._tmp["onegrid"]._zcornsv,
-        actnumoption,
-        flip,
-        arrsize,
-        arrsize,
-        arrsize,
+        activeonly=activeonly,
+        workers=workers,
+        executor=executor,
     )
     logger.info("Running C routine... DONE")
 
@@ -362,6 +336,48 @@ def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
     return xo, yo, zo
 
 
+def get_xyz_columns(self, icol1, icol2):
+    """Get X Y Z of cell centres for columns icol1:icol2 (zero based).
+
+    Returns 3 numpy float64 arrays of shape (icol2 - icol1, nrow, nlay). The
+    centre is the mean of the 8 cell corners, computed as in grd3d_calc_xyz
+    but with numpy, so a part of the grid can be done at a time.
+    """
+
+    ncol, nrow, nlay = self._ncol, self._nrow, self._nlay
+    ncols = icol2 - icol1
+
+    pillars = self._coordsv.reshape(nrow + 1, ncol + 1, 6)[:, icol1 : icol2 + 1]
+    pillars = pillars.transpose(1, 0, 2)
+    zcorns = self._zcornsv.reshape(nlay + 1, nrow, ncol, 4)[:, :, icol1:icol2]
+    zcorns = zcorns.transpose(2, 1, 0, 3)
+
+    xsum = ysum = zsum = 0.0
+    for level in (0, 1):  # top and base of cells
+        for corner in range(4):
+            jside, iside = divmod(corner, 2)
+            pillar = pillars[iside : iside + ncols, jside : jside + nrow]
+            xtop, ytop, ztop, xbot, ybot, zbot = [
+                pillar[:, :, num, np.newaxis] for num in range(6)
+            ]
+
+            zval = zcorns[:, :, level : level + nlay, corner]
+            dzpillar = np.broadcast_to(zbot - ztop, zval.shape)
+            vertical = np.abs(dzpillar) <= 0.01
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xval = xtop - (zval - ztop) * (xtop - xbot) / dzpillar
+                yval = ytop - (zval - ztop) * (ytop - ybot) / dzpillar
+            xval[vertical] = np.broadcast_to(xtop, zval.shape)[vertical]
+            yval[vertical] = np.broadcast_to(ytop, zval.shape)[vertical]
+
+            xsum = xsum + xval
+            ysum = ysum + yval
+            zsum = zsum + zval
+
+    return 0.125 * xsum, 0.125 * ysum, 0.125 * zsum
+
+
 def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
     """Get X Y Z cell corners for one cell."""
     i, j, k = ijk
@@ -1065,7 +1081,7 @@ def report_zone_mismatch(  # pylint: disable=too-many-statements
 
     ptr_results = _cxtgeo.new_doublearray(10)
 
-    ptr_zprop = _gridprop_lowlevel.update_carray(zoneprop)
+    zpropv = _gridprop_lowlevel.get_buffer(zoneprop, discrete=True)
 
     cstatus = _cxtgeo.grd3d_rpt_zlog_vs_zon(
         self._ncol,
@@ -1074,7 +1090,7 @@ def report_zone_mismatch(  # pylint: disable=too-many-statements
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        ptr_zprop,
+        zpropv,
         nval,
         ptr_xc,
         ptr_yc,
@@ -1088,8 +1104,6 @@ def report_zone_mismatch(  # pylint: disable=too-many-statements
         option,
     )
 
-    _gridprop_lowlevel.delete_carray(zoneprop, ptr_zprop)
-
     if cstatus == 0:
         logger.debug("OK well")
     elif cstatus == 2:
@@ -1126,7 +1140,7 @@ def get_adjacent_cells(self, prop, val1, val2, activeonly=True):
         discrete=True,
     )
 
-    p_prop1 = _gridprop_lowlevel.update_carray(prop)
+    propv = _gridprop_lowlevel.get_buffer(prop)
     p_prop2 = _cxtgeo.new_intarray(self.ntotal)
 
     iflag1 = 1
@@ -1142,7 +1156,7 @@ def get_adjacent_cells(self, prop, val1, val2, activeonly=True):
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        p_prop1,
+        propv,
         self.ntotal,
         val1,
         val2,
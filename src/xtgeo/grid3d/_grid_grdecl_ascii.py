@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Private module, a streaming tokenizer for ASCII GRDECL files (grid and props).
+
+The file is read once, in chunks of whole lines, and numbers are parsed by
+numpy directly into preallocated arrays. Comments (``--``), repeat counts
+(``N*value``) and records ending with ``/`` are handled, and gzip compressed
+files are read transparently. No temporary files are made.
+"""
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import gzip
+import re
+
+import numpy as np
+
+import xtgeo
+
+xtg = xtgeo.common.XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+CHUNKSIZE = 16 * 1024 ** 2  # approximate size (chars) of each chunk of lines
+
+# keywords without a data record; section headers and some flags. Other
+# keywords are expected to have a record terminated with "/"
+NODATA_KEYWORDS = (
+    "RUNSPEC",
+    "GRID",
+    "EDIT",
+    "PROPS",
+    "REGIONS",
+    "SOLUTION",
+    "SUMMARY",
+    "SCHEDULE",
+    "ECHO",
+    "NOECHO",
+    "ENDBOX",
+    "ENDFIN",
+    "INIT",
+    "NEWTRAN",
+    "OLDTRAN",
+    "NOGGF",
+    "NONNC",
+    "NOSIM",
+    "FMTIN",
+    "FMTOUT",
+    "UNIFIN",
+    "UNIFOUT",
+)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+_TOKEN = re.compile(r"\S+")
+_QUOTED_OR_END = re.compile(r"'[^']*'|\"[^\"]*\"|/")
+
+
+def open_grdecl(pfile):
+    """Open an ASCII GRDECL file for reading text, gzip compressed or not."""
+
+    with open(pfile, "rb") as stream:
+        magic = stream.read(2)
+
+    if magic == GZIP_MAGIC:
+        logger.info("File %s is gzip compressed", pfile)
+        return gzip.open(pfile, "rt")
+    return open(pfile, "r")
+
+
+def read_keywords(pfile, nvalues):
+    """Read the data records of some keywords, in one pass of the file.
+
+    Args:
+        pfile (str): Name of file, may be gzip compressed.
+        nvalues (function): Called as nvalues(keyword, records) for each keyword
+            found that is not read already, where records is a dict of the
+            records read so far. It shall return None to skip the record, -1 to
+            read the record as a list of string tokens (small records, e.g.
+            SPECGRID), or the exact number of values, which are then read into
+            a preallocated array.
+
+    Returns:
+        Dict of keyword: numpy float64 array (or list of tokens). If a keyword
+        occurs several times, the first record is kept (as the C readers did),
+        and later records of it are skipped.
+
+    Raises:
+        ValueError: If a record has the wrong number of values, or is not
+            terminated with "/", or has default values (e.g. "3*").
+    """
+
+    records = {}
+    keyword = None  # the keyword of the current record, if any
+    record = None  # values of current record, None if skipped
+    count = 0  # number of values read into current record
+
+    with open_grdecl(pfile) as stream:
+        for text in _chunks(stream):
+            pos = 0
+            while pos < len(text):
+                if keyword is None:
+                    match = _TOKEN.search(text, pos)
+                    if match is None:
+                        break
+                    pos = match.end()
+                    token = match.group()
+                    if not token[0].isalpha():
+                        logger.debug("Skip token %s outside record", token)
+                        continue
+                    if token in NODATA_KEYWORDS:
+                        continue
+
+                    keyword = token
+                    count = 0
+                    size = None
+                    if keyword not in records:
+                        size = nvalues(keyword, records)
+                    if size is None:
+                        record = None
+                    elif size < 0:
+                        record = []
+                    else:
+                        record = np.empty(size, dtype=np.float64)
+                    continue
+
+                end = _record_end(text, pos, quoted=record is None)
+                stop = len(text) if end < 0 else end
+                if isinstance(record, list):
+                    record.extend(text[pos:stop].split())
+                elif record is not None:
+                    values = _parse_values(text[pos:stop], keyword)
+                    if count + values.size > record.size:
+                        raise ValueError(
+                            "Too many values for {}, expected {}".format(
+                                keyword, record.size
+                            )
+                        )
+                    record[count : count + values.size] = values
+                    count += values.size
+
+                if end < 0:
+                    break
+
+                pos = end + 1
+                if record is not None:
+                    records[keyword] = _finish_record(keyword, record, count)
+                keyword = None
+
+    if keyword is not None:
+        raise ValueError("Record {} is not terminated with /".format(keyword))
+
+    return records
+
+
+def _chunks(stream):
+    """Yield text of whole lines, with comments removed."""
+
+    while True:
+        lines = stream.readlines(CHUNKSIZE)
+        if not lines:
+            return
+        text = "".join(lines)
+        if "--" in text:
+            text = "\n".join(line.split("--", 1)[0] for line in lines)
+        yield text
+
+
+def _record_end(text, pos, quoted=False):
+    """Position of "/" ending a record, or -1. Skipped records may have strings
+    with "/", e.g. INCLUDE file names, hence quoted."""
+
+    if not quoted:
+        return text.find("/", pos)
+
+    for match in _QUOTED_OR_END.finditer(text, pos):
+        if match.group() == "/":
+            return match.start()
+    return -1
+
+
+def _parse_values(text, keyword):
+    """Parse numbers in text to a float64 array, expanding N*value repeats."""
+
+    tokens = text.split()
+    if "*" not in text:
+        return np.array(tokens, dtype=np.float64)
+
+    counts = np.ones(len(tokens), dtype=np.int64)
+    for num, token in enumerate(tokens):
+        if "*" in token:
+            repeat, value = token.split("*", 1)
+            if not value:
+                raise ValueError(
+                    "Default values ({}) in {} are not supported".format(
+                        token, keyword
+                    )
+                )
+            counts[num] = int(repeat)
+            tokens[num] = value
+
+    return np.repeat(np.array(tokens, dtype=np.float64), counts)
+
+
+def _finish_record(keyword, record, count):
+    if isinstance(record, list):
+        return record
+
+    if count != record.size:
+        raise ValueError(
+            "Wrong number of values for {}: {}, expected {}".format(
+                keyword, count, record.size
+            )
+        )
+    return record
@@ -38,6 +38,8 @@ def from_file(
 
     # work on file extension
     _froot, fext = os.path.splitext(gfile)
+    if fext.lower() == ".gz":
+        _froot, fext = os.path.splitext(_froot)  # e.g. gzip compressed GRDECL
     fext = fext.replace(".", "")
     fext = fext.lower()
 
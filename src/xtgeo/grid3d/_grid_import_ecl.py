@@ -4,9 +4,6 @@
 
 from __future__ import print_function, absolute_import
 
-import re
-import os
-from tempfile import mkstemp
 import numpy as np
 
 import xtgeo
@@ -15,6 +12,7 @@ import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.grid3d._grid_eclbin_record import eclbin_record
 
 from . import _grid3d_utils as utils
+from . import _grid_grdecl_ascii
 
 xtg = xtgeo.XTGeoDialog()
 
@@ -146,74 +144,90 @@ def import_ecl_run(self, groot, initprops=None, restartprops=None, restartdates=
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Import eclipse input .GRDECL
-# Uses a tmp file so not very efficient
+# The file is read in one pass by a streaming tokenizer (may be gzip compressed)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 def import_ecl_grdecl(self, gfile):
-
-    # make a temporary file
-    fds, tmpfile = mkstemp(prefix="tmpxtgeo")
-    os.close(fds)
-
-    with open(gfile) as oldfile, open(tmpfile, "w") as newfile:
-        for line in oldfile:
-            if not (re.search(r"^--", line) or re.search(r"^\s+$", line)):
-                newfile.write(line)
-
-    newfile.close()
-    oldfile.close()
-
-    # find ncol nrow nz
-    mylist = []
-    found = False
-    with open(tmpfile) as xfile:
-        for line in xfile:
-            if found:
-                logger.info(line)
-                mylist = line.split()
-                break
-            if re.search(r"^SPECGRID", line):
-                found = True
-
-    if not found:
+    """Import ASCII GRDECL, with SPECGRID, COORD, ZCORN and optionally ACTNUM."""
+
+    def nvalues(keyword, records):
+        if keyword in ("SPECGRID", "MAPAXES"):
+            return -1
+        if keyword not in ("COORD", "ZCORN", "ACTNUM"):
+            return None
+        if "SPECGRID" not in records:
+            raise ValueError("SPECGRID must be before {} in {}".format(keyword, gfile))
+        ncol, nrow, nlay = [int(num) for num in records["SPECGRID"][0:3]]
+        if keyword == "COORD":
+            return (ncol + 1) * (nrow + 1) * 6
+        if keyword == "ZCORN":
+            return ncol * nrow * nlay * 8
+        return ncol * nrow * nlay
+
+    records = _grid_grdecl_ascii.read_keywords(gfile, nvalues)
+
+    if "SPECGRID" not in records:
         logger.error("SPECGRID not found. Nothing imported!")
         return
-    xfile.close()
 
-    self._ncol, self._nrow, self._nlay = int(mylist[0]), int(mylist[1]), int(mylist[2])
+    for keyword in ("COORD", "ZCORN"):
+        if keyword not in records:
+            raise ValueError("Keyword {} is missing in {}".format(keyword, gfile))
+
+    ncol, nrow, nlay = [int(num) for num in records["SPECGRID"][0:3]]
+    self._ncol, self._nrow, self._nlay = ncol, nrow, nlay
 
     logger.info("NX NY NZ in grdecl file: %s %s %s", self._ncol, self._nrow, self._nlay)
 
-    ncoord, nzcorn, ntot = self.vectordimensions
+    coordsv = records["COORD"]
+    coordsv[coordsv == 9999900.0] = -9999.99
+    if "MAPAXES" in records:
+        _apply_mapaxes(coordsv, np.array(records["MAPAXES"], dtype=np.float64))
+    self._coordsv = coordsv
+
+    # ZCORN has 8 corners per cell, while XTGeo has 4 corners (top of cell) for
+    # NLAY + 1 layers, where the last is the base of the last cell layer
+    zcorn = records.pop("ZCORN").reshape(nlay, 2, nrow, 2, ncol, 2)
+    zcornsv = np.empty((nlay + 1, nrow, 2, ncol, 2), dtype=np.float64)
+    zcornsv[:nlay] = zcorn[:, 0]
+    zcornsv[nlay] = zcorn[nlay - 1, 1]
+    del zcorn
+    self._zcornsv = np.ascontiguousarray(zcornsv.transpose(0, 1, 3, 2, 4)).ravel()
+
+    if "ACTNUM" in records:
+        self._actnumsv = records["ACTNUM"].astype(np.int32)
+    else:
+        logger.info("No ACTNUM in file, all cells are active")
+        self._actnumsv = np.ones(ncol * nrow * nlay, dtype=np.int32)
+
+    logger.info("Number of active cells: %s", np.count_nonzero(self._actnumsv == 1))
+    self._subgrids = None
 
-    logger.info("Reading...")
 
-    self._coordsv = np.zeros(ncoord, dtype=np.float64)
-    self._zcornsv = np.zeros(nzcorn, dtype=np.float64)
-    self._actnumsv = np.zeros(ntot, dtype=np.int32)
+def _apply_mapaxes(coordsv, mapaxes):
+    """Transform X Y in COORD (in place) from MAPAXES to map coordinates."""
 
-    ptr_num_act = _cxtgeo.new_intpointer()
+    if mapaxes.size != 6:
+        raise ValueError("MAPAXES shall have 6 values, got {}".format(mapaxes.size))
 
-    eclfile = xtgeo._XTGeoCFile(tmpfile)
+    if np.allclose(mapaxes, 0.0, rtol=0.0, atol=1.0e-05):
+        logger.warning("All MAPAXES numbers ~zero; dubious settings")
+        return
 
-    _cxtgeo.grd3d_import_grdecl(
-        eclfile.fhandle,
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-        ptr_num_act,
-    )
+    x1, y1, x2, y2, x3, y3 = mapaxes.tolist()
 
-    # close and remove tmpfile
-    eclfile.close()
-    os.remove(tmpfile)
+    xaxis = np.array([x3 - x2, y3 - y2])
+    yaxis = np.array([x1 - x2, y1 - y2])
+    xlen, ylen = np.hypot(*xaxis), np.hypot(*yaxis)
+    if xlen < 1.0e-05 or ylen < 1.0e-05:
+        logger.warning("Divisor wrt MAPAXES is ~zero")
+        return
 
-    nact = _cxtgeo.intpointer_value(ptr_num_act)
+    xaxis, yaxis = xaxis / xlen, yaxis / ylen
 
-    logger.info("Number of active cells: %s", nact)
-    self._subgrids = None
+    xyz = coordsv.reshape(-1, 3)
+    xcoord, ycoord = xyz[:, 0].copy(), xyz[:, 1].copy()
+    xyz[:, 0] = x2 + xcoord * xaxis[0] + ycoord * yaxis[0]
+    xyz[:, 1] = y2 + xcoord * xaxis[1] + ycoord * yaxis[1]
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -133,3 +133,91 @@ def gridproperty_fromspec(self, **kwargs):
         self._values[0:4, 0, 0:2] = xtgeo.UNDEF
         # make it masked
         self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_LIMIT)
+
+
+PRECISIONS = ("double", "single")
+
+
+def check_precision(precision):
+    """Return precision if valid, otherwise raise ValueError."""
+
+    if precision not in PRECISIONS:
+        raise ValueError(
+            "Invalid precision {}, must be one of {}".format(precision, PRECISIONS)
+        )
+    return precision
+
+
+def storage_dtype(values, discrete, precision):
+    """Return the numpy dtype to store values with, for the given precision.
+
+    For "double", continuous values are float64 and discrete values int32. For
+    "single", continuous values are float32 (float16 is kept), and discrete
+    values are int16. The discrete dtype is fixed per precision, so that codes
+    assigned later are not truncated by a type chosen from earlier values.
+    """
+
+    if not discrete:
+        if precision == "double":
+            return np.dtype(np.float64)
+        if values.dtype == np.float16:
+            return values.dtype
+        return np.dtype(np.float32)
+
+    if precision == "double":
+        return np.dtype(np.int32)
+    return np.dtype(np.int16)
+
+
+def _cast_values(values, dtype, precision):
+    """Return values cast to dtype; raise ValueError if discrete codes overflow."""
+
+    if dtype.kind == "i" and values.size > 0:
+        info = np.iinfo(dtype)
+        vmin = np.ma.min(values)
+        vmax = np.ma.max(values)
+        if vmin is not np.ma.masked and (vmin < info.min or vmax > info.max):
+            raise ValueError(
+                "Discrete values in range {} - {} cannot be stored with precision "
+                "{} ({}), use precision double".format(vmin, vmax, precision, dtype)
+            )
+
+    logger.info("Store values as %s (precision %s)", dtype, precision)
+    return values.astype(dtype)
+
+
+def storage_values(self, values):
+    """Return values cast to the storage dtype of the instance precision.
+
+    With the default "double" precision, values are returned as is.
+
+    Raises:
+        ValueError: If discrete values are outside the range of the dtype.
+    """
+
+    if self._precision == "double" or values is None:
+        return values
+
+    dtype = storage_dtype(values, self._isdiscrete, self._precision)
+    if values.dtype != dtype:
+        values = _cast_values(values, dtype, self._precision)
+    return values
+
+
+def apply_precision(self, precision=None):
+    """Set precision (if given) and cast current values accordingly.
+
+    Unlike storage_values(), this also casts back to float64/int32 when the
+    precision is "double".
+    """
+
+    if precision is not None:
+        self._precision = check_precision(precision)
+
+    values = self._values
+    if values is None:
+        return  # not loaded (lazy); done by the import when loaded
+
+    dtype = storage_dtype(values, self._isdiscrete, self._precision)
+    if values.dtype != dtype:
+        self._values = _cast_values(values, dtype, self._precision)
@@ -2,6 +2,8 @@
 
 from __future__ import print_function, absolute_import
 
+import numpy as np
+
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
 import xtgeo.common.sys as xtgeosys
@@ -61,7 +63,7 @@ def export_roff(self, pfile, name, append=False, last=True, binary=True):
 
 def _export_roff_discrete(self, pfile, name, append=False, last=True, binary=True):
 
-    carray = _gridprop_lowlevel.update_carray(self, undef=-999)
+    values1d = _gridprop_lowlevel.get_buffer(self, undef=-999, discrete=True)
 
     ptr_idum = _cxtgeo.new_intpointer()
     ptr_ddum = _cxtgeo.new_doublepointer()
@@ -100,7 +102,7 @@ def _export_roff_discrete(self, pfile, name, append=False, last=True, binary=Tru
         ptr_idum,
         name,
         "int",
-        carray,
+        values1d,
         ptr_ddum,
         ncodes,
         codenames,
@@ -111,12 +113,10 @@ def _export_roff_discrete(self, pfile, name, append=False, last=True, binary=Tru
     if last:
         _cxtgeo.grd3d_export_roff_end(mode, pfile)
 
-    _gridprop_lowlevel.delete_carray(self, carray)
-
 
 def _export_roff_continuous(self, pfile, name, append=False, last=True, binary=True):
 
-    carray = _gridprop_lowlevel.update_carray(self, undef=-999.0)
+    values1d = _gridprop_lowlevel.get_buffer(self, undef=-999.0, discrete=False)
 
     ptr_idum = _cxtgeo.new_intpointer()
 
@@ -144,7 +144,7 @@ def _export_roff_continuous(self, pfile, name, append=False, last=True, binary=T
         name,
         "double",
         ptr_idum,
-        carray,
+        values1d,
         0,
         "",
         ptr_idum,
@@ -154,8 +154,6 @@ def _export_roff_continuous(self, pfile, name, append=False, last=True, binary=T
     if last:
         _cxtgeo.grd3d_export_roff_end(mode, pfile)
 
-    _gridprop_lowlevel.delete_carray(self, carray)
-
 
 # Export ascii or binary GRDECL
 
@@ -170,23 +168,29 @@ def export_grdecl(self, pfile, name, append=False, binary=False, dtype=None):
         else:
             dtype = "float32"
 
-    carray = _gridprop_lowlevel.update_carray(self, dtype=dtype)
+    if self._isdiscrete and np.dtype(dtype) == np.float64:
+        dtype = "int32"  # discrete values are not written as DOUB
+
+    values1d = _gridprop_lowlevel.get_buffer(self, dtype=dtype)
 
     iarr = _cxtgeo.new_intpointer()
     farr = _cxtgeo.new_floatpointer()
     darr = _cxtgeo.new_doublepointer()
 
-    if "double" in str(carray):
+    if values1d.dtype == np.float64:
         ptype = 3
-        darr = carray
+        darr = values1d
 
-    elif "float" in str(carray):
+    elif values1d.dtype == np.float32:
         ptype = 2
-        farr = carray
+        farr = values1d
 
-    else:
+    elif values1d.dtype == np.int32:
         ptype = 1
-        iarr = carray
+        iarr = values1d
+
+    else:
+        raise ValueError("Unsupported dtype for GRDECL export: {}".format(dtype))
 
     mode = 0
     if not binary:
@@ -209,5 +213,3 @@ def export_grdecl(self, pfile, name, append=False, binary=False, dtype=None):
         mode,
         appendmode,
     )
-
-    _gridprop_lowlevel.delete_carray(self, carray)
@@ -13,6 +13,7 @@ from __future__ import print_function, absolute_import
 import os
 
 import xtgeo
+from . import _gridprop_etc
 from ._gridprop_import_eclrun import import_eclbinary as impeclbin
 from ._gridprop_import_grdecl import import_grdecl_prop, import_bgrdecl_prop
 from ._gridprop_import_roff import import_roff
@@ -30,11 +31,16 @@ def from_file(
     grid=None,
     date=None,
     fracture=False,
+    precision=None,
     _roffapiv=1,
 ):  # _roffapiv for devel.
 
     """Import grid property from file, and makes an instance of this."""
 
+    # set precision first, so the import routines can avoid upcasting
+    if precision is not None:
+        self._precision = _gridprop_etc.check_precision(precision)
+
     # it may be that pfile already is an open file; hence a filehandle
     # instead. Check for this, and skip actions if so
     if not isinstance(pfile, xtgeo._XTGeoCFile):
@@ -79,6 +85,8 @@ def from_file(
         logger.warning("Invalid file format")
         raise ValueError("Invalid file format")
 
+    _gridprop_etc.apply_precision(self)
+
     # if grid, then append this gridprop to the current grid object
 
     # ###################################TMP skipped""
@@ -99,6 +107,8 @@ def _chk_file(self, pfile, fformat):
 
     # work on file extension
     _froot, fext = os.path.splitext(pfile)
+    if fext.lower() == ".gz":
+        _froot, fext = os.path.splitext(_froot)  # e.g. gzip compressed GRDECL
     if fformat is None or fformat == "guess":
         if not fext:
             raise ValueError("File extension missing. STOP")
@@ -9,6 +9,7 @@ import xtgeo
 
 from . import _grid_eclbin_record as _eclbin
 from . import _grid3d_utils as utils
+from . import _gridprop_etc
 
 xtg = xtgeo.common.XTGeoDialog()
 
@@ -44,29 +45,26 @@ def import_eclbinary(
 ):
 
     # if pfile is a file, then the file is opened/closed here; otherwise, the
-    # "outer" routine must handle that
+    # "outer" routine must handle that. The pfile may be a _XTGeoCFile instance
+    # or a SWIG file handle; records from files on disk are read by memory maps
 
     local_fhandle = False
-    fhandle = pfile
     if isinstance(pfile, str):
         local_fhandle = True
         pfile = xtgeo._XTGeoCFile(pfile)
-        fhandle = pfile.fhandle
 
     status = 0
 
     logger.info("Import ECL binary, name requested is %s", name)
 
-    # scan file for properties byte positions etc
+    # scan file for properties byte positions etc; kwlist is a EclKeywordCatalog
     if _kwlist is None:
         logger.info("Make kwlist, scan keywords")
-        kwlist = utils.scan_keywords(
-            fhandle, fformat="xecl", maxkeys=100000, dataframe=True, dates=True
-        )
+        kwlist = utils.scan_ecl_catalog(pfile, maxkeys=100000)
     else:
         kwlist = _kwlist
 
-    metadata = _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid)
+    metadata = _import_eclbinary_meta(self, pfile, kwlist, etype, date, grid)
     date = metadata["DATE"]
 
     # Importing phases is a challenge. It depends on the fluid system and simulator; e.g
@@ -74,13 +72,13 @@ def import_eclbinary(
     # computed, if E100. E300 and IX may behave different...
 
     if name == "SGAS":
-        status = _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture)
+        status = _import_sgas(self, pfile, kwlist, metadata, grid, date, fracture)
 
     elif name == "SOIL":
-        status = _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture)
+        status = _import_soil(self, pfile, kwlist, metadata, grid, date, fracture)
 
     elif name == "SWAT":
-        status = _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture)
+        status = _import_swat(self, pfile, kwlist, metadata, grid, date, fracture)
 
     if status == 0:
         name = name.replace("{__}", "")
@@ -97,7 +95,7 @@ def import_eclbinary(
             _import_eclbinary_dualporo(
                 self,
                 grid,
-                fhandle,
+                pfile,
                 kwname,
                 kwlen,
                 kwtype,
@@ -109,23 +107,24 @@ def import_eclbinary(
             )
         else:
             _import_eclbinary_prop(
-                self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype
+                self, grid, pfile, kwname, kwlen, kwtype, kwbyte, name, date, etype
             )
 
-    if local_fhandle and not pfile.close(cond=local_fhandle):
+    # the C file handle is opened only if needed, as records from files on disk
+    # are memory mapped; hence close (and check) only if opened here
+    if local_fhandle and pfile._fhandle and not pfile.close(cond=local_fhandle):
         raise RuntimeError("Error in closing file handle for binary Eclipse file")
 
+    _gridprop_etc.apply_precision(self)
+
 
-def _chk_kw_date(df, keyword, date):
+def _chk_kw_date(kwlist, keyword, date):
     """Check if a keyword exists for a given date"""
 
-    for ir in range(len(df)):
-        if df.loc[ir, "KEYWORD"] == keyword and str(df.loc[ir, "DATE"]) == str(date):
-            return True
-    return False
+    return kwlist.has(keyword, date)
 
 
-def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
+def _import_swat(self, pfile, kwlist, metadata, grid, date, fracture):
     """Import SWAT; this may lack in very special cases"""
 
     s_exists = _chk_kw_date(kwlist, "SWAT", date)
@@ -134,7 +133,7 @@ def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
     if s_exists or metadata["IPHS"] in (0, 3, 6, 7, -2345):
         import_eclbinary(
             self,
-            fhandle,
+            pfile,
             name="SWAT{__}",
             etype=5,
             grid=grid,
@@ -172,7 +171,7 @@ def _import_swat(self, fhandle, kwlist, metadata, grid, date, fracture):
     return 3
 
 
-def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
+def _import_sgas(self, pfile, kwlist, metadata, grid, date, fracture):
     """Import SGAS; this may be lack of oil/water (need to verify)"""
 
     s_exists = _chk_kw_date(kwlist, "SGAS", date)
@@ -182,7 +181,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
     if s_exists or metadata["IPHS"] in (0, 5, 7, -2345):
         import_eclbinary(
             self,
-            fhandle,
+            pfile,
             name="SGAS{__}",
             etype=5,
             grid=grid,
@@ -197,7 +196,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
         swat = self.__class__()
         import_eclbinary(
             swat,
-            fhandle,
+            pfile,
             name="SWAT{__}",
             etype=5,
             grid=grid,
@@ -244,7 +243,7 @@ def _import_sgas(self, fhandle, kwlist, metadata, grid, date, fracture):
     return 1
 
 
-def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
+def _import_soil(self, pfile, kwlist, metadata, grid, date, fracture):
     # pylint: disable=too-many-branches, too-many-statements
     s_exists = _chk_kw_date(kwlist, "SOIL", date)
     logger.info("SOIL: S_EXISTS %s for date %s", s_exists, date)
@@ -262,7 +261,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
     if s_exists or phases in (0, -2345):
         import_eclbinary(
             self,
-            fhandle,
+            pfile,
             name="SOIL{__}",
             etype=5,
             grid=grid,
@@ -280,7 +279,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
             swat = self.__class__()
             import_eclbinary(
                 swat,
-                fhandle,
+                pfile,
                 name="SWAT{__}",
                 etype=5,
                 grid=grid,
@@ -293,7 +292,7 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
             sgas = self.__class__()
             import_eclbinary(
                 sgas,
-                fhandle,
+                pfile,
                 name="SGAS{__}",
                 etype=5,
                 grid=grid,
@@ -352,23 +351,20 @@ def _import_soil(self, fhandle, kwlist, metadata, grid, date, fracture):
     return 2
 
 
-def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
+def _import_eclbinary_meta(self, pfile, kwlist, etype, date, grid):
     """Find settings and metadata, private to this module.
 
     Returns:
         A dictionary of metadata
 
     """
-    nentry = 0
     metadata = {}
 
-    datefound = True
     if etype == 5:
-        datefound = False
         logger.info("Look for date %s", date)
 
-        # scan for date and find SEQNUM entry number; also potentially update date!
-        dtlist = kwlist["DATE"].values.tolist()
+        # look up date in catalog; also potentially update date!
+        dtlist = kwlist.dates
         if date == 0:
             date = dtlist[0]
         elif date == 9:
@@ -376,26 +372,16 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
 
         logger.info("Redefined date is %s", date)
 
-        for ientry, dtentry in enumerate(dtlist):
-            if str(dtentry) == str(date):
-                datefound = True
-                nentry = ientry
-                break
-
-        if not datefound:
-            msg = "Date {} not found, nentry={}".format(date, nentry)
+        if not kwlist.has_date(date):
+            msg = "Date {} not found".format(date)
             xtg.warn(msg)
             raise xtgeo.DateNotFoundError(msg)
 
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
     # INTEHEAD is needed to verify grid dimensions:
-    for kwitem in kwxlist:
-        if kwitem[0] == "INTEHEAD":
-            kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
-            break
+    kwname, kwtype, kwlen, kwbyte, _kwdate = _get_first_record(kwlist, "INTEHEAD")
 
     # read INTEHEAD record:
-    intehead = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
+    intehead = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte).tolist()
     ncol, nrow, nlay = intehead[8:11]
     logger.info("Dimensions detected %s %s %s", ncol, nrow, nlay)
 
@@ -407,13 +393,10 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
 
     # LOGIHEAD item [14] in restart should be True, if dualporo model...
     # LOGIHEAD item [15] in restart should be True, if dualperm (+ dualporo) model.
-    for kwitem in kwxlist:
-        if kwitem[0] == "LOGIHEAD":
-            kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
-            break
+    kwname, kwtype, kwlen, kwbyte, _kwdate = _get_first_record(kwlist, "LOGIHEAD")
 
     # read INTEHEAD record:
-    logihead = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte).tolist()
+    logihead = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte).tolist()
 
     # DUAL; which kind if doubles (not exact!) the layers when reading,
     # and assign first half* to Matrix (M) and second half to Fractures (F).
@@ -439,6 +422,18 @@ def _import_eclbinary_meta(self, fhandle, kwlist, etype, date, grid):
     return metadata
 
 
+def _get_first_record(kwlist, keyword):
+    """Return first catalog record for a (header) keyword, or raise"""
+
+    kwitem = kwlist.get_first(keyword)
+    if kwitem is None:
+        msg = "The keyword <{}> is not found".format(keyword)
+        xtg.warn(msg)
+        raise xtgeo.KeywordNotFoundError(msg)
+
+    return kwitem
+
+
 def _import_eclbinary_checks1(self, grid):
     """Do some validations/checks"""
 
@@ -493,10 +488,6 @@ def _import_eclbinary_checks1(self, grid):
 def _import_eclbinary_checks2(kwlist, name, etype, date):
     """More checks, and returns what's needed for actual import"""
 
-    datefound = True
-
-    kwfound = False
-    datefoundhere = False
     usedate = "0"
     restart = False
 
@@ -504,26 +495,17 @@ def _import_eclbinary_checks2(kwlist, name, etype, date):
         usedate = str(date)
         restart = True
 
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
-    for kwitem in kwxlist:
-        kwname, kwtype, kwlen, kwbyte, kwdate = kwitem
-        logger.debug("Keyword %s -  date: %s usedate: %s", kwname, kwdate, usedate)
-        if name == kwname:
-            kwfound = True
-
-        if name == kwname and usedate == str(kwdate):
-            logger.info("Keyword %s ok at date %s", name, usedate)
-            kwname, kwtype, kwlen, kwbyte, kwdate = kwitem
-            datefoundhere = True
-            break
+    kwfound = kwlist.has_keyword(name)
+    kwitem = kwlist.get(name, usedate)
+    datefoundhere = kwitem is not None
 
     if restart:
-        if datefound and not kwfound:
+        if not kwfound:
             msg = "Date <{}> is found, but not keyword <{}>".format(date, name)
             xtg.warn(msg)
             raise xtgeo.KeywordNotFoundError(msg)
 
-        if not datefoundhere and kwfound:
+        if not datefoundhere:
             msg = "The keyword <{}> exists but not for " "date <{}>".format(name, date)
             xtg.warn(msg)
             raise xtgeo.KeywordFoundNoDateError(msg)
@@ -533,15 +515,26 @@ def _import_eclbinary_checks2(kwlist, name, etype, date):
             xtg.warn(msg)
             raise xtgeo.KeywordNotFoundError(msg)
 
+        if not datefoundhere:
+            kwitem = kwlist.get_first(name)
+
+    logger.info("Keyword %s ok at date %s", name, usedate)
+    kwname, kwtype, kwlen, kwbyte, _kwdate = kwitem
+
     return kwname, kwlen, kwtype, kwbyte
 
 
 def _import_eclbinary_prop(
-    self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype
+    self, grid, pfile, kwname, kwlen, kwtype, kwbyte, name, date, etype, _gact=None
 ):
-    """Import the actual record"""
+    """Import the actual record.
+
+    The _gact is an optional tuple (actnum values, actnum indices C order,
+    actnum indices F order) from the grid, to avoid recomputing these for
+    every property when importing many.
+    """
 
-    values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+    values = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte)
 
     self._isdiscrete = False
     use_undef = xtgeo.UNDEF
@@ -557,24 +550,22 @@ def _import_eclbinary_prop(
         codes = {key: str(val) for key, val in codes.items()}  # val: strings
         self.codes = codes
 
-    else:
+    elif self._precision == "double":
         values = values.astype(np.float64)  # cast REAL (float32) to float64
 
     # arrays from Eclipse INIT or UNRST are usually for inactive values only.
     # Use the ACTNUM index array for vectorized numpy remapping (need both C
     # and F order)
-    gactnum = grid.get_actnum().values
-    gactindc = grid.actnum_indices
-    gactindf = grid.get_actnum_indices(order="F")
+    if _gact is None:
+        _gact = _grid_actnum_arrays(grid)
+    gactnum, gactindc, gactindf = _gact
 
     allvalues = (
         np.zeros((self._ncol * self._nrow * self._nlay), dtype=values.dtype) + use_undef
     )
 
     msg = "\n"
-    msg = msg + "grid.actnum_indices.shape[0] = {}\n".format(
-        grid.actnum_indices.shape[0]
-    )
+    msg = msg + "grid.actnum_indices.shape[0] = {}\n".format(gactindc.shape[0])
     msg = msg + "values.shape[0] = {}\n".format(values.shape[0])
     msg = msg + "ncol nrow nlay {} {} {}, nrow*nrow*nlay = {}\n".format(
         self._ncol, self._nrow, self._nlay, self._ncol * self._nrow * self._nlay
@@ -607,8 +598,18 @@ def _import_eclbinary_prop(
         self._date = date
 
 
+def _grid_actnum_arrays(grid):
+    """Return actnum values, and active indices in C and F order, for a grid"""
+
+    return (
+        grid.get_actnum().values,
+        grid.actnum_indices,
+        grid.get_actnum_indices(order="F"),
+    )
+
+
 def _import_eclbinary_dualporo(
-    self, grid, fhandle, kwname, kwlen, kwtype, kwbyte, name, date, etype, fracture
+    self, grid, pfile, kwname, kwlen, kwtype, kwbyte, name, date, etype, fracture
 ):
     """Import the actual record for dual poro scheme"""
 
@@ -617,7 +618,7 @@ def _import_eclbinary_dualporo(
     # A lot of code duplication here, as this is under testing
     #
 
-    values = _eclbin.eclbin_record(fhandle, kwname, kwlen, kwtype, kwbyte)
+    values = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte)
 
     # arrays from Eclipse INIT or UNRST are usually for inactive values only.
     # Use the ACTNUM index array for vectorized numpy remapping (need both C
@@ -648,7 +649,7 @@ def _import_eclbinary_dualporo(
         codes = {key: str(val) for key, val in codes.items()}  # val: strings
         self.codes = codes
 
-    else:
+    elif self._precision == "double":
         values = values.astype(np.float64)  # cast REAL (float32) to float64
 
     allvalues = (
@@ -2,18 +2,14 @@
 
 from __future__ import print_function, absolute_import
 
-import re
-import os
-from tempfile import mkstemp
-
 import numpy as np
 import numpy.ma as ma
 
 import xtgeo
-import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 from . import _grid_eclbin_record as _eclbin
 from . import _grid3d_utils as utils
+from . import _grid_grdecl_ascii
 
 xtg = xtgeo.common.XTGeoDialog()
 
@@ -64,7 +60,8 @@ def import_bgrdecl_prop(self, pfile, name="unknown", grid=None):
 
     else:
         self._isdiscrete = False
-        values = values.astype(np.float64)  # cast REAL (float32) to float64
+        if self._precision == "double":
+            values = values.astype(np.float64)  # cast REAL (float32) to float64
         self.codes = {}
 
     # property arrays from binary GRDECL will be for all cells, but they
@@ -82,7 +79,7 @@ def import_bgrdecl_prop(self, pfile, name="unknown", grid=None):
 
 
 def import_grdecl_prop(self, pfile, name="unknown", grid=None):
-    """Read a GRDECL ASCII property record"""
+    """Read a GRDECL ASCII property record (file may be gzip compressed)"""
 
     if grid is None:
         raise ValueError("A grid instance is required as argument")
@@ -94,28 +91,18 @@ def import_grdecl_prop(self, pfile, name="unknown", grid=None):
     self._filesrc = pfile
     actnumv = grid.get_actnum().values
 
-    # This requires that the Python part clean up comments
-    # etc, and make a tmp file.
-    fds, tmpfile = mkstemp(prefix="tmpxtgeo")
-    os.close(fds)
-
-    with open(pfile, "r") as oldfile, open(tmpfile, "w") as newfile:
-        for line in oldfile:
-            if not (re.search(r"^--", line) or re.search(r"^\s+$", line)):
-                newfile.write(line)
-
-    # now read the property
+    # read only the wanted record, directly into an array of all cells
     nlen = self._ncol * self._nrow * self._nlay
-    ier, values = _cxtgeo.grd3d_import_grdecl_prop(
-        tmpfile, self._ncol, self._nrow, self._nlay, name, nlen, 0,
+    records = _grid_grdecl_ascii.read_keywords(
+        pfile, lambda keyword, _records: nlen if keyword == name else None
     )
 
-    os.remove(tmpfile)
-
-    if ier != 0:
+    if name not in records:
         raise xtgeo.KeywordNotFoundError(
             "Cannot import {}, not present in file {}?".format(name, pfile)
         )
 
-    self.values = values.reshape(self.dimensions)
-    self.values = ma.masked_equal(self.values, actnumv == 0)
+    # property arrays from GRDECL are in Fortran order
+    values = records[name].reshape(self.dimensions, order="F")
+    values = np.asanyarray(values, order="C")
+    self.values = ma.masked_where(actnumv < 1, values)
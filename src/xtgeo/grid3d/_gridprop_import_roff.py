@@ -168,7 +168,14 @@ def _import_roff_v2(self, pfile, name):
 
     # get the actual parameter:
     vals = _rarraykwquery(
-        pfile.fhandle, kwords, "parameter!name!" + name, byteswap, ncol, nrow, nlay
+        pfile.fhandle,
+        kwords,
+        "parameter!name!" + name,
+        byteswap,
+        ncol,
+        nrow,
+        nlay,
+        precision=self._precision,
     )
 
     self._values = vals
@@ -218,7 +225,7 @@ def _rkwquery(fhandle, kws, name, swap):
     return xresult
 
 
-def _rarraykwquery(fhandle, kws, name, swap, ncol, nrow, nlay):
+def _rarraykwquery(fhandle, kws, name, swap, ncol, nrow, nlay, precision="double"):
     """Local function for _import_roff_v2, 3D parameter arrays.
 
     This parameters are translated to numpy data for the values
@@ -278,7 +285,8 @@ def _rarraykwquery(fhandle, kws, name, swap, ncol, nrow, nlay):
         # vals = fnumpy.reshape((ncol, nrow, nlay), order='F')
         # vals = np.asanyarray(vals, order='C')
         vals = ma.masked_greater(vals, xtgeo.UNDEF_LIMIT)
-        vals = vals.astype(np.float64)
+        if precision == "double":
+            vals = vals.astype(np.float64)
         del fnumpy
         del inumpy
 
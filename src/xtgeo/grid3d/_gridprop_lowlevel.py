@@ -65,13 +65,23 @@ def update_values_from_carray(self, carray, dtype, delete=False):
         carray = delete_carray(self, carray)
 
 
-def update_carray(self, undef=None, discrete=None, dtype=None, order="F"):
-    """Copy (update) values from numpy to SWIG, 1D array, returns a pointer
-    to SWIG C array. If discrete is defined as True or False, force
-    the SWIG array to be of that kind.
-
-    Note that dtype will "override" current datatype if set. The resulting
-    carray will be in Fortran order, unless order is specified as 'C'
+def get_buffer(self, undef=None, discrete=None, dtype=None, order="F"):
+    """Return values as a contiguous 1D numpy array, for direct use in C.
+
+    This is the numpy counterpart of update_carray(): the returned array can be
+    given directly to the C routines (cf. the pointer typemaps in cxtgeo.i), so
+    no SWIG carray is needed. Masked cells are set to undef. The cast, the
+    reordering and the filling is done in one copy. For order="C", if no cells
+    are masked and dtype is already right, the values themselves are returned
+    as a read only view (no copy). The C routines only accept writeable
+    arrays, so such a view is for reading in Python only.
+
+    Args:
+        undef: Value for masked cells; default is UNDEF or UNDEF_INT
+        discrete (bool): If given, force a discrete (int32) or continuous
+            (float64) result
+        dtype: Force this dtype instead; overrides discrete
+        order (str): "F" (default, as the C routines) or "C"
     """
 
     dstatus = self._isdiscrete
@@ -83,28 +93,57 @@ def update_carray(self, undef=None, discrete=None, dtype=None, order="F"):
         if dstatus:
             undef = xtgeo.UNDEF_INT
 
-    logger.debug("Entering conversion from numpy to C array ...")
+    if not dtype:
+        dtype = np.int32 if dstatus else np.float64
+    dtype = np.dtype(dtype)
 
-    values = self._values.copy()
+    values = self.values
+    mask = ma.getmask(values)
+    data = ma.getdata(values)
+
+    nomask = mask is ma.nomask or not mask.any()
+    if order == "C" and nomask and data.dtype == dtype:
+        logger.debug("Use values directly (no copy)")
+        values1d = np.ravel(data, order="C")
+        values1d.flags.writeable = False
+        return values1d
+
+    logger.debug("Make a %s ordered %s buffer ...", order, dtype)
+    buffer = np.empty(data.shape, dtype=dtype, order=order)
+    with np.errstate(invalid="ignore"):  # masked cells may have undef or nan
+        np.copyto(buffer, data, casting="unsafe")
+    if not nomask:
+        np.copyto(buffer, undef, casting="unsafe", where=mask)
+
+    return np.ravel(buffer, order="K")
 
-    if not dtype:
-        if dstatus:
-            values = values.astype(np.int32)
-        else:
-            values = values.astype(np.float64)
-    else:
-        values = values.astype(dtype)
 
-    values = ma.filled(values, undef)
+def update_carray(self, undef=None, discrete=None, dtype=None, order="F"):
+    """Copy (update) values from numpy to SWIG, 1D array, returns a pointer
+    to SWIG C array. If discrete is defined as True or False, force
+    the SWIG array to be of that kind.
 
-    if order == "F":
-        values = np.asfortranarray(values)
-        values1d = np.ravel(values, order="K")
+    Note that dtype will "override" current datatype if set. The resulting
+    carray will be in Fortran order, unless order is specified as 'C'
+
+    Consider get_buffer() instead, where the numpy array is given directly to
+    the C routine.
+    """
 
-    if values1d.dtype == "float64" and dstatus:
-        values1d = values1d.astype("int32")
+    dstatus = self._isdiscrete
+    if discrete is not None:
+        dstatus = bool(discrete)
+
+    if dtype and np.dtype(dtype) == np.float64 and dstatus:
+        dtype = np.int32
         logger.debug("Casting has been done")
 
+    logger.debug("Entering conversion from numpy to C array ...")
+
+    values1d = get_buffer(
+        self, undef=undef, discrete=discrete, dtype=dtype, order=order
+    )
+
     if values1d.dtype == "float64":
         logger.debug("Convert to carray (double)")
         carray = _cxtgeo.new_doublearray(self.ntotal)
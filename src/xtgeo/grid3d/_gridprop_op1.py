@@ -95,7 +95,7 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     proxy.discrete_to_continuous()
 
     proxy.values *= 0.0
-    cvals = gl.update_carray(proxy)
+    proxyv = gl.get_buffer(proxy)  # updated in place by C
 
     idgroups = poly.dataframe.groupby(poly.pname)
 
@@ -112,13 +112,13 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
             grid._coordsv,
             grid._zcornsv,
             grid._actnumsv,
-            cvals,
+            proxyv,
             1,
         )
         if ier == -9:
             print("## Polygon no {} is not closed".format(id_ + 1))
 
-    gl.update_values_from_carray(proxy, cvals, np.float64, delete=True)
+    proxy.values = proxyv.reshape(proxy.dimensions, order="F")
 
     proxyv = proxy.values.astype(np.int8)
 
@@ -4,15 +4,20 @@ from collections import OrderedDict
 
 import pandas as pd
 import numpy as np
+import numpy.ma as ma
 
 from xtgeo.common import XTGeoDialog
 
 from ._grid3d import Grid3D
+from . import _grid_etc1
 
 xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+CHUNKSIZE = 1000000  # default number of cells (before active filtering) per chunk
+TABLE_FORMATS = ("parquet", "arrow")
+
 
 #
 
@@ -101,3 +106,143 @@ def dataframe(
     logger.debug("Dataframe: \n%s", mydataframe)
 
     return mydataframe
+
+
+def dataframe_chunks(
+    self,
+    activeonly=True,
+    ijk=False,
+    xyz=False,
+    doubleformat=False,
+    grid=None,
+    chunksize=CHUNKSIZE,
+    dtypes=None,
+):  # pylint: disable=too-many-locals
+    """Yield the dataframe() table in chunks of whole grid columns (I slabs).
+
+    The rows are in the same order as in dataframe(), so the chunks concatenated
+    give the same table, but memory use is bounded by chunksize cells.
+    """
+
+    if grid is not None and isinstance(grid, Grid3D):
+        master = grid
+    else:
+        master = self
+        grid = None
+
+    if xyz and grid is None:
+        raise ValueError("You ask for xyz but no Grid is present. Use grid=...")
+
+    if chunksize < 1:
+        raise ValueError("The chunksize must be 1 or more, got {}".format(chunksize))
+
+    ncol, nrow, nlay = master.ncol, master.nrow, master.nlay
+    ncols = max(1, chunksize // max(1, nrow * nlay))
+    props = self.props if self.props is not None else []
+    actnum = _actnum_view(master)
+    actnumdual = _actnum_view(master, dual=True)
+    dtypes = dtypes if dtypes is not None else {}
+
+    logger.info("Dataframe in chunks of %s of %s grid columns", ncols, ncol)
+
+    for icol1 in range(0, ncol, ncols):
+        icol2 = min(icol1 + ncols, ncol)
+        shape = (icol2 - icol1, nrow, nlay)
+
+        active = np.ones(shape, dtype=bool)
+        if actnum is not None:
+            active = actnum[icol1:icol2] != 0
+
+        def _column(values, active=active):
+            values = np.broadcast_to(values, shape)
+            if activeonly:
+                return values[active]
+            return values.ravel()
+
+        columns = OrderedDict()
+
+        if ijk:
+            if not activeonly:
+                columns["ACTNUM"] = _column(
+                    actnumdual[icol1:icol2] if actnumdual is not None else np.int32(1)
+                ).astype(np.int32)
+            cols, rows, lays = np.ogrid[
+                icol1 + 1 : icol2 + 1, 1 : nrow + 1, 1 : nlay + 1
+            ]
+            columns["IX"] = _column(cols.astype(np.int32))
+            columns["JY"] = _column(rows.astype(np.int32))
+            columns["KZ"] = _column(lays.astype(np.int32))
+
+        if xyz:
+            xcv, ycv, zcv = _grid_etc1.get_xyz_columns(grid, icol1, icol2)
+            columns["X_UTME"] = _column(xcv)
+            columns["Y_UTMN"] = _column(ycv)
+            columns["Z_TVDSS"] = _column(zcv)
+
+        for prop in props:
+            # mask values not supported in Pandas:
+            vector = prop.values[icol1:icol2]
+            vector = ma.filled(vector, fill_value=0 if prop.isdiscrete else np.nan)
+            vector = _column(vector)
+            columns[prop.name] = vector.astype(
+                np.float64 if doubleformat else np.float32
+            )
+
+        for name, dtype in dtypes.items():
+            if name in columns:
+                columns[name] = columns[name].astype(dtype)
+
+        yield pd.DataFrame.from_dict(columns)
+
+
+def _actnum_view(master, dual=False):
+    """ACTNUM as a (ncol, nrow, nlay) array, from grid or first property."""
+
+    if isinstance(master, Grid3D):
+        if dual and master._dualactnum is not None:
+            return master._dualactnum.values.filled(0)
+        return master._actnumsv.reshape(master.dimensions, order="F")
+
+    if master.props:
+        return (~ma.getmaskarray(master.props[0].values)).astype(np.int32)
+    return None
+
+
+def to_table_file(self, tfile, fformat="parquet", **kwargs):
+    """Write the dataframe() table to a Parquet or Arrow IPC file, chunk by chunk.
+
+    Each chunk (see dataframe_chunks) is a row group (Parquet) or a record batch
+    (Arrow), so the whole table is never in memory.
+    """
+
+    if fformat not in TABLE_FORMATS:
+        raise ValueError(
+            "Invalid fformat {}, must be one of {}".format(fformat, TABLE_FORMATS)
+        )
+
+    # pyarrow is optional, and heavy to import, so only imported when needed
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as err:
+        raise ImportError(
+            "Export to {} requires the pyarrow package, which could not be "
+            "imported ({}). Install it with 'pip install pyarrow'".format(fformat, err)
+        )
+
+    schema = None  # from the first chunk, used for all chunks
+    writer = None
+    try:
+        for dfr in dataframe_chunks(self, **kwargs):
+            table = pyarrow.Table.from_pandas(dfr, schema=schema, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                if fformat == "parquet":
+                    writer = pyarrow.parquet.ParquetWriter(tfile, table.schema)
+                else:
+                    writer = pyarrow.ipc.new_file(tfile, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 """Import/export of grid properties (cf GridProperties class)"""
 
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+import numpy.ma as ma
+
 import xtgeo
 
+from xtgeo.common import _ensemble
 from xtgeo.grid3d import _gridprop_import_eclrun
 
 from .grid_property import GridProperty
 from . import _grid3d_utils as utils
+from . import _gridprop_etc
 
 xtg = xtgeo.XTGeoDialog()
 
@@ -14,11 +22,21 @@ logger = xtg.functionlogger(__name__)
 
 
 def import_ecl_output(
-    props, pfile, names=None, dates=None, grid=None, namestyle=0
+    props,
+    pfile,
+    names=None,
+    dates=None,
+    grid=None,
+    namestyle=0,
+    lazy=False,
+    maxmemory=None,
+    precision="double",
 ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 
     logger.debug("'namestyle' is %s (not in use)", namestyle)
 
+    _gridprop_etc.check_precision(precision)
+
     if not grid:
         raise ValueError("Grid Geometry object is missing")
 
@@ -26,18 +44,12 @@ def import_ecl_output(
         raise ValueError("Name list is empty (None)")
 
     local_fhandle = False
-    fhandle = pfile
     if not isinstance(pfile, xtgeo._XTGeoCFile):
         pfile = xtgeo._XTGeoCFile(pfile)
-        fhandle = pfile.fhandle
         local_fhandle = True
 
-    # scan valid keywords
-    kwlist = utils.scan_keywords(
-        fhandle, fformat="xecl", maxkeys=100000, dataframe=True, dates=True
-    )
-
-    kwxlist = list(kwlist.itertuples(index=False, name=None))
+    # scan valid keywords, once; the catalog gives constant time lookups later
+    kwlist = utils.scan_ecl_catalog(pfile, maxkeys=100000)
 
     usenames = list()
 
@@ -45,9 +57,8 @@ def import_ecl_output(
         nact = grid.nactive
         ntot = grid.ntotal
 
-        for kw in kwxlist:
-            kwname, _tmp1, nlen, _bs, _date = kw
-            if nlen in (nact, ntot):
+        for kwname, _tmp1, nlen, _bs, _date in kwlist.records:
+            if nlen in (nact, ntot) and kwname not in usenames:
                 usenames.append(kwname)
     else:
         usenames = list(names)
@@ -56,19 +67,15 @@ def import_ecl_output(
 
     lookfornames = list(set(usenames))
 
-    possiblekw = []
     for name in lookfornames:
-        namefound = False
-        for kwitem in kwxlist:
-            possiblekw.append(kwitem[0])
-            if name == kwitem[0]:
-                namefound = True
-        if not namefound:
+        if not kwlist.has_keyword(name):
             if name in ("SOIL", "SGAS", "SWAT"):
                 pass  # check for sat's later; may be derived based on fluid system
             else:
                 raise ValueError(
-                    "Keyword {} not found. Possible list: {}".format(name, possiblekw)
+                    "Keyword {} not found. Possible list: {}".format(
+                        name, kwlist.keywords
+                    )
                 )
 
     # check valid dates, and remove invalid entries (allowing that user
@@ -76,15 +83,9 @@ def import_ecl_output(
 
     validdates = [None]
     if dates:
-        dlist = utils.scan_dates(fhandle)
+        alldates = [str(dte) for dte in kwlist.dates]
 
-        validdates = []
-        alldates = []
-        for date in dates:
-            for ditem in dlist:
-                alldates.append(str(ditem[1]))
-                if str(date) == str(ditem[1]):
-                    validdates.append(date)
+        validdates = [date for date in dates if kwlist.has_date(date)]
 
         if not validdates:
             msg = "No valid dates given (dates: {} vs {})".format(dates, alldates)
@@ -105,14 +106,113 @@ def import_ecl_output(
     logger.info("Use names: %s", use2names)
     logger.info("Valid dates: %s", validdates)
 
+    if lazy and pfile.memstream:
+        xtg.warn("Lazy import is not possible for memory streams, will read all")
+        lazy = False
+
+    if lazy and grid.dualporo:
+        xtg.warn("Lazy import is not supported for dual porosity, will read all")
+        lazy = False
+
+    if lazy:
+        _import_ecl_output_lazy(
+            props, pfile, kwlist, use2names, validdates, grid, maxmemory, precision
+        )
+    elif grid.dualporo:
+        _import_ecl_output_each(
+            props, pfile, kwlist, use2names, validdates, grid, precision
+        )
+    else:
+        _import_ecl_output_batch(
+            props, pfile, kwlist, use2names, validdates, grid, precision
+        )
+
+    if validdates[0] != 0:
+        props._dates = validdates
+
+    if local_fhandle:
+        pfile.close()
+
+
+def import_ensemble(
+    pfiles,
+    name,
+    fformat="roff",
+    grid=None,
+    date=None,
+    workers=1,
+    executor="process",
+    precision="double",
+):
+    """Import the same property from many files (realisations) concurrently.
+
+    The grid may be None (ROFF), a Grid instance or a grid file name which is
+    used for all, or a list of such with one entry per file.
+    """
+
+    pfiles = list(pfiles)
+
+    if isinstance(grid, (list, tuple)):
+        if len(grid) != len(pfiles):
+            raise ValueError(
+                "Length of grid list ({}) differs from number of files ({})".format(
+                    len(grid), len(pfiles)
+                )
+            )
+        grids = list(grid)
+    else:
+        grids = [grid] * len(pfiles)
+
+    jobs = [
+        (pfile, name, fformat, grd, date, precision)
+        for pfile, grd in zip(pfiles, grids)
+    ]
+
+    result = _ensemble.load_many(
+        _import_ensemble_member, jobs, workers=workers, executor=executor
+    )
+
+    arrays = [values for values, _meta in result]
+    metadata = [meta for _values, meta in result]
+    for num, meta in enumerate(metadata):
+        meta["realisation"] = num
+
+    return _ensemble.stack_values(arrays), metadata
+
+
+def _import_ensemble_member(job):
+    # module level function, so it can be used in a process pool
+    pfile, name, fformat, grid, date, precision = job
+
+    if grid is not None and not isinstance(grid, xtgeo.Grid):
+        grid = xtgeo.grid_from_file(grid)
+
+    prop = GridProperty()
+    prop.from_file(
+        pfile, fformat=fformat, name=name, grid=grid, date=date, precision=precision
+    )
+
+    metadata = {
+        "name": prop.name,
+        "filesrc": pfile,
+        "date": prop.date,
+        "isdiscrete": prop.isdiscrete,
+        "dimensions": (prop.ncol, prop.nrow, prop.nlay),
+    }
+    return prop.values, metadata
+
+
+def _import_ecl_output_each(
+    props, pfile, kwlist, usenames, validdates, grid, precision="double"
+):
+    """Import each (name, date) property separately (needed for dual porosity)"""
+
     # now import each property
     firstproperty = True
 
     for date in validdates:
-        # xprop = dict()
-        # soil_ok = False
 
-        for name in use2names:
+        for name in usenames:
 
             logger.info("Get %s", name)
 
@@ -124,13 +224,13 @@ def import_ecl_output(
                 propname = name + "_" + str(date)
                 etype = 5
 
-            prop = GridProperty()
+            prop = GridProperty(precision=precision)
 
             # use a private GridProperty function here, for convinience
-            # (since filehandle)
+            # (since file is open and scanned)
             _gridprop_import_eclrun.import_eclbinary(
                 prop,
-                fhandle,
+                pfile,
                 name=name,
                 date=date,
                 grid=grid,
@@ -151,8 +251,340 @@ def import_ecl_output(
     props._nrow = nrow
     props._nlay = nlay
 
-    if validdates[0] != 0:
-        props._dates = validdates
 
-    if local_fhandle:
-        pfile.close()
+def _import_ecl_output_batch(
+    props, pfile, kwlist, usenames, validdates, grid, precision="double"
+):
+    """Import all (name, date) properties, reading records in file order.
+
+    Metadata and grid ACTNUM arrays are found once. All records that are needed
+    are sorted on byte position and read in that order; each record is still
+    read (mapped) separately by the record reader, so the file is not opened
+    once only. Saturations that must be derived from others (e.g. SOIL from SWAT
+    and SGAS) are computed in place per date, see _derive_saturations(). Result
+    is the same as for _import_ecl_output_each().
+    """
+
+    etype = 1 if validdates[0] is None else 5
+
+    first = GridProperty()
+    metadata = _gridprop_import_eclrun._import_eclbinary_meta(
+        first, pfile, kwlist, etype, validdates[0], grid
+    )
+    _gridprop_import_eclrun._import_eclbinary_checks1(first, grid)
+    ncol, nrow, nlay = first.dimensions
+
+    gact = _gridprop_import_eclrun._grid_actnum_arrays(grid)
+    _checks2 = _gridprop_import_eclrun._import_eclbinary_checks2
+
+    # make a plan; recipe per property, and the records to read (kwname, date)
+    plan = []
+    records = {}
+    for date in validdates:
+        for name in usenames:
+            if name in SATURATIONS:
+                recipe, sources = _saturation_recipe(kwlist, metadata, name, date)
+            else:
+                recipe, sources = "read", (name,)
+
+            plan.append((name, date, recipe))
+            for source in sources:
+                if (source, date) not in records:
+                    records[(source, date)] = _checks2(kwlist, source, etype, date)
+
+    # read records in order of byte position, one record read per item
+    raw = {}
+    for (source, date), kwitem in sorted(records.items(), key=lambda it: it[1][3]):
+        kwname, kwlen, kwtype, kwbyte = kwitem
+        logger.info("Reading %s for date %s at byte %s", kwname, date, kwbyte)
+        prop = _empty_prop(ncol, nrow, nlay, precision)
+        _gridprop_import_eclrun._import_eclbinary_prop(
+            prop,
+            grid,
+            pfile,
+            kwname,
+            kwlen,
+            kwtype,
+            kwbyte,
+            source,
+            date,
+            etype,
+            _gact=gact,
+        )
+        raw[(source, date)] = prop
+
+    derived = _derive_saturations(plan, raw, gact[0])
+
+    used = set()
+    for name, date, recipe in plan:
+        if recipe == "read":
+            prop = raw[(name, date)]
+            if (name, date) in used:
+                prop = prop.copy()  # in case of repeated names
+            used.add((name, date))
+        else:
+            prop = _empty_prop(ncol, nrow, nlay, precision)
+            prop._name = name + "_" + str(date)
+            prop._date = date
+            prop._values = derived[(name, date)]
+
+        _gridprop_etc.apply_precision(prop)
+
+        propname = name if date is None else name + "_" + str(date)
+        logger.info("Appended property %s", propname)
+        props._names.append(propname)
+        props._props.append(prop)
+
+    props._ncol = ncol
+    props._nrow = nrow
+    props._nlay = nlay
+
+
+def _import_ecl_output_lazy(
+    props, pfile, kwlist, usenames, validdates, grid, maxmemory, precision="double"
+):
+    """Make GridProperty instances where values are loaded on first access.
+
+    Only metadata (name, date, discrete or not) is set here, from the keyword
+    catalog. The values are read by record lookup when needed, and with
+    maxmemory (GB) given, the least recently used values are released when the
+    total memory of loaded values exceeds the budget.
+    """
+
+    budget = None
+    if maxmemory is not None:
+        budget = _LazyValuesBudget(maxmemory)
+
+    fname = pfile.name
+
+    for date in validdates:
+        etype = 1 if date is None else 5
+
+        for name in usenames:
+            prop = _empty_prop(grid.ncol, grid.nrow, grid.nlay, precision)
+            prop._name = name
+            prop._filesrc = fname
+
+            if name not in SATURATIONS:
+                # fail early if not present; also get type
+                kwtype = _gridprop_import_eclrun._import_eclbinary_checks2(
+                    kwlist, name, etype, date
+                )[2]
+                prop._isdiscrete = kwtype == "INTE"
+
+            propname = name
+            if date is not None:
+                propname = name + "_" + str(date)
+                prop._name = propname
+                prop._date = date
+
+            prop._values = None
+            prop._lazysource = _LazyEclSource(fname, kwlist, grid, name, date, budget)
+
+            props._names.append(propname)
+            props._props.append(prop)
+
+    props._ncol = grid.ncol
+    props._nrow = grid.nrow
+    props._nlay = grid.nlay
+
+
+class _LazyEclSource(object):
+    """Where and how to load values for a lazy GridProperty from INIT/UNRST."""
+
+    def __init__(self, fname, kwlist, grid, name, date, budget=None):
+        self._fname = fname
+        self._kwlist = kwlist
+        self._grid = grid
+        self._name = name
+        self._date = date
+        self._budget = budget
+        self._loaded = None  # the values array as loaded (to detect replacement)
+        self._checksum = None  # of the values as loaded (to detect changes)
+        self._pinned = False  # True if values are changed; never released
+
+    def touch(self, prop):
+        """Load values if needed, and mark as recently used"""
+
+        if prop._values is None:
+            logger.info("Lazy loading of %s, date %s", self._name, self._date)
+            propname = prop._name
+            _gridprop_import_eclrun.import_eclbinary(
+                prop,
+                self._fname,
+                name=self._name,
+                etype=1 if self._date is None else 5,
+                date=self._date,
+                grid=self._grid,
+                _kwlist=self._kwlist,
+            )
+            prop._name = propname  # keep the name_date style from the import
+            self._loaded = prop._values
+            self._pinned = False
+            if self._budget is not None:
+                self._checksum = _values_checksum(prop._values)
+
+        if self._budget is not None and not self._pinned:
+            self._budget.touch(prop)
+
+    def releasable(self, prop):
+        """Values can be released if still as loaded, i.e. not replaced or
+        changed in place by user. If not, the values are pinned (kept)."""
+        if prop._values is None:
+            return False
+
+        if prop._values is not self._loaded or (
+            _values_checksum(prop._values) != self._checksum
+        ):
+            logger.info("Values for %s are changed, keep them", prop.name)
+            self._pinned = True
+            return False
+
+        return True
+
+    def release(self, prop):
+        prop._values = None
+        self._loaded = None
+        self._checksum = None
+
+
+def _values_checksum(values):
+    """A cheap checksum of (masked) values, to detect changes in place."""
+
+    checksum = zlib.adler32(np.ascontiguousarray(ma.getdata(values)))
+    mask = np.ascontiguousarray(ma.getmaskarray(values))
+    return zlib.adler32(mask, checksum)
+
+
+class _LazyValuesBudget(object):
+    """Least recently used (LRU) bookkeeping of loaded lazy values.
+
+    Values which are replaced (e.g. ``prop.values = prop.values + 1``) or
+    changed in place (e.g. ``prop.values += 1``) are not released, and are
+    not counted from then on.
+    """
+
+    def __init__(self, maxmemory):
+        self._maxbytes = int(maxmemory * 1024 * 1024 * 1024)
+        self._used = OrderedDict()  # id(prop) -> (prop, nbytes), oldest first
+
+    @property
+    def nbytes(self):
+        """Total bytes of values currently loaded and tracked"""
+        return sum(nbytes for _prop, nbytes in self._used.values())
+
+    def touch(self, prop):
+        key = id(prop)
+        if key in self._used:
+            self._used[key] = self._used.pop(key)  # now the most recent
+            return
+
+        values = prop._values
+        nbytes = values.nbytes + np.ma.getmaskarray(values).nbytes
+        self._used[key] = (prop, nbytes)
+        self._release_until_within()
+
+    def _release_until_within(self):
+        total = self.nbytes
+        for key in list(self._used.keys())[:-1]:  # never release the newest
+            if total <= self._maxbytes:
+                break
+            prop, nbytes = self._used.pop(key)
+            if prop._lazysource.releasable(prop):
+                logger.info("Release values for %s (memory budget)", prop.name)
+                prop._lazysource.release(prop)
+            total -= nbytes
+
+
+SATURATIONS = ("SWAT", "SGAS", "SOIL")
+
+
+def _empty_prop(ncol, nrow, nlay, precision="double"):
+    """A GridProperty instance with dimensions set, but no values allocated"""
+
+    prop = GridProperty(precision=precision)
+    prop._ncol = ncol
+    prop._nrow = nrow
+    prop._nlay = nlay
+    return prop
+
+
+def _saturation_recipe(kwlist, metadata, name, date):
+    """Find how to get a saturation at a date, depending on fluid system.
+
+    This follows the rules in _gridprop_import_eclrun (_import_swat etc).
+
+    Returns:
+        Tuple (recipe, sources) where recipe is "read", a formula such as
+        "1-SWAT", or "const1" or "const0", and sources are the keywords to read.
+    """
+
+    phases = metadata["IPHS"]
+    exists = kwlist.has(name, date)
+
+    if name == "SWAT":
+        if exists or phases in (0, 3, 6, 7, -2345):
+            return "read", ("SWAT",)
+        return ("const1" if phases == 2 else "const0"), ()
+
+    if name == "SGAS":
+        if exists or phases in (0, 5, 7, -2345):
+            return "read", ("SGAS",)
+        if phases == 6:
+            return "1-SWAT", ("SWAT",)
+        return ("const1" if phases == 4 else "const0"), ()
+
+    # SOIL
+    if not exists and metadata["SIMULATOR"] != "E100":
+        phases = 7  # just assume this; hope its works...
+
+    if exists or phases in (0, -2345):
+        return "read", ("SOIL",)
+    if phases == 7:
+        return "1-SWAT-SGAS", ("SWAT", "SGAS")
+    if phases == 5:
+        return "1-SGAS", ("SGAS",)
+    if phases == 3:
+        return "1-SWAT", ("SWAT",)
+    return ("const1" if phases == 1 else "const0"), ()
+
+
+def _derive_saturations(plan, raw, gactnum):
+    """Compute derived/constant saturations, one (name, date) at a time.
+
+    E.g. SOIL = 1 - SWAT - SGAS is made as a running sum of the sources in one
+    array per date, which is then updated in place, so no temporary copies of
+    the source arrays (or stacks of them across dates) are made.
+
+    Returns:
+        Dictionary (name, date) -> masked 3D array
+    """
+
+    inactive = gactnum < 1
+    result = {}
+
+    for name, date, recipe in plan:
+        if recipe == "read" or (name, date) in result:
+            continue
+
+        if recipe.startswith("const"):
+            value = 1.0 if recipe == "const1" else 0.0
+            vals = np.full(gactnum.shape, value, dtype=np.float64)
+            result[(name, date)] = ma.masked_where(inactive, vals)
+            continue
+
+        sources = [raw[(src, date)].values for src in ("SWAT", "SGAS") if src in recipe]
+
+        mask = inactive.copy()
+        vals = np.zeros(gactnum.shape, dtype=np.float64)
+        for source in sources:
+            np.add(vals, ma.getdata(source), out=vals)
+            mask |= ma.getmaskarray(source)
+
+        np.subtract(1.0, vals, out=vals)
+        if recipe == "1-SWAT-SGAS":
+            np.clip(vals, 0.0, 1.0, out=vals)
+
+        result[(name, date)] = ma.array(vals, mask=mask, copy=False)
+
+    return result
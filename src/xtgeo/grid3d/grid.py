@@ -22,6 +22,8 @@ from . import _grid_import
 from . import _grid_export
 from . import _grid_refine
 from . import _grid_etc1
+from . import _grid_cellindex
+from . import _grid_cache
 from . import _grid3d_fence
 from . import _grid_roxapi
 from . import _gridprop_lowlevel
@@ -182,9 +184,10 @@ class Grid(Grid3D):
         self._roxgrid = None
         self._roxindexer = None
 
-        # For storage of more private stuff in order to speed up certain functions
-        # See _grid3d_fence for instance; note! reset this if any kind of grid change!
-        self._tmp = {}
+        # For storage of more private stuff in order to speed up certain functions,
+        # e.g. derived properties and the cell index. This is cleared, and the
+        # generation increased, by _geometry_changed() if the geometry changes!
+        self._geomcache = _grid_cache._GeometryCache()
 
         if len(args) == 1:
             # make an instance directly through import of a file
@@ -486,6 +489,29 @@ class Grid(Grid3D):
 
         return self._roxindexer
 
+    @property
+    def geometry_generation(self):
+        """int: Counter which increases every time the grid geometry is changed
+        (read only).
+
+        Values derived from the geometry (e.g. from :meth:`get_dz` or
+        :meth:`get_xyz`) are cached, and kept until the generation changes.
+        See also :meth:`get_cache_info` and :meth:`clear_cache`.
+
+        .. versionadded:: 2.8.0
+        """
+        return self._geomcache.generation
+
+    @property
+    def _tmp(self):
+        # the geometry cache, kept as _tmp for backward compatibility
+        return self._geomcache
+
+    @_tmp.setter
+    def _tmp(self, value):
+        self._geometry_changed()
+        self._geomcache.update(value)
+
     # ==================================================================================
     # Create/import/export
     # ==================================================================================
@@ -525,7 +551,7 @@ class Grid(Grid3D):
             rotation=rotation,
             flip=flip,
         )
-        self._tmp = {}
+        self._geometry_changed()
 
     def from_file(
         self, gfile, fformat=None, initprops=None, restartprops=None, restartdates=None,
@@ -566,7 +592,7 @@ class Grid(Grid3D):
             restartprops=restartprops,
             restartdates=restartdates,
         )
-        self._tmp = {}
+        self._geometry_changed()
 
         return obj
 
@@ -624,7 +650,7 @@ class Grid(Grid3D):
         _grid_roxapi.import_grid_roxapi(
             self, projectname, gname, realisation, dimensions_only, info
         )
-        self._tmp = {}
+        self._geometry_changed()
 
     def to_roxar(self, projectname, gname, realisation=0, info=False, method="cpg"):
         """Export a grid to RMS via Roxar API (in prep.)"""
@@ -763,6 +789,89 @@ class Grid(Grid3D):
             grid=self,
         )
 
+    def get_dataframe_chunks(
+        self,
+        activeonly=True,
+        ijk=True,
+        xyz=True,
+        doubleformat=False,
+        chunksize=1000000,
+        dtypes=None,
+    ):
+        """Returns a generator of Pandas dataframes for the grid and any attached
+        grid properties, in chunks of grid columns.
+
+        This is :meth:`get_dataframe` split in chunks, so that memory use is
+        bounded by the chunk size rather than the grid size. See
+        :meth:`GridProperties.get_dataframe_chunks` for the chunksize and
+        dtypes keys.
+
+        Example::
+
+            for num, dfr in enumerate(grd.get_dataframe_chunks()):
+                dfr.to_csv("mygrid.csv", mode="a", header=num == 0, index=False)
+
+        .. versionadded:: 2.8.0
+        """
+
+        gridprops = self.gridprops
+        if gridprops is None:
+            gridprops = xtgeo.grid3d.GridProperties(
+                ncol=self.ncol, nrow=self.nrow, nlay=self.nlay
+            )
+
+        return gridprops.get_dataframe_chunks(
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=self,
+            chunksize=chunksize,
+            dtypes=dtypes,
+        )
+
+    def to_table_file(
+        self,
+        tfile,
+        fformat="parquet",
+        activeonly=True,
+        ijk=True,
+        xyz=True,
+        doubleformat=False,
+        chunksize=1000000,
+        dtypes=None,
+    ):
+        """Export the :meth:`get_dataframe` table to a Parquet or Arrow file.
+
+        The table is written chunk by chunk, see
+        :meth:`GridProperties.to_table_file`. This requires the pyarrow package.
+
+        Example::
+
+            grd.gridprops = props  # attach properties to grid
+            grd.to_table_file("mygrid.parquet")
+
+        .. versionadded:: 2.8.0
+        """
+
+        gridprops = self.gridprops
+        if gridprops is None:
+            gridprops = xtgeo.grid3d.GridProperties(
+                ncol=self.ncol, nrow=self.nrow, nlay=self.nlay
+            )
+
+        gridprops.to_table_file(
+            tfile,
+            fformat=fformat,
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=self,
+            chunksize=chunksize,
+            dtypes=dtypes,
+        )
+
     dataframe = get_dataframe  # backward compatibility...
 
     def append_prop(self, prop):
@@ -1032,6 +1141,7 @@ class Grid(Grid3D):
         val1d = actnum.values.ravel(order="K")
 
         self._actnumsv = _gridprop_lowlevel.c2f_order(self, val1d)
+        self._geometry_changed()
 
     def get_dz(self, name="dZ", flip=True, asmasked=True, mask=None):
         """
@@ -1053,7 +1163,14 @@ class Grid(Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        deltaz = _grid_etc1.get_dz(self, name=name, flip=flip, asmasked=asmasked)
+        deltaz = _grid_cache.memoized(
+            self,
+            ("dz", name, flip, asmasked),
+            _grid_etc1.get_dz,
+            name=name,
+            flip=flip,
+            asmasked=asmasked,
+        )
 
         return deltaz
 
@@ -1072,7 +1189,13 @@ class Grid(Grid3D):
             Two XTGeo GridProperty objects (dx, dy)
         """
 
-        deltax, deltay = _grid_etc1.get_dxdy(self, names=names, asmasked=asmasked)
+        deltax, deltay = _grid_cache.memoized(
+            self,
+            ("dxdy", tuple(names), asmasked),
+            _grid_etc1.get_dxdy,
+            names=names,
+            asmasked=asmasked,
+        )
 
         # return the property objects
         return deltax, deltay
@@ -1113,8 +1236,13 @@ class Grid(Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        ixc, jyc, kzc = _grid_etc1.get_ijk(
-            self, names=names, asmasked=asmasked, zerobased=zerobased
+        ixc, jyc, kzc = _grid_cache.memoized(
+            self,
+            ("ijk", tuple(names), asmasked, zerobased),
+            _grid_etc1.get_ijk,
+            names=names,
+            asmasked=asmasked,
+            zerobased=zerobased,
         )
 
         # return the objects
@@ -1127,12 +1255,18 @@ class Grid(Grid3D):
         zerobased=False,
         dataframe=True,
         includepoints=True,
+        workers=1,
+        executor="process",
     ):
         """Returns a list/dataframe of cell indices based on a Points()
         instance
 
         If a point is outside the grid, -1 values are returned
 
+        The lookup uses a cell index (a one layer grid and maps of I J
+        columns) which is made at first call and then kept with the grid
+        until the geometry changes. See also :meth:`cellindex_to_file`.
+
         Args:
             points (Points): A XTGeo Points instance
             activeonly (bool): If True, UNDEF cells are not included
@@ -1140,8 +1274,14 @@ class Grid(Grid3D):
             dataframe (bool): If True result is Pandas dataframe, otherwise a list
                 of tuples
             includepoints (bool): If True, include the input points in result
+            workers (int): Number of workers to locate the points in parallel,
+                default is 1 (serial).
+            executor (str): "process" (default) or "thread". The points are
+                located in C code that holds the Python GIL, hence "process"
+                is needed for a speedup.
 
         .. versionadded:: 2.6.0
+        .. versionchanged:: 2.8.0 Added workers and executor, reuse cell index
         """
 
         ijklist = _grid_etc1.get_ijk_from_points(
@@ -1151,11 +1291,42 @@ class Grid(Grid3D):
             zerobased=zerobased,
             dataframe=dataframe,
             includepoints=includepoints,
+            workers=workers,
+            executor=executor,
         )
 
         # return the dataframe or list of tuples
         return ijklist
 
+    def cellindex_to_file(self, mfile):
+        """Store the cell index used for point lookups (numpy npz format).
+
+        The index is made first if needed. Reading it back with
+        :meth:`cellindex_from_file` for the same grid geometry will save the
+        time to make it, e.g. in a later session.
+
+        Args:
+            mfile (str): Name of file, normally with extension .npz
+
+        .. versionadded:: 2.8.0
+        """
+
+        _grid_cellindex.cellindex_to_file(self, mfile)
+
+    def cellindex_from_file(self, mfile):
+        """Use a cell index stored by :meth:`cellindex_to_file`.
+
+        Args:
+            mfile (str): Name of file
+
+        Raises:
+            ValueError: If the index was made for another grid geometry.
+
+        .. versionadded:: 2.8.0
+        """
+
+        _grid_cellindex.cellindex_from_file(self, mfile)
+
     def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True, mask=None):
         """Returns 3 xtgeo.grid3d.GridProperty objects: x coordinate,
         ycoordinate, zcoordinate.
@@ -1175,8 +1346,12 @@ class Grid(Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        xcoord, ycoord, zcoord = _grid_etc1.get_xyz(
-            self, names=names, asmasked=asmasked
+        xcoord, ycoord, zcoord = _grid_cache.memoized(
+            self,
+            ("xyz", tuple(names), asmasked),
+            _grid_etc1.get_xyz,
+            names=names,
+            asmasked=asmasked,
         )
 
         # return the objects
@@ -1261,6 +1436,7 @@ class Grid(Grid3D):
             RunetimeError if corners has wrong spesification
         """
 
+        # not cached, as 24 properties would be kept (and copied) per grid
         grid_props = _grid_etc1.get_xyz_corners(self, names=names)
 
         # return the 24 objects in a long tuple (x1, y1, z1, ... x8, y8, z8)
@@ -1331,8 +1507,10 @@ class Grid(Grid3D):
 
         """
 
-        gresult = _grid_etc1.get_geometrics(
+        gresult = _grid_cache.memoized(
             self,
+            ("geometrics", allcells, cellcenter, return_dict, _ver),
+            _grid_etc1.get_geometrics,
             allcells=allcells,
             cellcenter=cellcenter,
             return_dict=return_dict,
@@ -1376,13 +1554,13 @@ class Grid(Grid3D):
         actnum.values = np.ones(self.dimensions, dtype=np.int32)
 
         self.set_actnum(actnum)
-        self._tmp = {}
+        self._geometry_changed()
 
     def inactivate_by_dz(self, threshold):
         """Inactivate cells thinner than a given threshold."""
 
         _grid_etc1.inactivate_by_dz(self, threshold)
-        self._tmp = {}
+        self._geometry_changed()
 
     def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=False):
         """Inacativate grid inside a polygon.
@@ -1406,7 +1584,7 @@ class Grid(Grid3D):
         _grid_etc1.inactivate_inside(
             self, poly, layer_range=layer_range, inside=inside, force_close=force_close
         )
-        self._tmp = {}
+        self._geometry_changed()
 
     def inactivate_outside(self, poly, layer_range=None, force_close=False):
         """Inacativate grid outside a polygon. (cf inactivate_inside)"""
@@ -1414,13 +1592,13 @@ class Grid(Grid3D):
         self.inactivate_inside(
             poly, layer_range=layer_range, inside=False, force_close=force_close
         )
-        self._tmp = {}
+        self._geometry_changed()
 
     def collapse_inactive_cells(self):
         """ Collapse inactive layers where, for I J with other active cells."""
 
         _grid_etc1.collapse_inactive_cells(self)
-        self._tmp = {}
+        self._geometry_changed()
 
     def crop(self, colcrop, rowcrop, laycrop, props=None):
         """Reduce the grid size by cropping, the grid will have new dimensions.
@@ -1451,7 +1629,7 @@ class Grid(Grid3D):
         """
 
         _grid_etc1.crop(self, (colcrop, rowcrop, laycrop), props=props)
-        self._tmp = {}
+        self._geometry_changed()
 
     def reduce_to_one_layer(self):
         """Reduce the grid to one single layer.
@@ -1469,7 +1647,7 @@ class Grid(Grid3D):
         """
 
         _grid_etc1.reduce_to_one_layer(self)
-        self._tmp = {}
+        self._geometry_changed()
 
     def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
         """Translate (move) and/or flip grid coordinates in 3D.
@@ -1486,7 +1664,7 @@ class Grid(Grid3D):
         """
 
         _grid_etc1.translate_coordinates(self, translate=translate, flip=flip)
-        self._tmp = {}
+        self._geometry_changed()
 
     def reverse_row_axis(self, ijk_handedness=None):
         """Reverse the row axis (J indices).
@@ -1518,7 +1696,7 @@ class Grid(Grid3D):
         """
 
         _grid_etc1.reverse_row_axis(self, ijk_handedness=ijk_handedness)
-        self._tmp = {}
+        self._geometry_changed()
 
     def make_zconsistent(self, zsep=1e-5):
         """Make the 3D grid consistent in Z, by a minimal gap (zsep).
@@ -1528,7 +1706,7 @@ class Grid(Grid3D):
         """
 
         _grid_etc1.make_zconsistent(self, zsep)
-        self._tmp = {}
+        self._geometry_changed()
 
     def convert_to_hybrid(
         self,
@@ -1571,7 +1749,7 @@ class Grid(Grid3D):
             region=region,
             region_number=region_number,
         )
-        self._tmp = {}
+        self._geometry_changed()
 
     def refine_vertically(self, rfactor, zoneprop=None):
         """Refine vertically, proportionally
@@ -1622,7 +1800,7 @@ class Grid(Grid3D):
         """
 
         _grid_refine.refine_vertically(self, rfactor, zoneprop=zoneprop)
-        self._tmp = {}
+        self._geometry_changed()
 
     def report_zone_mismatch(
         self,
@@ -1778,10 +1956,35 @@ class Grid(Grid3D):
         logger.info("Getting randomline... DONE")
         return res
 
+    # ==================================================================================
+    # Cache of values derived from the geometry
+    # ==================================================================================
+    def get_cache_info(self):
+        """Return info on values cached for the current grid geometry.
+
+        Returns:
+            A dict with "generation" (see :attr:`geometry_generation`), "keys"
+            (list of cached items) and "nbytes" (approximate memory use)
+
+        .. versionadded:: 2.8.0
+        """
+        return self._geomcache.info()
+
+    def clear_cache(self):
+        """Clear values cached for the current grid geometry, e.g. to free memory.
+
+        .. versionadded:: 2.8.0
+        """
+        self._geomcache.clear()
+
     # ----------------------------------------------------------------------------------
     # Private function
     # ----------------------------------------------------------------------------------
 
+    def _geometry_changed(self):
+        # shall be called when COORD, ZCORN or ACTNUM are changed
+        self._geomcache.bump()
+
     # def _evaluate_mask(self, mask):  # pylint: disable=useless-super-delegation
     #     # need to delegate since the base class is abstract
     #     return super(Grid, self)._evaluate_mask(mask)  # in super class
@@ -246,7 +246,16 @@ class GridProperties(Grid3D):
     # for some file types such as Eclipse INIT and UNRST, and Roff
 
     def from_file(
-        self, pfile, fformat="roff", names=None, dates=None, grid=None, namestyle=0
+        self,
+        pfile,
+        fformat="roff",
+        names=None,
+        dates=None,
+        grid=None,
+        namestyle=0,
+        lazy=False,
+        maxmemory=None,
+        precision="double",
     ):
         """Import grid properties from file in one go.
 
@@ -263,17 +272,36 @@ class GridProperties(Grid3D):
             grid (obj): The grid geometry object (optional if ROFF)
             namestyle (int): 0 (default) for style SWAT_20110223,
                 1 for SWAT--2011_02_23 (applies to restart only)
+            lazy (bool): If True (INIT/UNRST only), only metadata are read
+                here, and the values of each property are read from file
+                when first accessed.
+            maxmemory (float): For lazy import, an optional memory budget in
+                GB for loaded values. When exceeded, the values of the least
+                recently used properties are released, to be read again if
+                needed. Values that are changed (in place or by assigning a
+                new array) are kept, and are then no longer counted.
+            precision (str): Storage precision of the values, "double"
+                (default) or "single", see :attr:`GridProperty.precision`.
 
         Example::
             >>> props = GridProperties()
             >>> props.from_file('ECL.UNRST', fformat='unrst',
                 dates=[20110101, 20141212], names=['PORO', 'DZ']
 
+        Example of a lazy import, where only SWAT for the dates actually used
+        will be read::
+
+            >>> props = GridProperties()
+            >>> props.from_file('ECL.UNRST', fformat='unrst', names=['SWAT'],
+                dates='all', grid=grd, lazy=True, maxmemory=0.5)
+            >>> swat = props.get_prop_by_name('SWAT_20141212').values
+
         Raises:
             FileNotFoundError: if input file is not found
             ValueError: if a property is not found
             RuntimeWarning: if some dates are not found
 
+        .. versionchanged:: 2.8.0 Added precision key
         """
 
         # work on file extension
@@ -303,12 +331,22 @@ class GridProperties(Grid3D):
         if fformat.lower() == "roff":
             lst = list()
             for name in names:
-                lst.append(GridProperty(pfile, fformat="roff", name=name))
+                lst.append(
+                    GridProperty(pfile, fformat="roff", name=name, precision=precision)
+                )
             self.append_props(lst)
 
         elif fformat.lower() in ("init", "unrst"):
             _gridprops_io.import_ecl_output(
-                self, pfile, dates=dates, grid=grid, names=names, namestyle=namestyle
+                self,
+                pfile,
+                dates=dates,
+                grid=grid,
+                names=names,
+                namestyle=namestyle,
+                lazy=lazy,
+                maxmemory=maxmemory,
+                precision=precision,
             )
         else:
             raise IOError("Invalid file format")
@@ -367,6 +405,93 @@ class GridProperties(Grid3D):
 
     dataframe = get_dataframe  # for compatibility, but deprecated
 
+    def get_dataframe_chunks(
+        self,
+        activeonly=False,
+        ijk=False,
+        xyz=False,
+        doubleformat=False,
+        grid=None,
+        chunksize=_gridprops_etc.CHUNKSIZE,
+        dtypes=None,
+    ):
+        """Returns a generator of Pandas dataframes, in chunks of grid columns.
+
+        The chunks are as :meth:`get_dataframe`, split in slabs of whole I
+        columns (rows are in the same order), so that memory use is bounded by
+        the chunk size rather than the grid size.
+
+        Args:
+            activeonly (bool): If True, return only active cells.
+            ijk (bool): If True, show cell indices, IX JY KZ columns
+            xyz (bool): If True, show cell center coordinates (needs grid).
+            doubleformat (bool): If True, floats are 64 bit, otherwise 32 bit.
+            grid (Grid): The grid geometry object. This is required for the
+                xyz option.
+            chunksize (int): Approximate number of cells per chunk (before
+                active cells are filtered), rounded to whole grid columns.
+            dtypes (dict): Optional numpy dtype per column, e.g.
+                ``{"IX": "int16", "X_UTME": "float32"}``
+
+        Example::
+
+            chunks = props.get_dataframe_chunks(ijk=True, grid=grd)
+            for num, dfr in enumerate(chunks):
+                dfr.to_csv("cells.csv", mode="a", header=num == 0, index=False)
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _gridprops_etc.dataframe_chunks(
+            self,
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=grid,
+            chunksize=chunksize,
+            dtypes=dtypes,
+        )
+
+    def to_table_file(
+        self,
+        tfile,
+        fformat="parquet",
+        activeonly=False,
+        ijk=False,
+        xyz=False,
+        doubleformat=False,
+        grid=None,
+        chunksize=_gridprops_etc.CHUNKSIZE,
+        dtypes=None,
+    ):
+        """Export the :meth:`get_dataframe` table to a Parquet or Arrow file.
+
+        The table is written chunk by chunk (see :meth:`get_dataframe_chunks`),
+        as row groups in Parquet or record batches in Arrow IPC, hence the
+        whole table is never in memory. This requires the pyarrow package.
+
+        Args:
+            tfile (str): Name of file.
+            fformat (str): "parquet" (default) or "arrow" (Arrow IPC file).
+            others: See :meth:`get_dataframe_chunks`.
+
+        .. versionadded:: 2.8.0
+        """
+
+        _gridprops_etc.to_table_file(
+            self,
+            tfile,
+            fformat=fformat,
+            activeonly=activeonly,
+            ijk=ijk,
+            xyz=xyz,
+            doubleformat=doubleformat,
+            grid=grid,
+            chunksize=chunksize,
+            dtypes=dtypes,
+        )
+
     # Static methods (scans etc)
     # Don't make a GridProperties instance inside other XTGeo classes
     # as it make cyclic imports. I.e. use only these functions in clients
@@ -392,6 +517,12 @@ class GridProperties(Grid3D):
         For Eclipse, the byteposition is to the KEYWORD, while for ROFF
         the byte position is to the beginning of the actual data.
 
+        For Eclipse files, the scan can be stored in a sidecar index file
+        which is reused as long as the file size and modification time are
+        unchanged. This is enabled by the environment variable
+        ``XTG_ECLSCAN_CACHE``; set it to 1 to store the index next to the file
+        (e.g. ``ECL.UNRST.xtgidx``), or to the name of a (user) cache folder.
+
         Args:
             pfile (str): Name or a filehandle to file with properties
             fformat (str): xecl (Eclipse INIT, RESTART, ...) or roff for
@@ -416,6 +547,67 @@ class GridProperties(Grid3D):
 
         return dlist
 
+    @staticmethod
+    def ensemble_from_files(
+        pfiles,
+        name,
+        fformat="roff",
+        grid=None,
+        date=None,
+        workers=1,
+        executor="process",
+        precision="double",
+    ):
+        """Import the same property from many files, e.g. realisations.
+
+        The files may be read concurrently in a pool of workers, and the values
+        are returned as one stacked masked numpy array, with shape
+        (nfiles, ncol, nrow, nlay), together with metadata per file.
+
+        Args:
+            pfiles (list): List of file names
+            name (str): Name of property
+            fformat (str): File format, e.g. roff, init or unrst
+            grid: Grid geometry, needed for Eclipse formats. May be a Grid
+                instance or grid file name valid for all files, or a list of
+                such, one per file. In a process pool, a Grid instance
+                will be copied to each worker, so grid file names may be
+                preferred there.
+            date (int): Date on YYYYMMDD form (restart files)
+            workers (int): Number of workers; default is 1, which reads the
+                files one by one without a pool. None means number of CPUs.
+            executor (str): "process" (default) or "thread".
+            precision (str): Storage precision, "double" (default) or
+                "single", which also halves the size of the stacked array.
+
+        Returns:
+            A tuple (stacked, metadata) where metadata is a list of dicts
+            with keys "realisation" (index in stacked), "name", "filesrc",
+            "date", "isdiscrete" and "dimensions".
+
+        Raises:
+            ValueError: If the properties differ in shape.
+
+        Example::
+
+            >>> files = ["real{}/poro.roff".format(rno) for rno in range(100)]
+            >>> stacked, meta = GridProperties.ensemble_from_files(
+                    files, name="PORO", workers=8)
+            >>> pmean = stacked.mean(axis=0)
+
+        .. versionadded:: 2.8.0
+        """
+        return _gridprops_io.import_ensemble(
+            pfiles,
+            name,
+            fformat=fformat,
+            grid=grid,
+            date=date,
+            workers=workers,
+            executor=executor,
+            precision=precision,
+        )
+
     @staticmethod
     def scan_dates(pfile, fformat="unrst", maxdates=1000, dataframe=False):
         """Quick scan dates in a simulation restart file.
@@ -121,6 +121,8 @@ class GridProperty(Grid3D):
         name (str): Name of property.
         discrete (bool): True if discrete property
             (default is false).
+        precision (str): Storage precision of values, "double" (default)
+            or "single", see :attr:`precision`.
 
     Alternatively, the same arguments as the from_file() method
     can be used.
@@ -159,6 +161,8 @@ class GridProperty(Grid3D):
 
     .. versionchanged:: 2.6 Possible to make GridProperty instance directly from Grid()
 
+    .. versionchanged:: 2.8.0 Added precision key
+
     """
 
     def __init__(self, *args, **kwargs):
@@ -182,8 +186,12 @@ class GridProperty(Grid3D):
         self._actnum_indices = None
         self._roxorigin = False  # true if the object comes from the ROXAPI
         self._roxar_dtype = kwargs.get("roxar_dtype", np.float32)
+        self._precision = _gridprop_etc.check_precision(
+            kwargs.get("precision", "double")
+        )
 
         self._values = kwargs.get("values", None)
+        self._lazysource = None  # for values loaded on demand, cf. load_values()
 
         if len(args) == 1:
             # make instance through grid instance or file import
@@ -200,6 +208,8 @@ class GridProperty(Grid3D):
             # make instance purely from kwargs spec
             _gridprop_etc.gridproperty_fromspec(self, **kwargs)
 
+        self._values = _gridprop_etc.storage_values(self, self._values)
+
     def __del__(self):
         # logger.info("DELETING property instance %s", self.name)
         self._values = None
@@ -302,7 +312,7 @@ class GridProperty(Grid3D):
         When setting, note that the the dtype must correspond to the
         `isdiscrete` property.
         """
-        return self._values.dtype
+        return self.values.dtype
 
     @dtype.setter
     def dtype(self, dtype):
@@ -330,6 +340,36 @@ class GridProperty(Grid3D):
         if not okv:
             raise ValueError(msg)
 
+    @property
+    def precision(self):
+        """Return or set the storage precision of values, "double" or "single".
+
+        With "double" (default), continuous values are stored as float64 and
+        discrete values as int32. With "single", continuous values are stored
+        as float32, and discrete values as int16 (codes must then be in range
+        -32768 to 32767). This halves the memory use for large grids; note
+        that Eclipse and ROFF files store float32 anyway.
+
+        The precision is kept when values are set, in import, copy and when
+        converting between discrete and continuous. Values are temporarily
+        cast to float64/int32 only where the C routines need it.
+
+        Example::
+
+            >>> poro = GridProperty("reek.roff", name="PORO", precision="single")
+            >>> poro.values.dtype
+            dtype('float32')
+            >>> poro.precision = "double"  # cast to float64
+
+        .. versionadded:: 2.8.0
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, precision):
+        self.load_values()
+        _gridprop_etc.apply_precision(self, precision)
+
     @property
     def filesrc(self):
         """Return or set file src (if any)"""
@@ -381,15 +421,24 @@ class GridProperty(Grid3D):
 
     @property
     def values(self):
-        """ Return or set the grid property as a masked 3D numpy array"""
+        """ Return or set the grid property as a masked 3D numpy array.
+
+        If the instance is imported lazily (cf. :meth:`GridProperties.from_file`),
+        the values are loaded from file on first access.
+        """
+        if self._lazysource is not None:
+            self._lazysource.touch(self)
         return self._values
 
     @values.setter
     def values(self, values):
 
+        if np.isscalar(values):
+            self.load_values()  # current mask is needed
+
         values = self.ensure_correct_values(self.ncol, self.nrow, self.nlay, values)
 
-        self._values = values
+        self._values = _gridprop_etc.storage_values(self, values)
 
     @property
     def ntotal(self):
@@ -411,7 +460,7 @@ class GridProperty(Grid3D):
     @property
     def values3d(self):
         """For backward compatibility (use values instead)"""
-        return self._values
+        return self.values
 
     @values3d.setter
     def values3d(self, values):
@@ -421,7 +470,7 @@ class GridProperty(Grid3D):
     @property
     def values1d(self):
         """Returns a 1D view of values (masked numpy) (read only)."""
-        return self._values.reshape(-1)
+        return self.values.reshape(-1)
 
     @property
     def undef(self):
@@ -540,6 +589,7 @@ class GridProperty(Grid3D):
         grid=None,
         date=None,
         fracture=False,
+        precision=None,
         _roffapiv=1,
     ):  # _roffapiv for devel.
         """
@@ -562,6 +612,10 @@ class GridProperty(Grid3D):
             fracture (bool): Only applicable for DUAL POROSITY systems, if True
                 then the fracture property is read; if False then the matrix
                 property is read. Names will be appended with "M" or "F"
+            precision (str): Storage precision, "double" or "single" (float32,
+                and int16 for discrete). Default None means the
+                current :attr:`precision` of the instance. With "single",
+                the float32 values in Eclipse and ROFF files are kept as is.
 
         Examples::
 
@@ -575,6 +629,8 @@ class GridProperty(Grid3D):
 
         Returns:
            True if success, otherwise False
+
+        .. versionchanged:: 2.8.0 Added precision key
         """
 
         obj = _gridprop_import.from_file(
@@ -585,6 +641,7 @@ class GridProperty(Grid3D):
             grid=grid,
             date=date,
             fracture=fracture,
+            precision=precision,
             _roffapiv=_roffapiv,
         )
         return obj
@@ -680,7 +737,7 @@ class GridProperty(Grid3D):
         dsc.txt("Codes", self._codes)
         dsc.txt("Shape: NCOL, NROW, NLAY", self.ncol, self.nrow, self.nlay)
         np.set_printoptions(threshold=16)
-        dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
+        dsc.txt("Values", self.values.reshape(-1), self.values.dtype)
         np.set_printoptions(threshold=1000)
         dsc.txt(
             "Values, mean, stdev, minimum, maximum",
@@ -700,6 +757,23 @@ class GridProperty(Grid3D):
 
         return dsc.astext()
 
+    def load_values(self):
+        """Load values from file, in cases where the instance is imported lazily.
+
+        Normally not needed, as values are loaded on first access; see
+        :meth:`GridProperties.from_file` with ``lazy=True``. Does nothing if
+        values already are present.
+
+        .. versionadded:: 2.8.0
+        """
+        if self._lazysource is not None:
+            self._lazysource.touch(self)
+
+    @property
+    def isloaded(self):
+        """True if values are present in memory (False if lazy and not loaded)"""
+        return self._values is not None
+
     def get_npvalues3d(self, fill_value=None):
         """Get a pure numpy copy (not masked) copy of the values, 3D shape.
 
@@ -804,8 +878,9 @@ class GridProperty(Grid3D):
             ncol=self._ncol,
             nrow=self._nrow,
             nlay=self._nlay,
-            values=self._values.copy(),
+            values=self.values.copy(),
             name=newname,
+            precision=self._precision,
         )
 
         xprop.geometry = self._geometry
@@ -821,6 +896,7 @@ class GridProperty(Grid3D):
 
     def mask_undef(self):
         """Make UNDEF values masked."""
+        self.load_values()
         if self._isdiscrete:
             self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_INT_LIMIT)
         else:
@@ -924,8 +1000,8 @@ class GridProperty(Grid3D):
 
         if self.isdiscrete:
             logger.info("Converting to continuous ...")
-            val = self._values.copy()
-            val = val.astype("float64")
+            val = self.values.copy()
+            val = val.astype("float64" if self._precision == "double" else "float32")
             self._values = val
             self._isdiscrete = False
             self._codes = {}
@@ -938,7 +1014,7 @@ class GridProperty(Grid3D):
 
         if not self.isdiscrete:
             logger.info("Converting to discrete ...")
-            val = self._values.copy()
+            val = self.values.copy()
             val = val.astype(np.int32)
             self._values = val
             self._isdiscrete = True
@@ -949,6 +1025,7 @@ class GridProperty(Grid3D):
             codes = {k: str(v) for k, v in codes.items()}  # val as strings
             self._codes = codes
             self._roxar_dtype = np.uint16
+            self._values = _gridprop_etc.storage_values(self, val)
         else:
             logger.info("No need to convert, already discrete")
 
@@ -10,6 +10,7 @@ import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGShowProgress
+from xtgeo.cube import _cube_lazy
 
 xtg = XTGeoDialog()
 
@@ -51,18 +52,64 @@ def slice_cube(
     if not self.compare_topology(other, strict=False):
         raise RuntimeError("Topology of maps differ. Stop!")
 
-    if mask:
-        opt2 = 0
-    else:
-        opt2 = 1
+    cube = _cube_for_surface(cube, other, 0.0)
 
     if deadtraces:
         # set dead traces to cxtgeo UNDEF -> special treatment in the C code
         olddead = cube.values_dead_traces(xtgeo.UNDEF)
 
-    cubeval1d = np.ravel(cube.values, order="C")
+    cubeval1d, usesampling, opt2 = _slice_settings(cube, sampling, mask, snapxy)
+
+    istat, v1d = _slice_cube_1d(
+        self, cube, cubeval1d, other.get_values1d(), usesampling, opt2
+    )
+
+    self.set_values1d(v1d)
+
+    if deadtraces:
+        cube.values_dead_traces(olddead)  # reset value for dead traces
+
+    return istat
+
+
+def _cube_for_surface(cube, surf, zpad):
+    """Return the cube, or if lazy, the part of it needed for slicing along surf.
+
+    The part covers the surface XY corners, and its depth range padded by zpad.
+    """
+
+    if cube.isloaded:
+        return cube
+
+    xcorners, ycorners = _cube_lazy.xy_corners(
+        surf.ncol,
+        surf.nrow,
+        surf.xori,
+        surf.yori,
+        surf.xinc,
+        surf.yinc,
+        surf.rotation,
+        surf.yflip,
+    )
+
+    zmin, zmax = surf.values.min(), surf.values.max()
+    if zmin is ma.masked:
+        zmin, zmax = cube.zori, cube.zori + (cube.nlay - 1) * cube.zinc
+
+    return _cube_lazy.cube_region(
+        cube, xcorners, ycorners, zmin - abs(zpad), zmax + abs(zpad)
+    )
+
 
-    nsurf = self.ncol * self.nrow
+def _slice_settings(cube, sampling, mask, snapxy):
+    """Return the cube values as 1D, and the sampling and mask options for C."""
+
+    if mask:
+        opt2 = 0
+    else:
+        opt2 = 1
+
+    cubeval1d = np.ravel(cube.values, order="C")
 
     usesampling = 0
     if sampling == "trilinear":
@@ -70,6 +117,17 @@ def slice_cube(
         if snapxy:
             usesampling = 2
 
+    return cubeval1d, usesampling, opt2
+
+
+def _slice_cube_1d(surf, cube, cubeval1d, zvalues1d, usesampling, opt2):
+    """Slice the cube along the depths zvalues1d (1D, C order) in surf geometry.
+
+    Returns istat and the sliced values as a 1D numpy (undef as large numbers).
+    """
+
+    nsurf = surf.ncol * surf.nrow
+
     logger.debug("Running method from C... (using typemaps for numpies!:")
     istat, v1d = _cxtgeo.surf_slice_cube(
         cube.ncol,
@@ -84,15 +142,15 @@ def slice_cube(
         cube.rotation,
         cube.yflip,
         cubeval1d,
-        self.ncol,
-        self.nrow,
-        self.xori,
-        self.xinc,
-        self.yori,
-        self.yinc,
-        self.yflip,
-        self.rotation,
-        other.get_values1d(),
+        surf.ncol,
+        surf.nrow,
+        surf.xori,
+        surf.xinc,
+        surf.yori,
+        surf.yinc,
+        surf.yflip,
+        surf.rotation,
+        zvalues1d,
         nsurf,
         usesampling,
         opt2,
@@ -101,12 +159,44 @@ def slice_cube(
     if istat != 0:
         logger.warning("Problem, ISTAT = %s", istat)
 
-    self.set_values1d(v1d)
+    return istat, v1d
+
+
+def _slice_window_levels(
+    this, cube, offsets, sampling, mask, snapxy, deadtraces, progress
+):
+    """Generator which slices the cube at this + offset, one offset at a time.
+
+    The cube is prepared once for all levels, and each level yields the
+    (depths, sliced values) as masked 2D arrays, masked as in set_values1d().
+    """
 
     if deadtraces:
-        cube.values_dead_traces(olddead)  # reset value for dead traces
+        # set dead traces to cxtgeo UNDEF -> special treatment in the C code
+        olddead = cube.values_dead_traces(xtgeo.UNDEF)
 
-    return istat
+    cubeval1d, usesampling, opt2 = _slice_settings(cube, sampling, mask, snapxy)
+
+    try:
+        for num, offset in enumerate(offsets):
+            if progress is not None and num > 0:
+                progress.flush(num - 1)
+
+            zvalues = this.values + offset
+            zvalues1d = ma.filled(zvalues, fill_value=xtgeo.UNDEF).ravel()
+
+            _istat, v1d = _slice_cube_1d(
+                this, cube, cubeval1d, zvalues1d, usesampling, opt2
+            )
+
+            values = ma.array(v1d.reshape((this.ncol, this.nrow)))
+            values = ma.masked_greater(values, this.undef_limit)
+            values = ma.masked_invalid(values)
+
+            yield zvalues, values
+    finally:
+        if deadtraces:
+            cube.values_dead_traces(olddead)  # reset value for dead traces
 
 
 def slice_cube_window(
@@ -172,6 +262,8 @@ def slice_cube_window(
     logger.info("ZRANGE is %s", zrange)
     logger.info("NDIV is set to %s (%s)", ndiv, ndivmode)
 
+    cube = _cube_for_surface(cube, this, zrange)
+
     # This will run slice in a loop within a window. Then, numpy methods
     # are applied to get the attributes
 
@@ -252,54 +344,35 @@ def _slice_constant_window(
     deadtraces=True,
     deletecube=False,
 ):
-    """Slice a window, (constant in vertical extent)."""
-    npcollect = []
-    zcenter = this.copy()
+    """Slice a window, (constant in vertical extent).
 
-    logger.info("Mean W of depth no MIDDLE slice is %s", zcenter.values.mean())
-    zcenter.slice_cube(
-        cube, sampling=sampling, mask=mask, snapxy=snapxy, deadtraces=deadtraces
-    )
-    logger.info("Mean of cube slice is %s", zcenter.values.mean())
-
-    npcollect.append(zcenter.values)
+    The cube is sliced at 2 * ndiv + 1 levels, and the attributes are
+    accumulated level by level, i.e. the slices are not stacked in memory.
+    """
 
     zincr = zrange / float(ndiv)
 
     logger.info("ZINCR is %s", zincr)
 
-    # collect above the original surface
+    # the center, then above and below the original surface
+    offsets = [0.0]
+    offsets += [-zincr * (idv + 1) for idv in range(ndiv)]
+    offsets += [zincr * (idv + 1) for idv in range(ndiv)]
+
     progress = XTGShowProgress(
         ndiv * 2, show=showprogress, leadtext="progress: ", skip=1
     )
-    for idv in range(ndiv):
-        progress.flush(idv)
-        ztmp = this.copy()
-        ztmp.values -= zincr * (idv + 1)
-        ztmp.slice_cube(
-            cube, sampling=sampling, mask=mask, snapxy=snapxy, deadtraces=deadtraces
-        )
-        npcollect.append(ztmp.values)
-    # collect below the original surface
-    for idv in range(ndiv):
-        progress.flush(ndiv + idv)
-        ztmp = this.copy()
-        ztmp.values += zincr * (idv + 1)
-        ztmp.slice_cube(
-            cube, sampling=sampling, mask=mask, snapxy=snapxy, deadtraces=deadtraces
-        )
-        npcollect.append(ztmp.values)
 
-    logger.info("Make a stack of the maps...")
-    stacked = ma.dstack(npcollect)
-    del npcollect
+    attrs = _WindowAttributes(attrlist, (this.ncol, this.nrow))
+    for _zvalues, values in _slice_window_levels(
+        this, cube, offsets, sampling, mask, snapxy, deadtraces, progress
+    ):
+        attrs.add(values)
+
     if deletecube:
         del cube
 
-    attvalues = dict()
-    for attr in attrlist:
-        logger.info("Running attribute %s", attr)
-        attvalues[attr] = _attvalues(attr, stacked)
+    attvalues = attrs.result()
 
     progress.finished()
     return attvalues  # this is dict with numpies, one per attribute
@@ -407,16 +480,12 @@ def _slice_between_surfaces(
     deletecube=False,
 ):
 
-    """Slice and find values between two surfaces."""
+    """Slice and find values between two surfaces.
 
-    npcollect = []
-    zincr = zrange / float(ndiv)
+    As for the constant window, attributes are accumulated level by level.
+    """
 
-    zcenter = this.copy()
-    zcenter.slice_cube(
-        cube, sampling=sampling, mask=mask, snapxy=snapxy, deadtraces=deadtraces
-    )
-    npcollect.append(zcenter.values)
+    zincr = zrange / float(ndiv)
 
     # collect below or above the original surface
     if other_position == "above":
@@ -424,28 +493,21 @@ def _slice_between_surfaces(
     else:
         mul = 1
 
-    # collect above the original surface
-    progress = XTGShowProgress(ndiv, show=showprogress, leadtext="progress: ")
-    for idv in range(ndiv):
-        progress.flush(idv)
-        ztmp = this.copy()
-        ztmp.values += zincr * (idv + 1) * mul
-        zvalues = ztmp.values.copy()
-
-        ztmp.slice_cube(
-            cube, sampling=sampling, mask=mask, snapxy=snapxy, deadtraces=deadtraces
-        )
-
-        diff = mul * (other.values - zvalues)
-
-        values = ztmp.values
-        values = ma.masked_where(diff < 0.0, values)
+    offsets = [0.0] + [zincr * (idv + 1) * mul for idv in range(ndiv)]
 
-        npcollect.append(values)
+    progress = XTGShowProgress(ndiv, show=showprogress, leadtext="progress: ")
 
-    stacked = ma.dstack(npcollect)
+    attrs = _WindowAttributes(attrlist, (this.ncol, this.nrow))
+    for num, (zvalues, values) in enumerate(
+        _slice_window_levels(
+            this, cube, offsets, sampling, mask, snapxy, deadtraces, progress
+        )
+    ):
+        if num > 0:
+            diff = mul * (other.values - zvalues)
+            values = ma.masked_where(diff < 0.0, values)
 
-    del npcollect
+        attrs.add(values)
 
     if deletecube:
         del cube
@@ -454,8 +516,7 @@ def _slice_between_surfaces(
     isovalues = mul * (other.values - this.values)
 
     attvalues = dict()
-    for attr in attrlist:
-        attvaluestmp = _attvalues(attr, stacked)
+    for attr, attvaluestmp in attrs.result().items():
         attvalues[attr] = ma.masked_where(isovalues < mthreshold, attvaluestmp)
 
     progress.finished()
@@ -463,50 +524,121 @@ def _slice_between_surfaces(
     return attvalues  # this is dict with numpies, one per attribute
 
 
-def _attvalues(attribute, stacked):
-    """Attribute values computed in numpy.ma stack."""
-    if attribute == "max":
-        attvalues = ma.max(stacked, axis=2)
-    elif attribute == "min":
-        attvalues = ma.min(stacked, axis=2)
-    elif attribute == "rms":
-        attvalues = np.sqrt(ma.mean(np.square(stacked), axis=2))
-    elif attribute == "var":
-        attvalues = ma.var(stacked, axis=2)
-    elif attribute == "mean":
-        attvalues = ma.mean(stacked, axis=2)
-    elif attribute == "maxpos":
-        stacked = ma.masked_less(stacked, 0.0, copy=True)
-        attvalues = ma.max(stacked, axis=2)
-    elif attribute == "maxneg":  # ~ minimum of negative values?
-        stacked = ma.masked_greater_equal(stacked, 0.0, copy=True)
-        attvalues = ma.min(stacked, axis=2)
-    elif attribute == "maxabs":
-        attvalues = ma.max(abs(stacked), axis=2)
-    elif attribute == "sumpos":
-        stacked = ma.masked_less(stacked, 0.0, copy=True)
-        attvalues = ma.sum(stacked, axis=2)
-    elif attribute == "sumneg":
-        stacked = ma.masked_greater_equal(stacked, 0.0, copy=True)
-        attvalues = ma.sum(stacked, axis=2)
-    elif attribute == "sumabs":
-        attvalues = ma.sum(abs(stacked), axis=2)
-    elif attribute == "meanabs":
-        attvalues = ma.mean(abs(stacked), axis=2)
-    elif attribute == "meanpos":
-        stacked = ma.masked_less(stacked, 0.0, copy=True)
-        attvalues = ma.mean(stacked, axis=2)
-    elif attribute == "meanneg":
-        stacked = ma.masked_greater_equal(stacked, 0.0, copy=True)
-        attvalues = ma.mean(stacked, axis=2)
-    else:
-        etxt = "Invalid attribute applied: {}".format(attribute)
-        raise ValueError(etxt)
+class _WindowAttributes(object):
+    """Window attributes (cf. ALLATTRS), accumulated one slice at a time.
+
+    Only the sums etc. needed for the requested attributes are kept, each as
+    one map, so memory use does not depend on the number of slices. The
+    results are as for numpy.ma max, mean, var etc. along the stacked slices.
+    """
 
-    if not attvalues.flags["C_CONTIGUOUS"]:
-        mask = ma.getmaskarray(attvalues)
-        mask = np.asanyarray(mask, order="C")
-        attvalues = np.asanyarray(attvalues, order="C")
-        attvalues = ma.array(attvalues, mask=mask, order="C")
+    def __init__(self, attrlist, shape):
+        for attr in attrlist:
+            if attr not in ALLATTRS:
+                raise ValueError("Invalid attribute applied: {}".format(attr))
+
+        self._attrlist = list(attrlist)
+        need = set(attrlist)
+
+        self._shape = shape
+        self._count = np.zeros(shape, dtype=np.int64)
+        self._acc = dict()
+
+        def _alloc(names, value):
+            for name in names:
+                self._acc[name] = np.full(shape, value, dtype=np.float64)
+
+        if need & {"mean", "var"}:
+            _alloc(["mean", "msq"], 0.0)  # Welford
+        if "rms" in need:
+            _alloc(["sumsq"], 0.0)
+        if "max" in need:
+            _alloc(["max"], -np.inf)
+        if "min" in need:
+            _alloc(["min"], np.inf)
+        if "maxabs" in need:
+            _alloc(["maxabs"], -np.inf)
+        if need & {"sumabs", "meanabs"}:
+            _alloc(["sumabs"], 0.0)
+        if need & {"maxpos", "sumpos", "meanpos"}:
+            self._acc["npos"] = np.zeros(shape, dtype=np.int64)
+            _alloc(["sumpos"], 0.0)
+            _alloc(["maxpos"], -np.inf)
+        if need & {"maxneg", "sumneg", "meanneg"}:
+            self._acc["nneg"] = np.zeros(shape, dtype=np.int64)
+            _alloc(["sumneg"], 0.0)
+            _alloc(["maxneg"], np.inf)
+
+    def add(self, values):
+        """Add one slice (masked 2D array) to the accumulated attributes."""
+
+        acc = self._acc
+        valid = ~ma.getmaskarray(values)
+        vals = np.where(valid, ma.getdata(values), 0.0).astype(np.float64)
+
+        self._count += valid
+
+        if "mean" in acc:
+            delta = np.where(valid, vals - acc["mean"], 0.0)
+            acc["mean"] += np.divide(
+                delta, self._count, out=np.zeros(self._shape), where=self._count > 0
+            )
+            acc["msq"] += np.where(valid, delta * (vals - acc["mean"]), 0.0)
+        if "sumsq" in acc:
+            acc["sumsq"] += vals * vals
+        if "max" in acc:
+            np.maximum(acc["max"], np.where(valid, vals, -np.inf), out=acc["max"])
+        if "min" in acc:
+            np.minimum(acc["min"], np.where(valid, vals, np.inf), out=acc["min"])
+        if "maxabs" in acc:
+            absvals = np.where(valid, np.abs(vals), -np.inf)
+            np.maximum(acc["maxabs"], absvals, out=acc["maxabs"])
+        if "sumabs" in acc:
+            acc["sumabs"] += np.abs(vals)
+        if "npos" in acc:
+            pos = valid & (vals >= 0.0)
+            acc["npos"] += pos
+            acc["sumpos"] += np.where(pos, vals, 0.0)
+            np.maximum(acc["maxpos"], np.where(pos, vals, -np.inf), out=acc["maxpos"])
+        if "nneg" in acc:
+            neg = valid & (vals < 0.0)
+            acc["nneg"] += neg
+            acc["sumneg"] += np.where(neg, vals, 0.0)
+            np.minimum(acc["maxneg"], np.where(neg, vals, np.inf), out=acc["maxneg"])
+
+    def result(self):
+        """Return a dict with a masked numpy per attribute."""
+
+        acc = self._acc
+        count = self._count
+
+        def _masked(values, num):
+            return ma.array(values, mask=(num == 0), order="C")
+
+        attvalues = dict()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for attr in self._attrlist:
+                logger.info("Running attribute %s", attr)
+                if attr in ("max", "min", "maxabs", "sumabs"):
+                    res = _masked(acc[attr], count)
+                elif attr == "rms":
+                    res = _masked(np.sqrt(acc["sumsq"] / count), count)
+                elif attr == "mean":
+                    res = _masked(acc["mean"], count)
+                elif attr == "var":
+                    res = _masked(acc["msq"] / count, count)
+                elif attr == "meanabs":
+                    res = _masked(acc["sumabs"] / count, count)
+                elif attr in ("maxpos", "sumpos"):
+                    res = _masked(acc[attr], acc["npos"])
+                elif attr == "meanpos":
+                    res = _masked(acc["sumpos"] / acc["npos"], acc["npos"])
+                elif attr in ("maxneg", "sumneg"):
+                    res = _masked(acc[attr], acc["nneg"])
+                else:  # meanneg
+                    res = _masked(acc["sumneg"] / acc["nneg"], acc["nneg"])
+
+                attvalues[attr] = res
+
+        return attvalues
 
-    return attvalues
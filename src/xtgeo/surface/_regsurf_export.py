@@ -4,13 +4,14 @@
 # pylint: disable=protected-access
 from __future__ import division, absolute_import
 from __future__ import print_function
-from struct import pack
 import numpy as np
+import numpy.ma as ma
 
 import xtgeo
 from xtgeo.common.constants import UNDEF_MAP_IRAPB
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo  # pylint: disable=import-error
 from xtgeo.common import XTGeoDialog
+from ._regsurf_import import IRAPBIN_HEADER, IRAPBIN_RECORDS
 
 xtg = XTGeoDialog()
 
@@ -132,61 +133,45 @@ def _export_irap_binary_cxtgeotest(self, mfile):
 
 
 def _export_irap_binary_python(self, mfile, bstream=False):
-    """Export to Irap RMS binary format but use python only.
+    """Export to Irap RMS binary format but use python (numpy) only.
 
-    This is approx 2-5 times slower than the C method, but may a be more robust in cases
-    with BytesIO.
+    The header and all records (one per row, as written by RMS) are laid out
+    in numpy arrays, and written in one go. The result is identical to the C
+    method.
     """
 
-    vals = self.get_values1d(fill_value=UNDEF_MAP_IRAPB, order="F")
-
-    ap = pack(
-        ">3i6f3i3f10i",  # > means big endian storage
-        32,
-        -996,
-        self.nrow,
-        self.xori,
-        self.xori + self.xinc * (self.ncol - 1),
-        self.yori,
-        self.yori + self.yinc * (self.nrow - 1),
-        self.xinc,
-        self.yinc,
-        32,
-        16,
-        self.ncol,
-        self.rotation,
-        self.xori,
-        self.yori,
-        16,
-        28,
-        0,
-        0,
-        0,
-        0,
-        0,
-        0,
-        0,
-        28,
-    )
-    inum = self.nrow * self.ncol
-
-    # export to Irap binary in ncol chunks (only chunk size accepted by RMS)
-    nchunk = self.ncol
-    chunks = [nchunk] * (inum // nchunk)
-    if (inum % nchunk) > 0:
-        chunks.append(inum % nchunk)
-    start = 0
-    for chunk in chunks:
-        ap += pack(">i", chunk * 4)
-        ap += pack(">{:d}f".format(chunk), *vals[start : start + chunk])
-        ap += pack(">i", chunk * 4)
-        start += chunk
+    header = np.zeros(1, dtype=IRAPBIN_HEADER)
+    for key, reclen in IRAPBIN_RECORDS.items():
+        header[key] = reclen
+        header[key + "end"] = reclen
+
+    yinc = self._yflip * self._yinc
+    header["idflag"] = -996
+    header["nrow"] = self._nrow
+    header["ncol"] = self._ncol
+    header["xori"] = header["x0ori"] = self._xori
+    header["yori"] = header["y0ori"] = self._yori
+    header["xmax"] = self._xori + self._xinc * (self._ncol - 1)
+    header["ymax"] = self._yori + yinc * (self._nrow - 1)
+    header["xinc"] = self._xinc
+    header["yinc"] = yinc
+    header["rotation"] = self._rotation
+
+    # records: <4*ncol> ncol values <4*ncol>, one per row (F order values)
+    records = np.empty((self._nrow, self._ncol + 2), dtype=">f4")
+    markers = records.view(">i4")
+    markers[:, 0] = markers[:, -1] = 4 * self._ncol
+    values = records[:, 1:-1]
+    values[...] = self.values.data.T
+    np.copyto(values, UNDEF_MAP_IRAPB, where=ma.getmaskarray(self.values).T)
 
     if bstream:
-        mfile.write(ap)
+        mfile.write(header.tobytes())
+        mfile.write(records.tobytes())
     else:
         with open(mfile, "wb") as fout:
-            fout.write(ap)
+            header.tofile(fout)
+            records.tofile(fout)
 
 
 def export_ijxyz_ascii(self, mfile):
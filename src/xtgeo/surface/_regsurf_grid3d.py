@@ -36,7 +36,7 @@ def slice_grid3d(self, grid, prop, zsurf=None, sbuffer=1):
 
     nsurf = self.ncol * self.nrow
 
-    p_prop = _gridprop_lowlevel.update_carray(prop, discrete=False)
+    p_prop = _gridprop_lowlevel.get_buffer(prop, discrete=False)
 
     istat, updatedval = _cxtgeo.surf_slice_grd3d(
         self.ncol,
@@ -4,19 +4,28 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import hashlib
+import multiprocessing
+import threading
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 import numpy.ma as ma
 import scipy.interpolate
 import scipy.ndimage
+import scipy.spatial
 
 import xtgeo
+from xtgeo.common import _ensemble
 
 xtg = xtgeo.common.XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# number of triangulations (with weights) kept for reuse by _LinearGridder
+TRICACHESIZE = 8
+
 # Note: 'self' is an instance of RegularSurface
 # pylint: disable=too-many-branches, too-many-statements, too-many-locals
 
@@ -71,6 +80,7 @@ def avgsum_from_3dprops_gridding(
     coarsen=1,
     zone_avg=False,
     mask_outside=False,
+    workers=1,
 ):
 
     """Get surface average from a 3D grid prop."""
@@ -79,6 +89,8 @@ def avgsum_from_3dprops_gridding(
     # - Inputs shall be pure 3D numpies, not masked!
     # - Xprop and yprop must be made for all cells
     # - Also dzprop for all cells, and dzprop = 0 for inactive cells!
+    # - Each layer is gridded linearly from one triangulation, which is used
+    #   for both the property and dz, and reused for layers with same X Y
 
     logger.info("Avgsum calculation %s", __name__)
 
@@ -114,6 +126,7 @@ def avgsum_from_3dprops_gridding(
         trimbydz = True
 
     xiv, yiv = self.get_xy_values()
+    gridder = _LinearGridder(xiv, yiv)
 
     # weight are needed if zoneprop is not follow layers, but rather regions
     weights = dzprop.copy() * 0.0 + 1.0
@@ -124,14 +137,14 @@ def avgsum_from_3dprops_gridding(
     zoneprop = ma.masked_less(zoneprop, zone_minmax[0])
     zoneprop = ma.masked_greater(zoneprop, zone_minmax[1])
 
+    msum = np.zeros((self.ncol, self.nrow), order="C")
+    dzsum = np.zeros((self.ncol, self.nrow), order="C")
+
+    layers = []
     for klay0 in range(gnlay):
 
         k1lay = klay0 + 1
 
-        if k1lay == 1:
-            msum = np.zeros((self.ncol, self.nrow), order="C")
-            dzsum = np.zeros((self.ncol, self.nrow), order="C")
-
         numz = zoneprop[::, ::, klay0].mean()
         if isinstance(numz, float):
             numz = int(round(zoneprop[::, ::, klay0].mean()))
@@ -149,7 +162,13 @@ def avgsum_from_3dprops_gridding(
             else:
                 logger.debug("Z property sum is %s", propsum)
 
-        logger.info("Mapping for layer or zone %s ....", k1lay)
+        if qmcompute or trimbydz:
+            layers.append((klay0, qmcompute))
+
+    def _grid_layer(layer):
+        klay0, qmcompute = layer
+
+        logger.info("Mapping for layer or zone %s ....", klay0 + 1)
 
         xcv = xprop[::, ::, klay0].ravel(order="C")
         ycv = yprop[::, ::, klay0].ravel(order="C")
@@ -166,31 +185,43 @@ def avgsum_from_3dprops_gridding(
         dzv = dzv[xcc < 1e20]
         wei = wei[xcc < 1e20]
 
-        if summing:
-            mvdz = mvv * wei
-        else:
-            mvdz = mvv * dzv * wei
-
-        if qmcompute:
-            try:
-                mvdzi = scipy.interpolate.griddata(
-                    (xcv, ycv), mvdz, (xiv, yiv), method="linear", fill_value=0.0
-                )
-            except ValueError:
+        try:
+            triangles = gridder.triangulate(xcv, ycv)
+        except ValueError:
+            if qmcompute:
                 warnings.warn("Some problems in gridding ... will contue", UserWarning)
-                continue
+            return None, None
 
-            msum = msum + mvdzi
+        mvdzi = dzi = None
+        if qmcompute:
+            if summing:
+                mvdz = mvv * wei
+            else:
+                mvdz = mvv * dzv * wei
+            mvdzi = gridder.interpolate(triangles, mvdz, fill_value=0.0)
 
         if trimbydz:
-            try:
-                dzi = scipy.interpolate.griddata(
-                    (xcv, ycv), dzv, (xiv, yiv), method="linear", fill_value=0.0
-                )
-            except ValueError:
-                continue
-
-            dzsum = dzsum + dzi
+            dzi = gridder.interpolate(triangles, dzv, fill_value=0.0)
+
+        return mvdzi, dzi
+
+    # layers are gridded in parallel, a chunk at the time, while the sums are
+    # done in layer order (as when serial) to get the same result
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    nchunk = max(workers, 1)
+    for ichunk in range(0, len(layers), nchunk):
+        gridded = _ensemble.load_many(
+            _grid_layer,
+            layers[ichunk : ichunk + nchunk],
+            workers=workers,
+            executor="thread",
+        )
+        for mvdzi, dzi in gridded:
+            if mvdzi is not None:
+                msum = msum + mvdzi
+            if dzi is not None:
+                dzsum = dzsum + dzi
 
     if not summing:
         dzsum[dzsum == 0.0] = 1e-20
@@ -213,6 +244,83 @@ def avgsum_from_3dprops_gridding(
     return True
 
 
+class _LinearGridder(object):
+    """Linear gridding of scattered points onto the nodes of a map.
+
+    This gives the same result as scipy.interpolate.griddata with
+    method="linear", but the Delaunay triangulation and the barycentric
+    weights of the map nodes are kept, so they can be applied to several
+    value arrays (e.g. a property and dz), and reused when the same X Y
+    points come again (e.g. for layers in a grid with vertical pillars).
+
+    Triangulations are cached by the content of the X Y arrays, and the cache
+    is safe to use from several threads.
+    """
+
+    def __init__(self, xiv, yiv, cachesize=TRICACHESIZE):
+        self._shape = np.shape(xiv)
+        self._nodes = np.column_stack(
+            (np.ravel(ma.getdata(xiv)), np.ravel(ma.getdata(yiv)))
+        ).astype(np.float64)
+        self._cachesize = cachesize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def triangulate(self, xcv, ycv):
+        """Return (nodes, vertices, weights) for the map nodes inside the hull.
+
+        Raises ValueError (or a Qhull error) as griddata if the points cannot
+        be triangulated.
+        """
+        xcv = np.ascontiguousarray(xcv, dtype=np.float64)
+        ycv = np.ascontiguousarray(ycv, dtype=np.float64)
+
+        digest = hashlib.sha1(xcv.tobytes())
+        digest.update(ycv.tobytes())
+        key = (xcv.size, digest.hexdigest())
+
+        with self._lock:
+            if key in self._cache:
+                triangles = self._cache.pop(key)  # reinsert as most recent
+                self._cache[key] = triangles
+                logger.debug("Reuse triangulation")
+                return triangles
+
+        triangles = self._triangulate(xcv, ycv)
+
+        with self._lock:
+            self._cache[key] = triangles
+            while len(self._cache) > self._cachesize:
+                self._cache.popitem(last=False)
+
+        return triangles
+
+    def _triangulate(self, xcv, ycv):
+        tri = scipy.spatial.Delaunay(np.column_stack((xcv, ycv)))
+
+        simplex = tri.find_simplex(self._nodes)
+        inside = np.flatnonzero(simplex >= 0)
+        simplex = simplex[inside]
+
+        # barycentric coordinates, see scipy.spatial.Delaunay.transform
+        trans = tri.transform[simplex]
+        bary = np.einsum(
+            "ijk,ik->ij", trans[:, :2, :], self._nodes[inside] - trans[:, 2, :]
+        )
+        weights = np.column_stack((bary, 1.0 - bary.sum(axis=1)))
+
+        return inside, tri.simplices[simplex], weights
+
+    def interpolate(self, triangles, values, fill_value=np.nan):
+        """Interpolate values (at the triangulated points) to the map nodes."""
+        inside, vertices, weights = triangles
+
+        result = np.full(self._nodes.shape[0], fill_value, dtype=np.float64)
+        result[inside] = np.einsum("ij,ij->i", values[vertices], weights)
+
+        return result.reshape(self._shape)
+
+
 def _zone_averaging(
     xprop, yprop, zoneprop, zone_minmax, coarsen, zone_avg, dzprop, mprop, summing=False
 ):
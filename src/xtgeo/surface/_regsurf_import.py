@@ -1,12 +1,15 @@
 """Import RegularSurface data."""
 # pylint: disable=protected-access
 
+import os
+
 import numpy as np
 import numpy.ma as ma
 
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo  # pylint: disable=no-name-in-module
 from xtgeo.common import XTGeoDialog
+from xtgeo.common.constants import UNDEF_MAP_IRAPB_LIMIT
 
 xtg = XTGeoDialog()
 
@@ -16,10 +19,40 @@ DEBUG = 0
 if DEBUG < 0:
     DEBUG = 0
 
-
-def import_irap_binary(self, mfile, values=True):
+# The Irap binary header; 3 Fortran records, big endian
+IRAPBIN_HEADER = np.dtype(
+    [
+        ("rec1", ">i4"),
+        ("idflag", ">i4"),
+        ("nrow", ">i4"),
+        ("xori", ">f4"),
+        ("xmax", ">f4"),
+        ("yori", ">f4"),
+        ("ymax", ">f4"),
+        ("xinc", ">f4"),
+        ("yinc", ">f4"),
+        ("rec1end", ">i4"),
+        ("rec2", ">i4"),
+        ("ncol", ">i4"),
+        ("rotation", ">f4"),
+        ("x0ori", ">f4"),
+        ("y0ori", ">f4"),
+        ("rec2end", ">i4"),
+        ("rec3", ">i4"),
+        ("dummy", ">i4", (7,)),
+        ("rec3end", ">i4"),
+    ]
+)
+IRAPBIN_RECORDS = {"rec1": 32, "rec2": 16, "rec3": 28}
+
+
+def import_irap_binary(self, mfile, values=True, engine="cxtgeo"):
     """Import Irap binary format."""
 
+    if engine == "python":
+        _import_irap_binary_python(self, mfile, values=values)
+        return
+
     ifile = xtgeo._XTGeoCFile(mfile)
 
     logger.info("Enter function %s", __name__)
@@ -79,18 +112,175 @@ def import_irap_binary(self, mfile, values=True):
     ifile.close()
 
 
-def import_irap_ascii(self, mfile):
+def _import_irap_binary_python(self, mfile, values=True):
+    """Import Irap binary format by numpy, with the file as a memory map.
+
+    After the header, the values are in F order, in Fortran records of
+    (usually) NCOL floats. When all records have equal length, as when written
+    by RMS or XTGeo, the values are read as one strided view of the file.
+    """
+
+    ifile = xtgeo._XTGeoCFile(mfile)
+
+    if ifile.memstream:
+        buf = np.frombuffer(mfile.getbuffer(), dtype=np.uint8)
+    else:
+        buf = np.memmap(ifile.name, dtype=np.uint8, mode="r")
+
+    nhead = IRAPBIN_HEADER.itemsize
+    if buf.size < nhead:
+        raise RuntimeError("Error in reading Irap binary file, header is incomplete")
+
+    header = buf[:nhead].view(IRAPBIN_HEADER)[0]
+    for key, reclen in IRAPBIN_RECORDS.items():
+        if header[key] != reclen or header[key + "end"] != reclen:
+            raise RuntimeError("Error in reading Irap binary file, invalid header")
+
+    self._ncol = int(header["ncol"])
+    self._nrow = int(header["nrow"])
+    self._xori = float(header["xori"])
+    self._yori = float(header["yori"])
+    self._xinc = float(header["xinc"])
+    self._yinc = float(header["yinc"])
+    self._rotation = float(header["rotation"])
+    if self._rotation < 0.0:
+        self._rotation += 360.0
+
+    self._yflip = 1
+    if self._yinc < 0.0:
+        self._yinc *= -1
+        self._yflip = -1
+
+    self._filesrc = mfile
+
+    self._ilines = np.array(range(1, self._ncol + 1), dtype=np.int32)
+    self._xlines = np.array(range(1, self._nrow + 1), dtype=np.int32)
+
+    if not values:
+        self._values = None
+        return
+
+    raw = _irapbin_records(buf[nhead:])
+    if raw.size != self._ncol * self._nrow:
+        raise RuntimeError(
+            "Error in reading Irap binary file, number of map nodes read ({}) "
+            "is not NCOL * NROW".format(raw.size)
+        )
+
+    # the file is F order; transpose and convert to float64 C order in one pass
+    val = np.empty((self._ncol, self._nrow), dtype=np.float64)
+    val[...] = raw.reshape(self._nrow, self._ncol).T
+
+    # undefined and NaN values are masked in the same step
+    mask = ~(val <= UNDEF_MAP_IRAPB_LIMIT)
+    np.copyto(val, xtgeo.UNDEF, where=mask)
+
+    self._values = ma.MaskedArray(val, mask=mask)
+
+
+def _irapbin_records(data):
+    """Return the values (big endian float32) in the Fortran records of data.
+
+    The values are returned as 2D (one row per record) view of data if all
+    records have equal length, otherwise as a 1D array.
+    """
+
+    reclen = int(data[:4].view(">i4")[0]) if data.size >= 4 else 0
+
+    if reclen > 0 and reclen % 4 == 0 and data.size % (reclen + 8) == 0:
+        words = data.view(">i4").reshape(-1, reclen // 4 + 2)
+        if (words[:, 0] == reclen).all() and (words[:, -1] == reclen).all():
+            return words[:, 1:-1].view(">f4")
+
+    logger.info("Irap binary records are of unequal length, read one by one")
+    records = []
+    pos = 0
+    while pos + 4 <= data.size:
+        reclen = int(data[pos : pos + 4].view(">i4")[0])
+        if reclen <= 0:
+            break
+
+        end = pos + 4 + reclen
+        if reclen % 4 != 0 or end + 4 > data.size:
+            raise RuntimeError("Error in reading Irap binary file, invalid record")
+        if int(data[end : end + 4].view(">i4")[0]) != reclen:
+            raise RuntimeError("Error in reading Irap binary file, record mismatch")
+
+        records.append(data[pos + 4 : end].view(">f4"))
+        pos = end + 4
+
+    if not records:
+        return np.empty(0, dtype=">f4")
+    return np.concatenate(records)
+
+
+def irap_binary_rowreader(mfile):
+    """Return a reader of bands of map rows, directly from an Irap binary file.
+
+    The reader takes (row0, row1) and returns the values of those rows as a
+    float64 array of shape (ncol, row1 - row0), with nan for undefined values.
+    Only the bytes of those rows are read from file. None is returned if mfile
+    is not an Irap binary file on disk with one Fortran record per map row, as
+    written by RMS or XTGeo.
+    """
+
+    fobj = xtgeo._XTGeoCFile(mfile)
+    if fobj.memstream:
+        return None
+
+    fname = fobj.name
+    nhead = IRAPBIN_HEADER.itemsize
+    try:
+        header = np.fromfile(fname, dtype=IRAPBIN_HEADER, count=1)
+        fsize = os.path.getsize(fname)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if header.size != 1:
+        return None
+
+    header = header[0]
+    for key, reclen in IRAPBIN_RECORDS.items():
+        if header[key] != reclen or header[key + "end"] != reclen:
+            return None
+
+    ncol, nrow = int(header["ncol"]), int(header["nrow"])
+    reclen = 4 * ncol
+    if ncol < 1 or fsize != nhead + nrow * (reclen + 8):
+        return None
+
+    def _read_rows(row0, row1):
+        nrows = row1 - row0
+        with open(fname, "rb") as fhandle:
+            fhandle.seek(nhead + row0 * (reclen + 8))
+            words = np.fromfile(fhandle, dtype=">i4", count=nrows * (ncol + 2))
+
+        words = words.reshape(nrows, ncol + 2)
+        if not ((words[:, 0] == reclen).all() and (words[:, -1] == reclen).all()):
+            raise RuntimeError(
+                "Error in reading Irap binary file {}, invalid record".format(fname)
+            )
+
+        vals = words[:, 1:-1].view(">f4").T.astype(np.float64)
+        vals[~(vals <= UNDEF_MAP_IRAPB_LIMIT)] = np.nan
+        return vals
+
+    return _read_rows
+
+
+def import_irap_ascii(self, mfile, values=True):
     """Import Irap ascii format."""
     # version using swig type mapping
 
     logger.debug("Enter function...")
     ifile = xtgeo._XTGeoCFile(mfile)
 
-    # read with mode 0, scan to get mx my
+    # read with mode 0, to get mx my and other metadata from the header
     xlist = _cxtgeo.surf_import_irap_ascii(ifile.fhandle, 0, 1, 0)
 
-    nvn = xlist[1] * xlist[2]  # mx * my
-    xlist = _cxtgeo.surf_import_irap_ascii(ifile.fhandle, 1, nvn, 0)
+    if values:
+        nvn = xlist[1] * xlist[2]  # mx * my
+        xlist = _cxtgeo.surf_import_irap_ascii(ifile.fhandle, 1, nvn, 0)
 
     ier, ncol, nrow, _ndef, xori, yori, xinc, yinc, rot, val = xlist
 
@@ -98,13 +288,16 @@ def import_irap_ascii(self, mfile):
         ifile.close()
         raise RuntimeError("Problem in {}, code {}".format(__name__, ier))
 
-    val = np.reshape(val, (ncol, nrow), order="C")
+    if values:
+        val = np.reshape(val, (ncol, nrow), order="C")
 
-    val = ma.masked_greater(val, xtgeo.UNDEF_LIMIT)
+        val = ma.masked_greater(val, xtgeo.UNDEF_LIMIT)
 
-    if np.isnan(val).any():
-        logger.info("NaN values are found, will mask...")
-        val = ma.masked_invalid(val)
+        if np.isnan(val).any():
+            logger.info("NaN values are found, will mask...")
+            val = ma.masked_invalid(val)
+    else:
+        val = None  # lazy loading, not reading the values
 
     yflip = 1
     if yinc < 0.0:
@@ -128,8 +321,12 @@ def import_irap_ascii(self, mfile):
     ifile.close()
 
 
-def import_ijxyz_ascii(self, mfile):  # pylint: disable=too-many-locals
-    """Import OW/DSG IJXYZ ascii format."""
+def import_ijxyz_ascii(self, mfile, values=True):  # pylint: disable=too-many-locals
+    """Import OW/DSG IJXYZ ascii format.
+
+    This format has no header; the geometry is estimated from all points, so
+    the whole file is parsed also if values is False (values are then not kept).
+    """
 
     # import of seismic column system on the form:
     # 2588	1179	476782.2897888889	6564025.6954	1000.0
@@ -167,7 +364,7 @@ def import_ijxyz_ascii(self, mfile):  # pylint: disable=too-many-locals
     self._nrow = nrow
     self._rotation = rot
     self._yflip = yflip
-    self._values = val.reshape((self._ncol, self._nrow))
+    self._values = val.reshape((self._ncol, self._nrow)) if values else None
     self._filesrc = mfile
 
     self._ilines = iln
@@ -176,23 +373,26 @@ def import_ijxyz_ascii(self, mfile):  # pylint: disable=too-many-locals
     fin.close()
 
 
-def import_ijxyz_ascii_tmpl(self, mfile, template):
+def import_ijxyz_ascii_tmpl(self, mfile, template, values=True):
     """Import OW/DSG IJXYZ ascii format, with a Cube or RegularSurface
     instance as template."""
 
-    fin = xtgeo._XTGeoCFile(mfile)
-
     if isinstance(template, (xtgeo.cube.Cube, xtgeo.surface.RegularSurface)):
         logger.info("OK template")
     else:
         raise ValueError("Template is of wrong type: {}".format(type(template)))
 
-    nxy = template.ncol * template.nrow
-    _iok, val = _cxtgeo.surf_import_ijxyz_tmpl(
-        fin.fhandle, template.ilines, template.xlines, nxy, 0
-    )
+    val = None
+    if values:
+        fin = xtgeo._XTGeoCFile(mfile)
+        nxy = template.ncol * template.nrow
+        _iok, val = _cxtgeo.surf_import_ijxyz_tmpl(
+            fin.fhandle, template.ilines, template.xlines, nxy, 0
+        )
+        fin.close()
 
-    val = ma.masked_greater(val, xtgeo.UNDEF_LIMIT)
+        val = ma.masked_greater(val, xtgeo.UNDEF_LIMIT)
+        val = val.reshape((template.ncol, template.nrow))
 
     self._xori = template.xori
     self._xinc = template.xinc
@@ -202,14 +402,12 @@ def import_ijxyz_ascii_tmpl(self, mfile, template):
     self._nrow = template.nrow
     self._rotation = template.rotation
     self._yflip = template.yflip
-    self._values = val.reshape((self._ncol, self._nrow))
+    self._values = val
     self._filesrc = mfile
 
     self._ilines = template._ilines.copy()
     self._xlines = template._xlines.copy()
 
-    fin.close()
-
 
 def import_petromod_binary(self, mfile, values=True):
     """Import Petromod binary format."""
@@ -248,6 +446,15 @@ def import_petromod_binary(self, mfile, values=True):
     if self._rotation != 0.0 and (rota_xori != self._xori or rota_yori != self._yori):
         xtg.warnuser("Rotation origin and data origin do match")
 
+    # lazy loading, not reading the values
+    if not values:
+        self._values = None
+        self._filesrc = mfile
+        self._ilines = np.array(range(1, self._ncol + 1), dtype=np.int32)
+        self._xlines = np.array(range(1, self._nrow + 1), dtype=np.int32)
+        ifile.close()
+        return
+
     # reread file for map values
 
     dsc, values = _cxtgeo.surf_import_petromod_bin(
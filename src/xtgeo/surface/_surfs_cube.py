@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Slicing a Cube along many surfaces in parallel (cf. Surfaces class)"""
+# pylint: disable=protected-access
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+import numpy as np
+
+import xtgeo
+from xtgeo.common import XTGeoDialog
+from xtgeo.common import _ensemble
+from xtgeo.cube import _cube_lazy
+from . import _surfs_stats
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+CUBESPEC = (
+    "ncol",
+    "nrow",
+    "nlay",
+    "xori",
+    "yori",
+    "zori",
+    "xinc",
+    "yinc",
+    "zinc",
+    "rotation",
+    "yflip",
+)
+
+
+class _SharedCube(object):
+    """Cube geometry, and values in a memory mapped file shared by processes.
+
+    Only the file name is pickled, and each process maps the file (copy on
+    write), so the values are in memory once, in the OS page cache.
+    """
+
+    def __init__(self, cube):
+        self.spec = {key: getattr(cube, key) for key in CUBESPEC}
+        values = np.asarray(cube.values, dtype=np.float32)
+        self.shared = _ensemble.SharedArrays([("values", values)])
+
+    def cube(self):
+        """Return a Cube with values mapped from the shared file."""
+        values = self.shared.arrays()["values"]
+        return xtgeo.Cube(values=values, **self.spec)
+
+    def remove(self):
+        """Remove the shared file."""
+        self.shared.remove()
+
+
+def slice_cube(self, cube, workers=1, executor="process", **kwargs):
+    """Slice cube along each surface, see Surfaces.slice_cube()."""
+    return _slice_many(self, cube, "slice_cube", 0.0, workers, executor, kwargs)
+
+
+def slice_cube_window(self, cube, workers=1, executor="process", **kwargs):
+    """Window attributes along each surface, see Surfaces.slice_cube_window()."""
+    zpad = kwargs.get("zrange", 10)
+    return _slice_many(self, cube, "slice_cube_window", zpad, workers, executor, kwargs)
+
+
+def _slice_many(self, cube, method, zpad, workers, executor, kwargs):
+    """Prepare the cube once, and apply the RegularSurface method in a pool.
+
+    Dead traces are set to UNDEF once, for all surfaces, and the workers
+    then slice with deadtraces=False.
+    """
+
+    surfs = self.surfaces
+    if not surfs:
+        raise ValueError("No surfaces to slice")
+
+    if executor not in _ensemble.EXECUTORS:
+        raise ValueError(
+            "Invalid executor {}, must be one of {}".format(
+                executor, list(_ensemble.EXECUTORS)
+            )
+        )
+
+    cube = _cube_region(cube, surfs, zpad)
+
+    deadtraces = kwargs.pop("deadtraces", True)
+    kwargs["deadtraces"] = False
+
+    olddead = None
+    if deadtraces:
+        olddead = cube.values_dead_traces(xtgeo.UNDEF)
+
+    source = cube
+    try:
+        if executor == "process" and workers != 1 and len(surfs) > 1:
+            logger.info("Put cube in shared memory for %s surfaces", len(surfs))
+            source = _SharedCube(cube)
+
+        jobs = [(source, surf, method, kwargs) for surf in surfs]
+        return _ensemble.load_many(_slice_one, jobs, workers=workers, executor=executor)
+    finally:
+        if isinstance(source, _SharedCube):
+            source.remove()
+        if olddead is not None:
+            cube.values_dead_traces(olddead)  # reset value for dead traces
+
+
+def _slice_one(job):
+    """Slice one surface; module level so it can run in a process."""
+
+    source, surf, method, kwargs = job
+
+    cube = source
+    if isinstance(source, _SharedCube):
+        cube = source.cube()
+
+    with _surfs_stats.loaded_values(surf):
+        result = surf.copy()
+
+    asurfs = getattr(result, method)(cube, **kwargs)
+    if asurfs is not None:
+        return asurfs
+    return result
+
+
+def _cube_region(cube, surfs, zpad):
+    """Return cube, or for a lazy cube, the part of it covering all surfaces."""
+
+    if cube.isloaded:
+        return cube
+
+    xcorners = []
+    ycorners = []
+    zlimits = []
+    for surf in surfs:
+        xcs, ycs = _cube_lazy.xy_corners(
+            surf.ncol,
+            surf.nrow,
+            surf.xori,
+            surf.yori,
+            surf.xinc,
+            surf.yinc,
+            surf.rotation,
+            surf.yflip,
+        )
+        xcorners.append(xcs)
+        ycorners.append(ycs)
+
+        if surf._isloaded and surf.values.count() > 0:
+            zlimits.extend([surf.values.min(), surf.values.max()])
+        else:
+            zlimits.extend([cube.zori, cube.zori + (cube.nlay - 1) * cube.zinc])
+
+    return _cube_lazy.cube_region(
+        cube,
+        np.concatenate(xcorners),
+        np.concatenate(ycorners),
+        min(zlimits) - abs(zpad),
+        max(zlimits) + abs(zpad),
+    )
@@ -1,13 +1,35 @@
 """Import multiple surfaces"""
 # pylint: disable=protected-access
 
+import glob
+import os
+
+import pandas as pd
+
 import xtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.common import _ensemble
 
 xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# file extensions recognized by RegularSurface.from_file(fformat="guess")
+EXTENSIONS = ("gri", "bin", "irapbin", "fgr", "asc", "irapasc", "pmd", "ijxyz")
+
+CATALOG_COLUMNS = [
+    "NAME",
+    "FILE",
+    "NCOL",
+    "NROW",
+    "XORI",
+    "YORI",
+    "XINC",
+    "YINC",
+    "ROTATION",
+    "YFLIP",
+]
+
 
 def from_grid3d(self, grid, subgrids, rfactor):
     """Get surfaces from 3D grid, including subgrids"""
@@ -46,3 +68,64 @@ def from_grid3d(self, grid, subgrids, rfactor):
     self._order = "stratigraphic"
 
     logger.info("Extracting surface from 3D grid... DONE")
+
+
+def catalog(files, workers=1, executor="process"):
+    """Geometry of surfaces in files, as a DataFrame (see surfaces_catalog())."""
+
+    if isinstance(files, str):
+        files = _expand_files(files)
+
+    rows = _ensemble.load_many(
+        _metadata_or_none, list(files), workers=workers, executor=executor
+    )
+
+    for sfile, row in zip(files, rows):
+        if row is None:
+            xtg.warnuser("Cannot read as surface file, skip: {}".format(sfile))
+
+    return pd.DataFrame([row for row in rows if row], columns=CATALOG_COLUMNS)
+
+
+def _expand_files(path):
+    """Files in a directory (with known surface extensions), or a glob pattern."""
+
+    if os.path.isdir(path):
+        files = [
+            os.path.join(path, fname)
+            for fname in os.listdir(path)
+            if os.path.splitext(fname)[1].lower().lstrip(".") in EXTENSIONS
+        ]
+    else:
+        files = glob.glob(path)
+
+    return sorted(fname for fname in files if os.path.isfile(fname))
+
+
+def _metadata_or_none(sfile):
+    # module level function, so it can be used in a process pool
+    surf = xtgeo.RegularSurface()
+    try:
+        surf.from_file(sfile, values=False, engine="python")
+    except (OSError, ValueError, RuntimeError) as err:
+        logger.info("Could not read %s: %s", sfile, err)
+        return None
+
+    return metadata(surf, sfile)
+
+
+def metadata(surf, sfile=None):
+    """Geometry of a surface, as a dict with CATALOG_COLUMNS keys."""
+
+    return {
+        "NAME": surf.name,
+        "FILE": sfile if sfile is not None else surf.filesrc,
+        "NCOL": surf.ncol,
+        "NROW": surf.nrow,
+        "XORI": surf.xori,
+        "YORI": surf.yori,
+        "XINC": surf.xinc,
+        "YINC": surf.yinc,
+        "ROTATION": surf.rotation,
+        "YFLIP": surf.yflip,
+    }
@@ -0,0 +1,225 @@
+"""Streaming statistics over multiple surfaces (cf. Surfaces class)"""
+# pylint: disable=protected-access
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+from contextlib import contextmanager
+import tempfile
+import warnings
+
+import numpy as np
+
+from xtgeo.common import XTGeoDialog
+from xtgeo.surface import _regsurf_import
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+DEFAULT_MAXMEMORY = 1.0  # GB, for the percentile tiles
+
+IRAPBIN_FORMATS = ("irap_binary", "gri", "bin", "irapbin")
+
+
+@contextmanager
+def loaded_values(surf):
+    """Give the surface values as float64 numpy with nan for undefined.
+
+    A surface with metadata only (e.g. read with values=False) is loaded, and
+    released again afterwards, so only one such surface is in memory at a time.
+    """
+
+    release = not surf._isloaded
+    loadargs = surf._loadargs  # reset when loaded, but needed to load again
+    if release:
+        surf.load_values()
+
+    try:
+        yield np.ma.filled(surf.values.astype(np.float64), fill_value=np.nan)
+    finally:
+        if release:
+            surf._values = None
+            surf._isloaded = False
+            surf._loadargs = loadargs
+
+
+def statistics(self, percentiles=None, maxmemory=None):
+    """Statistics accumulated one surface at a time, see Surfaces.statistics()."""
+
+    surfs = self.surfaces
+    if not surfs:
+        raise ValueError("No surfaces to do statistics on")
+
+    with loaded_values(surfs[0]):
+        template = surfs[0].copy()
+
+    shape = (template.ncol, template.nrow)
+
+    # Welford's algorithm for mean and variance, nan aware
+    count = np.zeros(shape, dtype=np.int64)
+    mean = np.zeros(shape, dtype=np.float64)
+    msq = np.zeros(shape, dtype=np.float64)
+    vmin = np.full(shape, np.nan)
+    vmax = np.full(shape, np.nan)
+
+    # for the percentiles, unloaded surfaces are read in row bands directly from
+    # file if Irap binary, otherwise spilled to a temporary file (as float32)
+    readers = {}
+    spills = {}
+    if percentiles:
+        for num, surf in enumerate(surfs):
+            reader = _rowreader(surf)
+            if reader is not None:
+                readers[num] = reader
+
+        unloaded = [
+            num
+            for num, surf in enumerate(surfs)
+            if not surf._isloaded and num not in readers
+        ]
+        if unloaded:
+            spill = np.memmap(
+                tempfile.TemporaryFile(),
+                dtype=np.float32,
+                mode="w+",
+                shape=(len(unloaded),) + shape,
+            )
+            spills = {num: spill[inum] for inum, num in enumerate(unloaded)}
+
+    for num, surf in enumerate(surfs):
+        with loaded_values(surf) as vals:
+            if not template.compare_topology(surf, strict=False):
+                raise ValueError("Cannot do statistics, surfaces differ in topology")
+
+            if num in spills:
+                spills[num][...] = vals
+
+            valid = ~np.isnan(vals)
+            count += valid
+            delta = np.where(valid, vals - mean, 0.0)
+            mean += np.divide(delta, count, out=np.zeros(shape), where=count > 0)
+            msq += np.where(valid, delta * (vals - mean), 0.0)
+            np.fmin(vmin, vals, out=vmin)
+            np.fmax(vmax, vals, out=vmax)
+
+    result = {}
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        template.values = np.where(count > 0, mean, np.nan)
+        result["mean"] = template.copy()
+
+        # std, run with degree of freedom ddof=1, similar to RMS
+        template.values = np.where(count > 1, np.sqrt(msq / (count - 1)), np.nan)
+        result["std"] = template.copy()
+
+    template.values = vmin
+    result["min"] = template.copy()
+
+    template.values = vmax
+    result["max"] = template.copy()
+
+    template.values = count.astype(np.float64)
+    result["count"] = template.copy()
+
+    if percentiles:
+        pvalues = _percentiles_tiled(surfs, percentiles, readers, spills, maxmemory)
+        for pcent, values in zip(percentiles, pvalues):
+            template.values = values
+            result["p{}".format(pcent)] = template.copy()
+
+    return result
+
+
+def apply(self, func, *args, **kwargs):
+    """Apply func on the stacked surface values, see Surfaces.apply()."""
+
+    surfs = self.surfaces
+    if not surfs:
+        raise ValueError("No surfaces to apply function on")
+
+    with loaded_values(surfs[0]):
+        template = surfs[0].copy()
+
+    # func may need all values at once (e.g. np.nanmean without axis), so the
+    # stack is not tiled; it is allocated once, and filled surface by surface
+    stacked = np.empty((len(surfs), template.ncol, template.nrow), dtype=np.float64)
+    for num, surf in enumerate(surfs):
+        with loaded_values(surf) as vals:
+            if not template.compare_topology(surf, strict=False):
+                raise ValueError("Cannot do statistics, surfaces differ in topology")
+            stacked[num] = vals
+
+    template.values = func(stacked, *args, **kwargs)
+    return template
+
+
+def _rowreader(surf):
+    """Reader of row bands directly from file, for an unloaded Irap binary surface.
+
+    Returns None if the surface is loaded, or is not from an Irap binary file.
+    """
+
+    if surf._isloaded or not surf._loadargs:
+        return None
+
+    if surf._loadargs[0] not in IRAPBIN_FORMATS:
+        return None
+
+    return _regsurf_import.irap_binary_rowreader(surf._filesrc)
+
+
+def _fill_rows(surfs, out, row0, row1, readers, spills):
+    """Fill out, shape (nsurf, ncol, row1 - row0), with values of a band of rows.
+
+    The values are float64 with nan for undefined. They are read directly from
+    file for surfaces with a row reader, from the spill file for spilled
+    surfaces, and else from memory.
+    """
+
+    for num, surf in enumerate(surfs):
+        if num in readers:
+            out[num] = readers[num](row0, row1)
+        elif num in spills:
+            out[num] = spills[num][:, row0:row1]
+        else:
+            out[num] = np.ma.filled(surf.values[:, row0:row1], fill_value=np.nan)
+
+
+def _percentiles_tiled(surfs, percentiles, readers, spills, maxmemory):
+    """Exact nan aware percentiles, computed for bands of rows at a time.
+
+    Each band holds the values of all surfaces, and the band size is set from
+    the memory budget (GB). Loaded surfaces are read from memory, and the others
+    band by band from their Irap binary files (a row band is contiguous in such
+    files), or from the spill file.
+    """
+
+    if maxmemory is None:
+        maxmemory = DEFAULT_MAXMEMORY
+
+    nsurf = len(surfs)
+    ncol, nrow = surfs[0].ncol, surfs[0].nrow
+
+    # float64 band, plus about the same for the sorting in nanpercentile
+    nrowband = int(maxmemory * 1024 ** 3) // (2 * 8 * nsurf * ncol)
+    nrowband = max(1, min(nrowband, nrow))
+    logger.info("Percentiles in bands of %s rows of %s", nrowband, nrow)
+
+    result = [np.empty((ncol, nrow), dtype=np.float64) for _ in percentiles]
+
+    band = np.empty((nsurf, ncol, nrowband), dtype=np.float64)
+    for row0 in range(0, nrow, nrowband):
+        row1 = min(row0 + nrowband, nrow)
+        work = band[:, :, : row1 - row0]
+
+        _fill_rows(surfs, work, row0, row1, readers, spills)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-nan nodes
+            pvalues = np.nanpercentile(work, percentiles, axis=0)
+
+        for inum, pval in enumerate(pvalues):
+            result[inum][:, row0:row1] = pval
+
+    return result
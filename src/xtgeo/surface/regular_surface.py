@@ -78,7 +78,8 @@ def surface_from_file(mfile, fformat=None, template=None, values=True):
         mfile (str): Name of file
         fformat (str): See :meth:`RegularSurface.from_file`
         template (Cube or RegularSurface): See :meth:`RegularSurface.from_file`
-        values: If True (default), surface values will be read (Irap binary only)
+        values: If True (default), surface values will be read, see
+            :meth:`RegularSurface.from_file`
 
     Example::
 
@@ -87,6 +88,8 @@ def surface_from_file(mfile, fformat=None, template=None, values=True):
 
     ..versionchanged:: 2.1.0
       Key "values" for Irap binary maps added
+
+    .. versionchanged:: 2.8.0 Key "values" is valid for all formats
     """
 
     obj = RegularSurface()
@@ -227,6 +230,7 @@ class RegularSurface(object):
 
         self._values = None
         self._isloaded = True  # assume True unless explicitly set
+        self._loadargs = None  # file format etc. for load_values(), if lazy
 
         if args:
             # make instance from file import
@@ -662,7 +666,7 @@ class RegularSurface(object):
         return dsc.astext()
 
     def from_file(
-        self, mfile, fformat=None, template=None, values=True
+        self, mfile, fformat=None, template=None, values=True, engine=None
     ):  # pylint: disable=too-many-branches
 
         """Import surface (regular map) from file.
@@ -684,8 +688,14 @@ class RegularSurface(object):
                 existing Cube or RegularSurface instance is applied to
                 get correct topology.
             values (bool): If True (default), then full array is read, if False
-                only metadata will be read. Valid for Irap binary only. This allows
-                lazy loading in e.g. ensembles.
+                only metadata will be read, and values are read later by
+                :meth:`load_values`. This allows lazy loading in e.g. ensembles.
+                Note that ijxyz files without template have no header, hence
+                the whole file must still be parsed to get the geometry.
+            engine (str): For Irap binary, "cxtgeo" for the C reader, or "python"
+                for a numpy reader which maps the file in memory, and is faster
+                for large maps. Default is "cxtgeo" for files and "python" for
+                io.BytesIO instances.
 
         Returns:
             Object instance.
@@ -701,6 +711,9 @@ class RegularSurface(object):
 
         ..versionchanged:: 2.2.0
           Input io.BytesIO instance instead of file is now possible
+
+        .. versionchanged:: 2.8.0 Added engine key, and values=False is valid
+           for all formats
         """
 
         fobj = xtgeosys._XTGeoCFile(mfile)
@@ -712,6 +725,8 @@ class RegularSurface(object):
         if fobj.memstream is True:
             bytestream = True
             fformat = "irap_binary"
+            if engine is None:
+                engine = "python"
         else:
             fobj.check_file(raiseerror=IOError)
             froot, fext = fobj.splitext(lower=True)
@@ -726,27 +741,37 @@ class RegularSurface(object):
 
                 fformat = fext
 
+        self._isloaded = bool(values)
+
         if fformat in ("irap_binary", "gri", "bin", "irapbin"):
             logger.debug("Irap binary format to read")
-            _regsurf_import.import_irap_binary(self, mfile, values=values)
-            if not values:
-                self._isloaded = False
+            _regsurf_import.import_irap_binary(
+                self, mfile, values=values, engine=engine or "cxtgeo"
+            )
 
         elif fformat in ("irap_ascii", "fgr", "asc", "irapasc"):
-            _regsurf_import.import_irap_ascii(self, mfile)
+            _regsurf_import.import_irap_ascii(self, mfile, values=values)
 
         elif fformat in ("pmd", "petromod"):
-            _regsurf_import.import_petromod_binary(self, mfile)
+            _regsurf_import.import_petromod_binary(self, mfile, values=values)
 
         elif fformat == "ijxyz":
             if template:
-                _regsurf_import.import_ijxyz_ascii_tmpl(self, mfile, template)
+                _regsurf_import.import_ijxyz_ascii_tmpl(
+                    self, mfile, template, values=values
+                )
             else:
-                _regsurf_import.import_ijxyz_ascii(self, mfile)
+                _regsurf_import.import_ijxyz_ascii(self, mfile, values=values)
 
         else:
             raise ValueError("Invalid file format: {}".format(fformat))
 
+        # the template geometry (ilines, xlines) is copied, so for a lazy
+        # ijxyz surface, the surface itself is the template in load_values()
+        self._loadargs = None
+        if not values:
+            self._loadargs = (fformat, template is not None, engine)
+
         if bytestream:
             self._name = os.path.basename("<binarystream>")
         else:
@@ -774,11 +799,16 @@ class RegularSurface(object):
             surfs[88].load_values()
 
         ..versionadded:: 2.1.0
+
+        .. versionchanged:: 2.8.0 All file formats are supported
         """
 
         if not self._isloaded:
-            self.from_file(self._filesrc)
-            self._isloaded = True
+            fformat, templated, engine = self._loadargs or (None, False, None)
+            template = self if templated else None
+            self.from_file(
+                self._filesrc, fformat=fformat, template=template, engine=engine
+            )
 
     def to_file(self, mfile, fformat="irap_binary", pmd_dataunits=(15, 10), **kwargs):
         """Export a surface (map) to file.
@@ -793,7 +823,8 @@ class RegularSurface(object):
                 storm_binary/ijxyz/petromod. Default is irap_binary.
             pmd_dataunits (tuple of int): A tuple of length 2 for petromod format,
                 spesifying metadata for units (DataUnitDistance, DataUnitZ)
-            **kwargs: Special settings (for developers)
+            **kwargs: Special settings, e.g. engine="python" for a numpy based
+                Irap binary writer (default is engine="cxtgeo", the C writer).
 
         Examples::
 
@@ -811,6 +842,7 @@ class RegularSurface(object):
             newsurf = xtgeo.RegularSurface(stream, fformat="irap_binary")
 
         .. versionchanged:: 2.5.0 Added support for BytesIO
+        .. versionchanged:: 2.8.0 The python engine is vectorised, and respects yflip
         """
 
         engine = kwargs.get("engine", "cxtgeo")
@@ -2237,6 +2269,7 @@ class RegularSurface(object):
         zone_avg=False,
         coarsen=1,
         mask_outside=False,
+        workers=1,
     ):
         """Make a thickness weighted HC thickness map.
 
@@ -2267,8 +2300,14 @@ class RegularSurface(object):
                 speed up process, but less precise result. Default=1
             mask_outside (bool): Will mask the result map undef where sum of DZ
                 is zero. Default is False as it costs some extra CPU.
+            workers (int): Number of layers to grid in parallel (threads);
+                default is 1 (serial), None means number of CPUs. The
+                triangulation of a layer is reused for HC and DZ, and for
+                other layers with same X Y.
         Returns:
             True if operation went OK (but check result!), False if not
+
+        .. versionchanged:: 2.8.0 Added workers
         """
 
         for inum, myprop in enumerate([xprop, yprop, hcpfzprop, zoneprop]):
@@ -2292,6 +2331,7 @@ class RegularSurface(object):
             zone_avg=zone_avg,
             coarsen=coarsen,
             mask_outside=mask_outside,
+            workers=workers,
         )
 
         if status is False:
@@ -2308,6 +2348,7 @@ class RegularSurface(object):
         zone_minmax=None,
         coarsen=1,
         zone_avg=False,
+        workers=1,
     ):
         """
         Make an average map (DZ weighted) based on numpy arrays of
@@ -2327,9 +2368,13 @@ class RegularSurface(object):
             zoneprop: 3D numpy to a zone property
             zone_minmax: a tuple with from-to zones to combine
                 (e.g. (1,3))
+            workers (int): Number of layers to grid in parallel (threads);
+                default is 1 (serial), None means number of CPUs.
 
         Returns:
             Nothing explicit, but updates the surface object.
+
+        .. versionchanged:: 2.8.0 Added workers
         """
 
         for inum, myprop in enumerate([xprop, yprop, mprop, dzprop, zoneprop]):
@@ -2353,6 +2398,7 @@ class RegularSurface(object):
             zone_minmax=zone_minmax,
             coarsen=coarsen,
             zone_avg=zone_avg,
+            workers=workers,
         )
 
     def quickplot(
@@ -5,15 +5,46 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
-import numpy as np
+import pandas as pd
 
 import xtgeo
+from xtgeo.common import _ensemble
 from . import _surfs_import
+from . import _surfs_stats
+from . import _surfs_cube
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+def surfaces_catalog(files, workers=1, executor="process"):
+    """Scan surface files, and return their geometry as a Pandas DataFrame.
+
+    Only the metadata (header) of each file is read, not the map values, so
+    thousands of files, e.g. an ensemble of realisations, can be checked
+    quickly. Files that cannot be read as surfaces are skipped with a warning.
+
+    The columns are NAME, FILE, NCOL, NROW, XORI, YORI, XINC, YINC, ROTATION
+    and YFLIP, i.e. one row per file.
+
+    Args:
+        files (list or str): List of file names, or a directory (all files with
+            a known surface extension), or a glob pattern, e.g. "maps/*.gri"
+        workers (int): Number of workers; default is 1, i.e. no pool. None
+            means number of CPUs.
+        executor (str): "process" (default) or "thread".
+
+    Example::
+
+        cat = xtgeo.surfaces_catalog("share/results/maps/*--ds_extract*.gri")
+        if len(cat.drop_duplicates(["NCOL", "NROW", "XORI", "YORI"])) > 1:
+            print("Surfaces do not have the same topology")
+
+    .. versionadded:: 2.8.0
+    """
+    return _surfs_import.catalog(files, workers=workers, executor=executor)
+
+
 class Surfaces(object):
     """Class for a collection of Surface objects, for operations that involves
     a number of surfaces, such as statistical numbers.
@@ -28,6 +59,10 @@ class Surfaces(object):
         input (list, optional): A list of XTGeo objects and/or file names)
         subtype (str): "tops", "isochores", or None (default)
         order (str): Assummed order: "same", "stratigraphic", None(default)
+        workers (int): Number of workers for reading files concurrently;
+            default is 1 (no pool), cf. :meth:`append`.
+        executor (str): "process" (default) or "thread", cf. :meth:`append`.
+        lazy (bool): If True, read only metadata from files, cf. :meth:`append`.
 
     .. seealso::
        Class :class:`~xtgeo.surface.regular_surface.RegularSurface` class.
@@ -42,7 +77,12 @@ class Surfaces(object):
         self._order = None  # could be "same", "stratigraphic" or None
 
         if args:
-            self.append(args[0])
+            self.append(
+                args[0],
+                workers=kwargs.get("workers", 1),
+                executor=kwargs.get("executor", "process"),
+                lazy=kwargs.get("lazy", False),
+            )
             self._subtype = kwargs.get("subtype", None)
             self._order = kwargs.get("order", None)
 
@@ -62,18 +102,46 @@ class Surfaces(object):
 
         self._surfaces = slist
 
-    def append(self, slist):
+    def append(self, slist, workers=1, executor="process", lazy=False):
         """Append surfaces from either a list of RegularSurface objects,
-        a list of files, or a mix."""
+        a list of files, or a mix.
+
+        Files can be read concurrently in a pool of workers (opt-in, see
+        workers), which is useful for e.g. the same surface from many
+        realisations.
+
+        Args:
+            slist (list): List of RegularSurface objects and/or file names
+            workers (int): Number of workers; default is 1, which reads the
+                files one by one without a pool. None means number of CPUs.
+            executor (str): "process" (default) or "thread". The file
+                readers keep the Python GIL, so threads will mostly not
+                read files in parallel.
+            lazy (bool): If True, only metadata are read from the
+                files, and :meth:`statistics` will read the values of one
+                surface at a time. This keeps memory use low for large
+                ensembles.
+
+        .. versionchanged:: 2.8.0 Added workers, executor and lazy
+        """
+        files = [item for item in slist if not isinstance(item, xtgeo.RegularSurface)]
+        jobs = [(sfile, not lazy) for sfile in files]
+        loaded = iter(
+            _ensemble.load_many(
+                _surface_from_file_or_none, jobs, workers=workers, executor=executor
+            )
+        )
+
         for item in slist:
             if isinstance(item, xtgeo.RegularSurface):
                 self._surfaces.append(item)
+                continue
+
+            sobj = next(loaded)
+            if sobj is None:
+                xtg.warnuser("Cannot read as file, skip: {}".format(item))
             else:
-                try:
-                    sobj = xtgeo.surface_from_file(item, fformat="guess")
-                    self._surfaces.append(sobj)
-                except OSError:
-                    xtg.warnuser("Cannot read as file, skip: {}".format(item))
+                self._surfaces.append(sobj)
 
     def describe(self, flush=True):
         """Describe an instance by printing to stdout"""
@@ -105,6 +173,17 @@ class Surfaces(object):
 
         return new
 
+    def catalog(self):
+        """Return the geometry of each surface as a Pandas DataFrame.
+
+        This works also for lazy instances (no values are read), see
+        :func:`surfaces_catalog` for the columns.
+
+        .. versionadded:: 2.8.0
+        """
+        rows = [_surfs_import.metadata(surf) for surf in self._surfaces]
+        return pd.DataFrame(rows, columns=_surfs_import.CATALOG_COLUMNS)
+
     def get_surface(self, name):
         """Get a RegularSurface() instance by name, or return None if name not found"""
 
@@ -114,6 +193,52 @@ class Surfaces(object):
                 return surf
         return None
 
+    def get_stacked_values(self):
+        """Return values of all surfaces as one stacked masked numpy array.
+
+        The first axis is the surface number, so for an ensemble of surfaces
+        the shape will be (nrealisations, ncol, nrow). A list with metadata
+        of each surface is also returned.
+
+        Returns:
+            A tuple (stacked, metadata), where metadata is a list of dicts
+            with keys "name", "filesrc", "ncol" and "nrow".
+
+        Raises:
+            ValueError: If there are no surfaces, or surfaces differ in topology.
+
+        Example::
+
+            surfs = Surfaces(mylist, workers=8)  # mylist is many files
+            stacked, meta = surfs.get_stacked_values()
+            print(meta[0]["filesrc"], stacked[0].mean())
+
+        .. versionadded:: 2.8.0
+        """
+
+        if not self.surfaces:
+            raise ValueError("Cannot stack values, there are no surfaces")
+
+        template = self.surfaces[0]
+        metadata = []
+        for surf in self.surfaces:
+            if not template.compare_topology(surf, strict=False):
+                raise ValueError("Cannot stack values, surfaces differ in topology")
+            metadata.append(
+                {
+                    "name": surf.name,
+                    "filesrc": surf.filesrc,
+                    "ncol": surf.ncol,
+                    "nrow": surf.nrow,
+                }
+            )
+
+        for surf in self.surfaces:
+            surf.load_values()
+
+        stacked = _ensemble.stack_values([surf.values for surf in self.surfaces])
+        return stacked, metadata
+
     def from_grid3d(self, grid, subgrids=True, rfactor=1):
         """Derive surfaces from a 3D grid"""
         _surfs_import.from_grid3d(self, grid, subgrids, rfactor)
@@ -126,6 +251,12 @@ class Surfaces(object):
 
         E.g. surfs.apply(np.nanmean, axis=0) will return the mean surface.
 
+        The function is given all values as one float64 numpy array of shape
+        (nsurf, ncol, nrow), with nan for undefined values. The array is
+        allocated once and filled one surface at a time; surfaces in a lazy
+        instance (see :meth:`append`) are read and released one by one. For
+        statistics, :meth:`statistics` needs much less memory.
+
         Args:
             func: Function to apply
             args: The function arguments
@@ -136,29 +267,35 @@ class Surfaces(object):
 
         """
 
-        template = self.surfaces[0].copy()
-        slist = []
-        for surf in self.surfaces:
-            status = template.compare_topology(surf, strict=False)
-            if not status:
-                raise ValueError("Cannot do statistics, surfaces differ in topology")
-            slist.append(np.ma.filled(surf.values, fill_value=np.nan))
+        return _surfs_stats.apply(self, func, *args, **kwargs)
 
-        xlist = np.array(slist)
-
-        template.values = func(xlist, *args, **kwargs)
-        return template
-
-    def statistics(self):
+    def statistics(self, percentiles=None, maxmemory=None):
         """Return statistical measures from the surfaces.
 
         The statistics returned is:
+
         * mean: the arithmetic mean surface
         * std: the standard deviation surface (where ddof = 1)
+        * min, max: the minimum and maximum surface
+        * count: the number of defined values per node
+        * pNN: percentile NN for each of the given percentiles, e.g. p10
+
+        The surfaces are visited one at a time, and mean and std are
+        accumulated by Welford's method, so surfaces in a lazy instance (see
+        :meth:`append`) are never all in memory. Percentiles are exact; they
+        are computed for bands of columns, where the band size is set from
+        maxmemory, i.e. bands of rows. For lazy surfaces from Irap binary
+        files, each band is read directly from the files; values of other
+        lazy surfaces are kept in a temporary file (as float32) for this.
 
         Currently this function expects that the surfaces all have the same
         shape/topology.
 
+        Args:
+            percentiles (list): Percentiles to compute, e.g. [10, 50, 90]
+            maxmemory (float): Memory budget in GB for the percentile bands,
+                default is 1.
+
         Returns:
             dict: A dictionary of statistical measures, see list above
 
@@ -167,43 +304,140 @@ class Surfaces(object):
 
         Example::
 
-            surfs = Surfaces(mylist)  # mylist is a collection of files
-            stats = surfs.statistics()
+            surfs = Surfaces(mylist, lazy=True)  # mylist is a collection of files
+            stats = surfs.statistics(percentiles=[10, 50, 90])
             # export the mean surface
             stats["mean"].to_file("mymean.gri")
-        """
-        result = {}
+            stats["p90"].to_file("myp90.gri")
 
-        template = self.surfaces[0].copy()
+        .. versionchanged:: 2.8.0 Added percentiles and maxmemory, and min, max
+           and count in result
+        """
+        return _surfs_stats.statistics(
+            self, percentiles=percentiles, maxmemory=maxmemory
+        )
+
+    def slice_cube(
+        self,
+        cube,
+        sampling="nearest",
+        mask=True,
+        snapxy=False,
+        deadtraces=True,
+        workers=1,
+        executor="process",
+    ):
+        """Slice a cube along each surface, and return the sampled surfaces.
+
+        This is as :meth:`RegularSurface.slice_cube()
+        <xtgeo.surface.regular_surface.RegularSurface.slice_cube>` for each
+        surface (as depth or time map), but the surfaces can be sliced in a
+        pool of workers. With processes (default executor), the cube values
+        are put once in shared memory (a memory mapped file), which all
+        workers read from. The surfaces in this instance are not changed.
 
-        slist = []
-        for surf in self.surfaces:
-            status = template.compare_topology(surf, strict=False)
-            if not status:
-                raise ValueError("Cannot do statistics, surfaces differ in topology")
-            slist.append(np.ma.filled(surf.values, fill_value=np.nan))
+        Args:
+            cube (Cube): Instance of a Cube()
+            sampling (str): 'nearest' for nearest node (default), or
+                'trilinear' for trilinear interpolation.
+            mask (bool): If True (default), then the map values outside
+                the cube will be undef.
+            snapxy (bool): If True, then the map values will get values at
+                nearest Cube XY location.
+            deadtraces (bool): If True (default) then dead cube traces are
+                treated as undefined.
+            workers (int): Number of workers; default is 1, which slices one
+                surface at a time without a pool. None means number of CPUs.
+            executor (str): "process" (default) or "thread". Note that the C
+                routines keep the Python GIL, so threads will not run in
+                parallel.
 
-        xlist = np.array(slist)
+        Returns:
+            A list of RegularSurface instances, in the same order as surfaces.
 
-        # mean
-        template.values = np.nanmean(xlist, axis=0)
-        result["mean"] = template.copy()
+        Example::
 
-        # std, run with degree of freedom ddof=1, similar to RMS
-        template.values = np.nanstd(xlist, axis=0, ddof=1)
-        result["std"] = template.copy()
+            horizons = Surfaces(["top.gri", "mid.gri", "base.gri"])
+            cube = Cube("some.segy")
+            amplitudes = horizons.slice_cube(cube, sampling="trilinear")
 
-        # # median P50 (SLOW!)
-        # template.values = np.nanpercentile(xlist, 50, axis=0)
-        # result["median"] = template.copy()
-        # result["p50"] = result["median"]
+        .. versionadded:: 2.8.0
+        """
+        return _surfs_cube.slice_cube(
+            self,
+            cube,
+            workers=workers,
+            executor=executor,
+            sampling=sampling,
+            mask=mask,
+            snapxy=snapxy,
+            deadtraces=deadtraces,
+        )
+
+    def slice_cube_window(
+        self,
+        cube,
+        zrange=10,
+        ndiv=None,
+        attribute="max",
+        sampling="nearest",
+        mask=True,
+        snapxy=False,
+        deadtraces=True,
+        workers=1,
+        executor="process",
+    ):
+        """Slice a cube in a window along each surface, and return attributes.
+
+        This is as :meth:`RegularSurface.slice_cube_window()
+        <xtgeo.surface.regular_surface.RegularSurface.slice_cube_window>`
+        with a constant window for each surface, where the surfaces are
+        processed in a pool of workers if asked for, see :meth:`slice_cube`.
 
-        # # P10
-        # template.values = np.nanpercentile(xlist, 10, axis=0)
-        # result["p10"] = template.copy()
+        Args:
+            cube (Cube): Instance of a Cube()
+            zrange (float): The one-sided range of the window, default 10.
+            ndiv (int): Number of intervals for sampling within zrange. None
+                means 'auto' sampling, using 0.5 of cube Z increment as basis.
+            attribute (str or list): The requested attribute(s), e.g. 'max', or
+                a list of attributes, e.g. ['min', 'rms', 'max'].
+            sampling (str): 'nearest' for nearest node (default), or
+                'trilinear' for trilinear interpolation.
+            mask (bool): If True (default), then the map values outside
+                the cube will be undef.
+            snapxy (bool): If True, then the map values will get values at
+                nearest Cube XY location.
+            deadtraces (bool): If True (default) then dead cube traces are
+                treated as undefined.
+            workers (int): Number of workers; default is 1 (no pool).
+            executor (str): "process" (default) or "thread".
 
-        # # P90
-        # template.values = np.nanpercentile(xlist, 90, axis=0)
-        # result["p90"] = template.copy()
+        Returns:
+            A list in the same order as surfaces, of RegularSurface instances
+            if attribute is a string, or of dictionaries of RegularSurface
+            instances (one per attribute) if attribute is a list.
 
-        return result
+        .. versionadded:: 2.8.0
+        """
+        return _surfs_cube.slice_cube_window(
+            self,
+            cube,
+            workers=workers,
+            executor=executor,
+            zrange=zrange,
+            ndiv=ndiv,
+            attribute=attribute,
+            sampling=sampling,
+            mask=mask,
+            snapxy=snapxy,
+            deadtraces=deadtraces,
+        )
+
+
+def _surface_from_file_or_none(job):
+    # module level function, so it can be used in a process pool
+    sfile, values = job
+    try:
+        return xtgeo.surface_from_file(sfile, fformat="guess", values=values)
+    except OSError:
+        return None
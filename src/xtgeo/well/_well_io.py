@@ -30,90 +30,51 @@ def import_rms_ascii(
     xlognames_all = ["X_UTME", "Y_UTMN", "Z_TVDSS"]
     xlognames = []
 
-    lnum = 1
+    # the header and the numeric body are read from the same file handle
     with open(wfile, "r") as fwell:
-        for line in fwell:
-            if lnum == 1:
-                _ffver = line.strip()  # noqa, file version
-            elif lnum == 2:
-                _wtype = line.strip()  # noqa, well type
-            elif lnum == 3:
-                # usually 4 fields, but last (rkb) can be missing. A
-                # complication is that first field (well name) may have spaces,
-                # hence some clever guessing is needed. However, this cannot be
-                # 100% foolproof... if Ycoord < 1000 and last item of a well
-                # name with spaces is a number, then this may fail.
-                assume_rkb = False
-                row = line.strip().split()
-                newrow = []
-                if len(row) > 3:
-                    for item in row:
-                        try:
-                            item = float(item)
-                        except ValueError:
-                            item = str(item)
-                        newrow.append(item)
-                    if all(isinstance(var, float) for var in newrow[-3:]):
-                        if abs(newrow[-1] < 1000.0):
-                            assume_rkb = True
-
-                if assume_rkb:
-                    rkb = float(row.pop())
-                else:
-                    rkb = None
-                ypos = float(row.pop())
-                xpos = float(row.pop())
-                wname = " ".join(map(str, row))
-
-            elif lnum == 4:
-                nlogs = int(line)
-                nlogread = 1
-                logger.debug("Number of logs: %s", nlogs)
+        _ffver = fwell.readline().strip()  # noqa, file version
+        _wtype = fwell.readline().strip()  # noqa, well type
+        wname, xpos, ypos, rkb = _parse_wellhead(fwell.readline())
 
-            else:
-                row = line.strip().split()
-                lname = row[0]
-
-                # if i_index etc, make uppercase to I_INDEX
-                # however it is most practical to treat indexes as CONT logs
-                if "_index" in lname:
-                    lname = lname.upper()
-
-                ltype = row[1].upper()
-
-                rxv = row[2:]
-
-                xlognames_all.append(lname)
-                xlognames.append(lname)
+        nlogs = int(fwell.readline())
+        logger.debug("Number of logs: %s", nlogs)
 
-                wlogtype[lname] = ltype
+        for _ in range(nlogs):
+            row = fwell.readline().strip().split()
+            lname = row[0]
 
-                logger.debug("Reading log name %s of type %s", lname, ltype)
+            # if i_index etc, make uppercase to I_INDEX
+            # however it is most practical to treat indexes as CONT logs
+            if "_index" in lname:
+                lname = lname.upper()
 
-                if ltype == "DISC":
-                    xdict = {int(rxv[i]): rxv[i + 1] for i in range(0, len(rxv), 2)}
-                    wlogrecord[lname] = xdict
-                else:
-                    wlogrecord[lname] = rxv
+            ltype = row[1].upper()
 
-                nlogread += 1
+            rxv = row[2:]
 
-                if nlogread > nlogs:
-                    break
+            xlognames_all.append(lname)
+            xlognames.append(lname)
 
-            lnum += 1
+            wlogtype[lname] = ltype
 
-    # now import all logs as pandas framework
+            logger.debug("Reading log name %s of type %s", lname, ltype)
 
-    dfr = pd.read_csv(
-        wfile,
-        delim_whitespace=True,
-        skiprows=lnum,
-        header=None,
-        names=xlognames_all,
-        dtype=np.float64,
-        na_values=-999,
-    )
+            if ltype == "DISC":
+                xdict = {int(rxv[i]): rxv[i + 1] for i in range(0, len(rxv), 2)}
+                wlogrecord[lname] = xdict
+            else:
+                wlogrecord[lname] = rxv
+
+        # now import all logs as pandas framework, from current position
+        dfr = pd.read_csv(
+            fwell,
+            delim_whitespace=True,
+            header=None,
+            names=xlognames_all,
+            dtype=np.float64,
+            na_values=-999,
+            engine="c",
+        )
 
     # undef values have a high float number? or keep Nan?
     # df.fillna(Well.UNDEF, inplace=True)
@@ -134,6 +95,40 @@ def import_rms_ascii(
     self._zonelogname = zonelogname
 
 
+def _parse_wellhead(line):
+    """Parse the well name, X, Y and (optional) RKB line.
+
+    Usually 4 fields, but last (rkb) can be missing. A complication is that
+    first field (well name) may have spaces, hence some clever guessing is
+    needed. However, this cannot be 100% foolproof... if Ycoord < 1000 and last
+    item of a well name with spaces is a number, then this may fail.
+    """
+
+    assume_rkb = False
+    row = line.strip().split()
+    newrow = []
+    if len(row) > 3:
+        for item in row:
+            try:
+                item = float(item)
+            except ValueError:
+                item = str(item)
+            newrow.append(item)
+        if all(isinstance(var, float) for var in newrow[-3:]):
+            if abs(newrow[-1] < 1000.0):
+                assume_rkb = True
+
+    if assume_rkb:
+        rkb = float(row.pop())
+    else:
+        rkb = None
+    ypos = float(row.pop())
+    xpos = float(row.pop())
+    wname = " ".join(map(str, row))
+
+    return wname, xpos, ypos, rkb
+
+
 def _trim_on_lognames(dfr, lognames, lognames_strict, wname):
     """Reduce the dataframe based on provided list of lognames"""
     if lognames == "all":
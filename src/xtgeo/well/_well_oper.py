@@ -3,13 +3,11 @@
 
 from __future__ import print_function, absolute_import
 import copy
-from distutils.version import StrictVersion
 
 import numpy as np
 import pandas as pd
 
 import xtgeo
-import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import constants as const
 
@@ -53,12 +51,11 @@ def delete_log(self, lname):
 def rescale(self, delta=0.15, tvdrange=None):
     """Rescale by using a new MD increment
 
-    The rescaling is technically done by interpolation in the Pandas dataframe
+    All logs are linearly interpolated in MD with numpy, using the defined
+    values of each log; values outside the defined range of a log are kept
+    undefined. Discrete logs are rounded to nearest integer afterwards.
     """
 
-    pdrows = pd.options.display.max_rows
-    pd.options.display.max_rows = 999
-
     dfrcolumns0 = self._df.columns
 
     if self.mdlogname is None:
@@ -67,62 +64,82 @@ def rescale(self, delta=0.15, tvdrange=None):
     dfrcolumns1 = self._df.columns
     columnsadded = list(set(dfrcolumns1) - set(dfrcolumns0))  # new tmp columns, if any
 
-    dfr = self._df.copy().set_index(self.mdlogname)
-
-    logger.debug("Initial dataframe\n %s", dfr)
+    lognames = [lname for lname in self._df.columns if lname != self.mdlogname]
+    mdv = self._df[self.mdlogname].values.astype(np.float64)
+    values = self._df[lognames].values.astype(np.float64)
 
-    start = dfr.index[0]
-    stop = dfr.index[-1]
+    start = mdv[0]
+    stop = mdv[-1]
     startt = start
     stopt = stop
 
     if tvdrange and isinstance(tvdrange, tuple) and len(tvdrange) == 2:
         tvd1, tvd2 = tvdrange
+        zvalues = self._df["Z_TVDSS"].values
 
-        try:
-            startt = dfr.index[dfr["Z_TVDSS"] >= tvd1][0]
-        except IndexError:
-            startt = start
+        above = np.flatnonzero(zvalues >= tvd1)
+        if above.size > 0:
+            startt = mdv[above[0]]
 
-        try:
-            stopt = dfr.index[dfr["Z_TVDSS"] >= tvd2][0]
-        except IndexError:
-            stopt = stop
-
-    dfr1 = dfr[start:startt]
-    dfr2 = dfr[stopt:stop]
+        above = np.flatnonzero(zvalues >= tvd2)
+        if above.size > 0:
+            stopt = mdv[above[0]]
 
     nentry = int(round((stopt - startt) / delta))
+    mdnew = np.linspace(startt, stopt, num=nentry)
+
+    # the resampled part, with the original parts before and after (if tvdrange)
+    head = mdv <= startt
+    tail = mdv >= stopt
+    mdall = np.concatenate([mdv[head], mdnew, mdv[tail]])
+    allvalues = np.concatenate(
+        [values[head], _interpolate_logs(mdv, values, mdnew), values[tail]]
+    )
 
-    dfr = dfr.reindex(dfr.index.union(np.linspace(startt, stopt, num=nentry)))
-    dfr = dfr.interpolate("index", limit_area="inside").loc[
-        np.linspace(startt, stopt, num=nentry)
-    ]
-
-    if StrictVersion(pd.__version__) > StrictVersion("0.23.0"):
-        dfr = pd.concat([dfr1, dfr, dfr2], sort=False)
-    else:
-        dfr = pd.concat([dfr1, dfr, dfr2])
+    dfr = pd.DataFrame(allvalues, columns=lognames)
 
-    dfr.drop_duplicates(inplace=True)
-    dfr[self.mdlogname] = dfr.index
-    dfr.reset_index(inplace=True, drop=True)
+    # remove rows that are repeated where the parts meet; rows can only be equal
+    # if the first log is, so the full row comparison is done on a few candidates
+    keep = np.ones(len(dfr), dtype=bool)
+    candidates = dfr.iloc[:, 0].duplicated(keep=False).values
+    keep[candidates] = ~dfr[candidates].duplicated().values
+    dfr = dfr[keep].reset_index(drop=True)
+    dfr[self.mdlogname] = mdall[keep]
 
-    for lname in dfr.columns:
-        if lname in self._wlogtype:
-            ltype = self._wlogtype[lname]
-            if ltype == "DISC":
-                dfr = dfr.round({lname: 0})
+    for lname in lognames:
+        if self._wlogtype.get(lname, None) == "DISC":
+            dfr[lname] = np.round(dfr[lname].values)
 
     logger.debug("Updated dataframe:\n%s", dfr)
 
-    pd.options.display.max_rows = pdrows  # reset
-
     self._df = dfr
     if columnsadded:
         self.delete_log(columnsadded)
 
 
+def _interpolate_logs(mdv, values, mdnew):
+    """Interpolate each log (column in values) from mdv to mdnew.
+
+    Undefined (NaN) values are ignored, and values outside the first and last
+    defined value of a log are NaN, as pandas interpolate(limit_area="inside").
+    """
+
+    result = np.full((mdnew.size, values.shape[1]), np.nan)
+    defined = ~np.isnan(values)
+
+    for num in range(values.shape[1]):
+        mdlog = mdv[defined[:, num]]
+        if mdlog.size == 0:
+            continue
+
+        inside = (mdnew >= mdlog[0]) & (mdnew <= mdlog[-1])
+        result[inside, num] = np.interp(
+            mdnew[inside], mdlog, values[defined[:, num], num]
+        )
+
+    return result
+
+
 def make_zone_qual_log(self, zqname):
     """Make a flag log based on stratigraphic relations"""
 
@@ -190,43 +207,24 @@ def make_zone_qual_log(self, zqname):
 def get_ijk_from_grid(self, grid, grid_id=""):
     """Getting IJK from a grid as well logs."""
 
-    wxarr = self.get_carray("X_UTME")
-    wyarr = self.get_carray("Y_UTMN")
-    wzarr = self.get_carray("Z_TVDSS")
-
-    nlen = self.nrow
-    wivec = _cxtgeo.new_intarray(nlen)
-    wjvec = _cxtgeo.new_intarray(nlen)
-    wkvec = _cxtgeo.new_intarray(nlen)
-
-    onelayergrid = grid.copy()
-    onelayergrid.reduce_to_one_layer()
-
-    cstatus = _cxtgeo.grd3d_well_ijk(
-        grid.ncol,
-        grid.nrow,
-        grid.nlay,
-        grid._coordsv,
-        grid._zcornsv,
-        grid._actnumsv,
-        onelayergrid._zcornsv,
-        onelayergrid._actnumsv,
-        self.nrow,
-        wxarr,
-        wyarr,
-        wzarr,
-        wivec,
-        wjvec,
-        wkvec,
-        0
+    from xtgeo.grid3d import _grid_cellindex  # avoid circular import
+
+    iarr, jarr, karr = _grid_cellindex.wells_ijk(
+        grid,
+        self._df["X_UTME"].values,
+        self._df["Y_UTMN"].values,
+        self._df["Z_TVDSS"].values,
     )
 
-    if cstatus != 0:
-        raise RuntimeError("Error from C routine, code is {}".format(cstatus))
+    set_ijk_logs(self, grid, iarr, jarr, karr, grid_id=grid_id)
+
+
+def set_ijk_logs(self, grid, iarr, jarr, karr, grid_id=""):
+    """Set I J K arrays from the C search (0 if outside) as discrete logs."""
 
-    indarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wivec).astype("float")
-    jndarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wjvec).astype("float")
-    kndarray = _cxtgeo.swig_carr_to_numpy_i1d(nlen, wkvec).astype("float")
+    indarray = iarr.astype("float")
+    jndarray = jarr.astype("float")
+    kndarray = karr.astype("float")
 
     indarray[indarray == 0] = np.nan
     jndarray[jndarray == 0] = np.nan
@@ -247,27 +245,11 @@ def get_ijk_from_grid(self, grid, grid_id=""):
     self._wlogrecord[jcellname] = {ncel: str(ncel) for ncel in range(1, grid.nrow + 1)}
     self._wlogrecord[kcellname] = {ncel: str(ncel) for ncel in range(1, grid.nlay + 1)}
 
-    _cxtgeo.delete_intarray(wivec)
-    _cxtgeo.delete_intarray(wjvec)
-    _cxtgeo.delete_intarray(wkvec)
-    _cxtgeo.delete_doublearray(wxarr)
-    _cxtgeo.delete_doublearray(wyarr)
-    _cxtgeo.delete_doublearray(wzarr)
-
-    del onelayergrid
-
 
 def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_id=""):
     """Gettting gridproperties as logs"""
 
-    if not isinstance(gridprops, (xtgeo.GridProperty, xtgeo.GridProperties)):
-        raise ValueError('"gridprops" not a GridProperties or GridProperty instance')
-
-    if isinstance(gridprops, xtgeo.GridProperty):
-        gprops = xtgeo.GridProperties()
-        gprops.append_props([gridprops])
-    else:
-        gprops = gridprops
+    gprops = as_gridproperties(gridprops)
 
     if isinstance(grid, tuple):
         icl, jcl, kcl = grid
@@ -277,9 +259,37 @@ def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_i
     else:
         raise ValueError('The "grid" is of wrong type, must be a tuple or ' "a Grid")
 
-    iind = self.dataframe[icl].values - 1
-    jind = self.dataframe[jcl].values - 1
-    kind = self.dataframe[kcl].values - 1
+    values = sample_gridproperties(
+        gprops,
+        self.dataframe[icl].values,
+        self.dataframe[jcl].values,
+        self.dataframe[kcl].values,
+    )
+
+    set_gridproperty_logs(self, gprops, values, prop_id=prop_id)
+    self.delete_logs(["ICELL_tmp", "JCELL_tmp", "KCELL_tmp"])
+
+
+def as_gridproperties(gridprops):
+    """Return a GridProperties instance from a GridProperty or GridProperties."""
+
+    if not isinstance(gridprops, (xtgeo.GridProperty, xtgeo.GridProperties)):
+        raise ValueError('"gridprops" not a GridProperties or GridProperty instance')
+
+    if isinstance(gridprops, xtgeo.GridProperty):
+        gprops = xtgeo.GridProperties()
+        gprops.append_props([gridprops])
+        return gprops
+
+    return gridprops
+
+
+def sample_gridproperties(gprops, icells, jcells, kcells):
+    """Sample properties in cells (1 based, NaN if undefined), one array per prop."""
+
+    iind = icells - 1
+    jind = jcells - 1
+    kind = kcells - 1
 
     xind = iind.copy()
 
@@ -292,9 +302,19 @@ def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_i
     jind = jind.astype("int")
     kind = kind.astype("int")
 
+    values = []
     for prop in gprops.props:
         arr = prop.values[iind, jind, kind].astype("float")
         arr[np.isnan(xind)] = np.nan
+        values.append(arr)
+
+    return values
+
+
+def set_gridproperty_logs(self, gprops, values, prop_id=""):
+    """Set sampled property values as logs, discrete props as DISC logs."""
+
+    for prop, arr in zip(gprops.props, values):
         pname = prop.name + prop_id
         self.dataframe[pname] = arr
         self._wlognames.append(pname)
@@ -302,7 +322,6 @@ def get_gridproperties(self, gridprops, grid=("ICELL", "JCELL", "KCELL"), prop_i
             self._wlogtype[pname] = "DISC"
             self._wlogrecord[pname] = copy.deepcopy(prop.codes)
     self._ensure_consistency()
-    self.delete_logs(["ICELL_tmp", "JCELL_tmp", "KCELL_tmp"])
 
 
 def report_zonation_holes(self, threshold=5):
@@ -14,117 +14,235 @@ xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def extract_ztops(
-    self,
-    zonelist,
-    xcv,
-    ycv,
-    zcv,
-    zlog,
-    mdv,
-    incl,
-    tops=True,
-    incl_limit=80,
-    prefix="Top",
-    use_undef=False,
-):
-    """Extract a list of tops for a zone.
+def zonation_markers(zlog, zonelist, use_undef=False, starts=None):
+    """Find zone transitions in one or more zone logs, vectorised.
+
+    For an increasing zonation, the markers are at the first sample in the new
+    zone, while for a decreasing zonation they are at the last sample in the
+    previous zone. A jump over several zones gives one marker per zone.
 
     Args:
+        zlog (np): Zonelog as int array, with UNDEF_INT as undefined
         zonelist (list-like): The zonelog list numbers to apply; either
-            as a list, or a tuple; 2 entries forms a range [start, stop)
-        xcv (np): X Position numpy array
-        ycv (np): Y Position numpy array
-        zcv (np): Z Position numpy array
-        zlog (np): Zonelog array
-        mdv (np): MDepth log numpy array
-        incl (np): Inclination log numpy array
-        tops (bool): Compute tops or thickness (zone) points (default True)
-        incl_limit (float): Limitation of zone computation (angle, degrees)
+            as a list, or a tuple; 2 entries forms a range [start, stop].
+            None means no filtering.
         use_undef (bool): If True, then transition from UNDEF is also
             used.
+        starts (np): Start index for each well if zlog is several zone logs
+            concatenated; these must be increasing. Default is one well.
+
+    Returns:
+        Tuple of (sample index, zone number) arrays, in well order.
     """
-    # pylint: disable=too-many-locals, too-many-branches, too-many-statements
 
-    # The wellpoints will be a list of tuples (one tuple per hit)
-    wpts = []
-    zlogname = self.zonelogname
+    if zonelist is not None:
+        _check_zonelist(zonelist)
+
+    iundeflimit = const.UNDEF_INT_LIMIT
+
+    zlog = np.asarray(zlog, dtype=np.int64)
+    nsample = zlog.size
+    if nsample == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    starts = np.array([0] if starts is None else starts, dtype=np.int64)
+    segment = np.repeat(
+        np.arange(starts.size), np.diff(np.append(starts, nsample))
+    )
+
+    zeff = zlog
+    pzone0 = np.full(starts.size, const.UNDEF_INT, dtype=np.int64)
+    if use_undef:
+        # undefined is seen as a zone below the minimum zone of each well
+        pzone0 = np.minimum.reduceat(zlog, starts) - 1
+        zeff = np.where(zlog > iundeflimit, pzone0[segment], zlog)
+
+    prev = np.empty_like(zeff)
+    prev[1:] = zeff[:-1]
+    prev[starts] = pzone0
+
+    isstart = np.zeros(nsample, dtype=bool)
+    isstart[starts] = True
+
+    breaks = (prev != zeff) & (prev < iundeflimit) & (zeff < iundeflimit)
+    up = breaks & (prev < zeff)
+    down = breaks & (prev > zeff) & ~isstart
+
+    trans = np.flatnonzero(up | down)
+    tup = up[trans]
+    nzone = np.abs(zeff[trans] - prev[trans])
+    first = np.where(tup, prev[trans] + 1, prev[trans])
+    step = np.where(tup, 1, -1)
+    where = np.where(tup, trans, trans - 1)
+
+    # expand each transition into one marker per zone passed
+    owner = np.repeat(np.arange(trans.size), nzone)
+    offset = np.arange(owner.size) - np.repeat(np.cumsum(nzone) - nzone, nzone)
+    zones = first[owner] + step[owner] * offset
+    ind = where[owner]
+
+    if zonelist is None:
+        return ind, zones
 
-    logger.debug(zlog)
-    logger.info("Well name is %s", self.wellname)
+    keep = _in_zonelist(zones, zonelist)
+    return ind[keep], zones[keep]
+
+
+def zonation_points(
+    wells, tops=True, incl_limit=80, prefix="Top", zonelist=None, use_undef=False
+):
+    """Get tops or zone thickness points for a list of wells, in one go.
+
+    The zone logs for all wells are concatenated, and transitions are found
+    in one vectorised pass.
+
+    Returns:
+        Tuple of (dataframe, number of wells with zonelog), where dataframe
+        is None if no wells have a zonelog.
+    """
 
     if not tops and incl_limit is None:
         incl_limit = 80
 
-    azi = -999.0  # tmp so far
+    if zonelist is not None:
+        _check_zonelist(zonelist)
+
+    logs = []
+    for well in wells:
+        wlogs = _zonation_logs(well)
+        if wlogs is not None:
+            logs.append((well, wlogs))
+
+    if not logs:
+        return None, 0
+
+    usewells = [well for well, _wlogs in logs]
+    arrays = [np.concatenate(arr) for arr in zip(*[wlogs for _well, wlogs in logs])]
+    xvv, yvv, zvv, mdv, incl, zlog = arrays
+
+    sizes = np.array([wlogs[0].size for _well, wlogs in logs])
+    starts = np.cumsum(sizes) - sizes
+
+    # wells without samples are not a segment of their own
+    segwells = np.flatnonzero(sizes > 0)
+    ind, zones = zonation_markers(
+        zlog, None, use_undef=use_undef, starts=starts[segwells]
+    )
+    owner = segwells[np.searchsorted(starts[segwells], ind, side="right") - 1]
+
+    # filter on zonelist, which by default is from each well's zonelog record
+    # markers are in well order, so each well has a slice
+    bounds = np.searchsorted(owner, np.arange(len(usewells) + 1))
+    keep = np.ones(zones.size, dtype=bool)
+    topnames = np.empty(zones.size, dtype=object)
+    for iwell, well in enumerate(usewells):
+        mine = slice(bounds[iwell], bounds[iwell + 1])
+        if mine.start == mine.stop:
+            continue
+        wzonelist = zonelist
+        if wzonelist is None:
+            # need to declare as list; otherwise Py3 will get dict.keys
+            wzonelist = list(well.get_logrecord(well.zonelogname).keys())
+            _check_zonelist(wzonelist)
+        keep[mine] = _in_zonelist(zones[mine], wzonelist)
+        topnames[mine] = _zone_names(well, zones[mine], prefix)
 
-    usezonerange = range(0, 99999)
-    if isinstance(zonelist, tuple) and len(zonelist) == 2:
-        usezonerange = range(zonelist[0], zonelist[1] + 1)
-    elif isinstance(zonelist, list) and len(zonelist) > 1:
-        usezonerange = zonelist
+    ind, zones, owner, topnames = ind[keep], zones[keep], owner[keep], topnames[keep]
+
+    tcols = _marker_columns(xvv, yvv, zvv, mdv, incl, ind, zones, topnames)
+    wellnames = np.array([well.xwellname for well in usewells], dtype=object)
+    tcols["WellName"] = wellnames[owner]
+
+    if tops:
+        columns, names = tcols, _top_names
     else:
-        raise ValueError("Something is wrong with zonelist input")
+        columns = _thickness_columns(tcols, owner, incl_limit, prefix)
+        names = _thickness_names
+        owner = columns.pop("_owner")
+
+    # frames per run of wells with same MD column name, as the MD log may differ
+    mdnames = np.array(
+        ["Q_MDEPTH" if well.mdlogname is None else "M_MDEPTH" for well in usewells]
+    )
+    frames = []
+    runstart = 0
+    for iwell in range(1, len(usewells) + 1):
+        if iwell < len(usewells) and mdnames[iwell] == mdnames[runstart]:
+            continue
+        mdname = mdnames[runstart]
+        rows = (owner >= runstart) & (owner < iwell)
+        frames.append(
+            pd.DataFrame(
+                OrderedDict(
+                    (usename, columns[name][rows])
+                    for usename, name in zip(names(mdname), names("MD"))
+                )
+            )
+        )
+        runstart = iwell
 
-    iundef = const.UNDEF_INT
-    iundeflimit = const.UNDEF_INT_LIMIT
-    pzone = iundef
+    if len(frames) == 1:
+        return frames[0], len(usewells)
 
-    if use_undef:
-        pzone = zlog.min() - 1
-
-    for ind, zone in np.ndenumerate(zlog):
-
-        ino = ind[0]  # since ind is a tuple...
-
-        if use_undef and zone > iundeflimit:
-            zone = zlog.min() - 1
-
-        if pzone != zone and pzone < iundeflimit and zone < iundeflimit:
-            logger.debug("Found break in zonation")
-            if pzone < zone:
-                logger.debug("Found match with zonation increasing")
-                for kzv in range(pzone + 1, zone + 1):
-                    if kzv in usezonerange:
-                        zname = self.get_logrecord_codename(zlogname, kzv)
-                        zname = prefix + zname
-                        ztop = (
-                            xcv[ino],
-                            ycv[ino],
-                            zcv[ino],
-                            mdv[ino],
-                            incl[ino],
-                            azi,
-                            kzv,
-                            zname,
-                            self.xwellname,
-                        )
-                        wpts.append(ztop)
-            if pzone > zone and ino > 0:
-                logger.info("Found match, decreasing zonation")
-                for kzv in range(pzone, zone, -1):
-                    if kzv in usezonerange:
-                        zname = self.get_logrecord_codename(zlogname, kzv)
-                        zname = prefix + zname
-                        ztop = (
-                            xcv[ino - 1],
-                            ycv[ino - 1],
-                            zcv[ino - 1],
-                            mdv[ino - 1],
-                            incl[ino - 1],
-                            azi,
-                            kzv,
-                            zname,
-                            self.xwellname,
-                        )
-                        wpts.append(ztop)
-        pzone = zone
-
-    mdname = "Q_MDEPTH"
-    if self.mdlogname is not None:
-        mdname = "M_MDEPTH"
-
-    wpts_names = [
+    return pd.concat(frames, ignore_index=True), len(usewells)
+
+
+def _check_zonelist(zonelist):
+    if isinstance(zonelist, tuple) and len(zonelist) == 2:
+        return
+    if isinstance(zonelist, list) and len(zonelist) > 1:
+        return
+    raise ValueError("Something is wrong with zonelist input")
+
+
+def _in_zonelist(zones, zonelist):
+    """Mask for zones in zonelist, where a tuple is an inclusive range"""
+    if isinstance(zonelist, tuple):
+        return (zones >= zonelist[0]) & (zones <= zonelist[1])
+    return np.isin(zones, zonelist)
+
+
+def _zonation_logs(well):
+    """Return logs needed for zonation points, or None if no zonelog"""
+
+    well.geometrics()
+
+    # as zlog is float64; need to convert to int array with high
+    # number as undef
+    if well.zonelogname is None:
+        return None
+
+    zlog = well.dataframe[well.zonelogname].values
+    zlog = np.where(np.isnan(zlog), const.UNDEF_INT, zlog)
+    zlog = np.rint(zlog).astype(int)
+
+    mdv = well.dataframe["Q_MDEPTH"].values
+    if well.mdlogname is not None:
+        mdv = well.dataframe[well.mdlogname].values
+
+    return (
+        well.dataframe["X_UTME"].values,
+        well.dataframe["Y_UTMN"].values,
+        well.dataframe["Z_TVDSS"].values,
+        mdv,
+        well.dataframe["Q_INCL"].values,
+        zlog,
+    )
+
+
+def _zone_names(well, zones, prefix):
+    """Marker names from the zonelog codes, as an object array"""
+
+    codenames = {
+        zone: prefix + well.get_logrecord_codename(well.zonelogname, zone)
+        for zone in np.unique(zones).tolist()
+    }
+    return np.array([codenames[zone] for zone in zones.tolist()], dtype=object)
+
+
+def _top_names(mdname):
+    return [
         "X_UTME",
         "Y_UTMN",
         "Z_TVDSS",
@@ -136,13 +254,9 @@ def extract_ztops(
         "WellName",
     ]
 
-    if tops:
-        return wpts, wpts_names, None, None
-
-    # next get a MIDPOINT zthickness (DZ)
-    llen = len(wpts) - 1
 
-    zwpts_names = [
+def _thickness_names(mdname):
+    return [
         "X_UTME",
         "Y_UTMN",
         "Z_TVDSS",
@@ -156,52 +270,65 @@ def extract_ztops(
         "WellName",
     ]
 
-    zwpts = []
-    for ino in range(llen):
-        i1v = ino
-        i2v = ino + 1
-        xx1, yy1, zz1, md1, incl1, _azi1, zk1, zn1, wn1 = wpts[i1v]
-        xx2, yy2, zz2, md2, incl2, _azi2, zk2, zn2, _wn2 = wpts[i2v]
-
-        # mid point
-        xx_avg = (xx1 + xx2) / 2
-        yy_avg = (yy1 + yy2) / 2
-        md_avg = (md1 + md2) / 2
-        incl_avg = (incl1 + incl2) / 2
-
-        azi_avg = -999.0  # to be fixed later
-
-        zzp = round(abs(zz2 - zz1), 4)
-
-        useok = False
-
-        if incl_avg < incl_limit:
-            useok = True
-
-        if useok and zk2 != zk1:
-            usezk = zk1
-            usezn = zn1
-            if zk1 > zk2:
-                usezk = zk2
-                usezn = zn2
-            usezn = usezn[len(prefix) :]
-
-            zzone = (
-                xx_avg,
-                yy_avg,
-                zzp,
-                md_avg,
-                md1,
-                md2,
-                incl_avg,
-                azi_avg,
-                usezk,
-                usezn,
-                wn1,
-            )
-            zwpts.append(zzone)
 
-    return wpts, wpts_names, zwpts, zwpts_names
+def _marker_columns(xcv, ycv, zcv, mdv, incl, ind, zones, topnames):
+    """Tops as columns, using the sample values at the marker index"""
+
+    azi = -999.0  # tmp so far
+
+    return OrderedDict(
+        [
+            ("X_UTME", xcv[ind]),
+            ("Y_UTMN", ycv[ind]),
+            ("Z_TVDSS", zcv[ind]),
+            ("MD", mdv[ind]),
+            ("Q_INCL", incl[ind]),
+            ("Q_AZI", np.full(ind.size, azi)),
+            ("Zone", zones),
+            ("TopName", topnames),
+        ]
+    )
+
+
+def _thickness_columns(tcols, owner, incl_limit, prefix):
+    """Zone (thickness) points as mid points of consecutive tops in each well"""
+
+    xx1, xx2 = tcols["X_UTME"][:-1], tcols["X_UTME"][1:]
+    yy1, yy2 = tcols["Y_UTMN"][:-1], tcols["Y_UTMN"][1:]
+    zz1, zz2 = tcols["Z_TVDSS"][:-1], tcols["Z_TVDSS"][1:]
+    md1, md2 = tcols["MD"][:-1], tcols["MD"][1:]
+    zk1, zk2 = tcols["Zone"][:-1], tcols["Zone"][1:]
+    zn1, zn2 = tcols["TopName"][:-1], tcols["TopName"][1:]
+
+    incl_avg = (tcols["Q_INCL"][:-1] + tcols["Q_INCL"][1:]) / 2
+
+    use = (incl_avg < incl_limit) & (zk2 != zk1) & (owner[:-1] == owner[1:])
+
+    usezk = np.where(zk1 > zk2, zk2, zk1)[use]
+    usezn = np.where(zk1 > zk2, zn2, zn1)[use]
+
+    return OrderedDict(
+        [
+            ("X_UTME", ((xx1 + xx2) / 2)[use]),
+            ("Y_UTMN", ((yy1 + yy2) / 2)[use]),
+            (
+                "Z_TVDSS",
+                np.array([round(val, 4) for val in np.abs(zz2 - zz1)[use].tolist()]),
+            ),
+            ("MD_AVG", ((md1 + md2) / 2)[use]),
+            ("Q_MD1", md1[use]),
+            ("Q_MD2", md2[use]),
+            ("Q_INCL", incl_avg[use]),
+            ("Q_AZI", np.full(usezk.size, -999.0)),  # to be fixed later
+            ("Zone", usezk),
+            (
+                "ZoneName",
+                np.array([name[len(prefix) :] for name in usezn], dtype=object),
+            ),
+            ("WellName", tcols["WellName"][:-1][use]),
+            ("_owner", owner[:-1][use]),
+        ]
+    )
 
 
 def get_fraction_per_zone(
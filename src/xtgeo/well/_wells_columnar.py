@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Private module, a columnar (struct of arrays) store for a collection of wells.
+
+All wells are stacked in one contiguous numpy array per log, and the rows of
+well number i are ``offsets[i]:offsets[i + 1]``. Collection wide operations
+are then made as vectorised row masks, instead of one operation per well
+dataframe.
+"""
+
+from __future__ import division, absolute_import
+from __future__ import print_function
+
+from collections import OrderedDict
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+
+import xtgeo
+
+xtg = xtgeo.common.XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+SPEC_ORDER = ["WELLNAME", "X_UTME", "Y_UTMN", "Z_TVDSS"]
+
+
+class ColumnarWells(object):
+    """A columnar representation of a number of wells.
+
+    Each log is one contiguous numpy array for all wells, and ``offsets``
+    (length number of wells + 1) tells where each well starts. Logs that are
+    missing in a well are NaN for that well. Discrete logs have a code map,
+    which is the union of the log records of all wells.
+
+    Instances are made by :meth:`xtgeo.well.Wells.to_columnar`, and can be
+    converted back with :meth:`xtgeo.well.Wells.from_columnar`. The store is
+    a copy; changes to the Well objects afterwards are not reflected.
+
+    .. versionadded:: 2.8.0
+    """
+
+    def __init__(self):
+
+        self._names = []  # well names
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._logs = OrderedDict()  # logname: array for all wells
+        self._present = {}  # logname: bool array (per well), log exists in well
+        self._logtypes = {}  # logname: "CONT" or "DISC"
+        self._codes = {}  # logname: merged code map, for "DISC" logs
+        self._heads = []  # per well attributes, to recreate Well objects
+
+    @classmethod
+    def from_wells(cls, wells):
+        """Make a columnar store from a list of Well objects."""
+
+        # pylint: disable=protected-access
+
+        store = cls()
+
+        nrows = np.array([well.nrow for well in wells], dtype=np.int64)
+        store._offsets = np.concatenate(([0], np.cumsum(nrows))).astype(np.int64)
+
+        lognames = []
+        for well in wells:
+            for lname in well.dataframe:
+                if lname not in lognames:
+                    lognames.append(lname)
+
+        for lname in lognames:
+            store._present[lname] = np.array(
+                [lname in well.dataframe for well in wells], dtype=bool
+            )
+            store._logs[lname] = _stack(wells, lname, nrows)
+
+        for well in wells:
+            store._names.append(well.name)
+            store._heads.append(
+                {
+                    "rkb": well._rkb,
+                    "xpos": well._xpos,
+                    "ypos": well._ypos,
+                    "filesrc": well._filesrc,
+                    "mdlogname": well.mdlogname,
+                    "zonelogname": well.zonelogname,
+                    "lognames": list(well.dataframe.columns),
+                    "logtypes": deepcopy(well._wlogtype),
+                    "logrecords": deepcopy(well._wlogrecord),
+                }
+            )
+            for lname in well.dataframe:
+                store._logtypes.setdefault(lname, well.get_logtype(lname))
+                if well.get_logtype(lname) == "DISC":
+                    codes = store._codes.setdefault(lname, {})
+                    for code, name in (well.get_logrecord(lname) or {}).items():
+                        codes.setdefault(code, name)
+
+        logger.info("Columnar store with %s wells, %s rows", len(wells), store.nrow)
+        return store
+
+    def to_wells(self):
+        """Return a list of Well objects, one per well in the store."""
+
+        # pylint: disable=protected-access
+
+        wells = []
+        for num, head in enumerate(self._heads):
+            rows = slice(self._offsets[num], self._offsets[num + 1])
+
+            well = xtgeo.well.Well()
+            well._wname = self._names[num]
+            well._rkb = head["rkb"]
+            well._xpos = head["xpos"]
+            well._ypos = head["ypos"]
+            well._filesrc = head["filesrc"]
+            well._mdlogname = head["mdlogname"]
+            well._zonelogname = head["zonelogname"]
+            well._wlogtype = deepcopy(head["logtypes"])
+            well._wlogrecord = deepcopy(head["logrecords"])
+            well._df = pd.DataFrame(
+                OrderedDict(
+                    (lname, self._logs[lname][rows].copy())
+                    for lname in head["lognames"]
+                )
+            )
+            well._ensure_consistency()
+            wells.append(well)
+
+        return wells
+
+    # ==================================================================================
+    # Properties
+    # ==================================================================================
+
+    @property
+    def names(self):
+        """Returns a list of well names (read only)."""
+        return list(self._names)
+
+    @property
+    def offsets(self):
+        """Returns the well offset index; rows of well i are offsets[i]:offsets[i+1]"""
+        return self._offsets
+
+    @property
+    def nrow(self):
+        """Returns the total number of rows, for all wells."""
+        return int(self._offsets[-1])
+
+    @property
+    def lognames(self):
+        """Returns all log names, including X_UTME Y_UTMN Z_TVDSS."""
+        return list(self._logs)
+
+    @property
+    def wellindex(self):
+        """Returns the well number for each row, as an int array."""
+        return np.repeat(
+            np.arange(len(self._names), dtype=np.int64), np.diff(self._offsets)
+        )
+
+    # ==================================================================================
+    # Methods
+    # ==================================================================================
+
+    def get_log(self, lname):
+        """Returns the contiguous array of a log for all wells (a view)."""
+        return self._logs[lname]
+
+    def get_logtype(self, lname):
+        """Returns the type of a log (DISC or CONT), None if it does not exist."""
+        return self._logtypes.get(lname, None)
+
+    def get_codes(self, lname):
+        """Returns the code map of a discrete log, merged for all wells.
+
+        If wells use different names for a code, the first name found is used.
+        """
+        return self._codes.get(lname, None)
+
+    def get_well_rows(self, name):
+        """Returns the slice of rows for a well, or None if no such well."""
+        if name not in self._names:
+            return None
+        num = self._names.index(name)
+        return slice(self._offsets[num], self._offsets[num + 1])
+
+    def filter(self, mask):
+        """Keep only rows where mask (a bool array of length nrow) is True.
+
+        Wells where all rows are removed are kept, with no rows.
+        """
+
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (self.nrow,):
+            raise ValueError(
+                "Mask must have shape ({},), got {}".format(self.nrow, mask.shape)
+            )
+
+        counts = np.bincount(self.wellindex[mask], minlength=len(self._names))
+        self._offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        for lname, values in self._logs.items():
+            self._logs[lname] = values[mask]
+
+    def limit_tvd(self, tvdmin, tvdmax):
+        """Limit TVD to be in range tvdmin <= tvd <= tvdmax for all wells."""
+
+        zval = self._logs["Z_TVDSS"]
+        self.filter((zval >= tvdmin) & (zval <= tvdmax))
+
+    def downsample(self, interval=4, keeplast=True):
+        """Downsample by sampling every N'th element (coarsen only), all wells.
+
+        The result is the same as :meth:`xtgeo.well.Well.downsample` per well;
+        wells with fewer than 2 * interval values are left as is.
+        """
+
+        # pylint: disable=unused-argument
+        # keeplast is as in Well.downsample(), where the last row is not re-added
+
+        wellindex = self.wellindex
+        nrows = np.diff(self._offsets)
+        nlogs = np.array([len(head["lognames"]) for head in self._heads])
+
+        position = np.arange(self.nrow) - self._offsets[wellindex]
+        keep = position % interval == 0
+        keep |= (nrows * nlogs < 2 * interval)[wellindex]
+        self.filter(keep)
+
+    def get_dataframe(self, filled=False, fill_value1=-999, fill_value2=-9999):
+        """Get a big dataframe for all wells, with well name as first column.
+
+        The result is the same as :meth:`xtgeo.well.Wells.get_dataframe`.
+        """
+
+        wellindex = self.wellindex
+        data = {"WELLNAME": np.array(self._names, dtype=object)[wellindex]}
+
+        for lname, values in self._logs.items():
+            if filled:
+                missing = ~self._present[lname][wellindex]
+                values = np.where(np.isnan(values), fill_value1, values)
+                values[missing] = fill_value2
+            data[lname] = values
+
+        columns = sorted(data)
+        columns = SPEC_ORDER + [col for col in columns if col not in SPEC_ORDER]
+        return pd.DataFrame(data, columns=columns)
+
+
+def _stack(wells, lname, nrows):
+    """Stack the values of a log for all wells; NaN where the log is missing."""
+
+    pieces = []
+    for well, nrow in zip(wells, nrows):
+        if lname in well.dataframe:
+            pieces.append(well.dataframe[lname].values)
+        else:
+            pieces.append(np.full(nrow, np.nan))
+
+    if not pieces:
+        return np.zeros(0, dtype=np.float64)
+    return np.concatenate(pieces)
@@ -4,12 +4,18 @@
 from __future__ import print_function, absolute_import, division
 
 import logging
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 import shapely.geometry as sg
 
+import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGShowProgress
+from xtgeo.common import _ensemble
+
+from . import _well_oper
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -17,7 +23,98 @@ logger.addHandler(logging.NullHandler())
 xtg = XTGeoDialog()
 
 
+INTERSECTION_COLUMNS = ["WELL", "MDEPTH", "CWELL", "X_UTME", "Y_UTMN", "Z_TVDSS"]
+
+PAIRCHUNK = 1000000  # max number of segment pairs to evaluate in one go
+
+
+def make_ijk_from_grid(self, grid, grid_id="", workers=1, executor="process"):
+    """Add grid I J K as logs to all wells, searching all well points in one go."""
+
+    from xtgeo.grid3d import _grid_cellindex  # avoid circular import
+
+    offsets, (xcv, ycv, zcv) = _stack_logs(self._wells, ("X_UTME", "Y_UTMN", "Z_TVDSS"))
+
+    iarr, jarr, karr = _grid_cellindex.wells_ijk(
+        grid, xcv, ycv, zcv, offsets=offsets, workers=workers, executor=executor
+    )
+
+    for num, well in enumerate(self._wells):
+        rows = slice(offsets[num], offsets[num + 1])
+        _well_oper.set_ijk_logs(
+            well, grid, iarr[rows], jarr[rows], karr[rows], grid_id=grid_id
+        )
+
+
+def get_gridproperties(
+    self,
+    gridprops,
+    grid=("ICELL", "JCELL", "KCELL"),
+    prop_id="_model",
+    workers=1,
+    executor="process",
+):
+    """Add grid properties as logs to all wells, sampling all wells in one go."""
+
+    gprops = _well_oper.as_gridproperties(gridprops)
+
+    tmpnames = ["ICELL_tmp", "JCELL_tmp", "KCELL_tmp"]
+    if isinstance(grid, tuple):
+        cellnames = grid
+    elif isinstance(grid, xtgeo.Grid):
+        make_ijk_from_grid(
+            self, grid, grid_id="_tmp", workers=workers, executor=executor
+        )
+        cellnames = tmpnames
+    else:
+        raise ValueError('The "grid" is of wrong type, must be a tuple or ' "a Grid")
+
+    offsets, cells = _stack_logs(self._wells, cellnames)
+    values = _well_oper.sample_gridproperties(gprops, *cells)
+
+    for num, well in enumerate(self._wells):
+        rows = slice(offsets[num], offsets[num + 1])
+        _well_oper.set_gridproperty_logs(
+            well, gprops, [arr[rows] for arr in values], prop_id=prop_id
+        )
+        well.delete_logs(tmpnames)
+
+
+def _stack_logs(wells, lognames):
+    """Return well offsets, and the given logs stacked for all wells."""
+
+    nrows = [well.nrow for well in wells]
+    offsets = np.concatenate(([0], np.cumsum(nrows))).astype(np.int64)
+
+    logs = []
+    for lname in lognames:
+        logs.append(
+            np.concatenate(
+                [np.zeros(0)]  # if no wells
+                + [well.dataframe[lname].values.astype(np.float64) for well in wells]
+            )
+        )
+
+    return offsets, logs
+
+
 def wellintersections(
+    self, wfilter=None, showprogress=False, engine="index", workers=1
+):
+    """Get intersections between wells, return as dataframe table."""
+
+    if engine == "index":
+        return _wellintersections_index(
+            self, wfilter=wfilter, showprogress=showprogress, workers=workers
+        )
+    if engine == "shapely":
+        return _wellintersections_shapely(
+            self, wfilter=wfilter, showprogress=showprogress
+        )
+    raise ValueError("Invalid engine {}, use 'index' or 'shapely'".format(engine))
+
+
+def _wellintersections_shapely(
     self, wfilter=None, showprogress=False
 ):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
     """Get intersections between wells, return as dataframe table.
@@ -141,11 +238,485 @@ def wellintersections(
                         _x, _y, mcor = gxx2[ino].coords[0]
                         xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
 
-    dfr = pd.DataFrame(
-        xpoints, columns=["WELL", "MDEPTH", "CWELL", "X_UTME", "Y_UTMN", "Z_TVDSS"]
-    )
+    dfr = pd.DataFrame(xpoints, columns=INTERSECTION_COLUMNS)
 
     progress.finished()
 
     logger.info("All intersections found!")
     return dfr
+
+
+def _wellintersections_index(
+    self, wfilter=None, showprogress=False, workers=1
+):  # pylint: disable=too-many-locals
+    """Get intersections between wells, using a spatial index of segments.
+
+    All trajectory segments are put in a uniform grid index (on bounding boxes)
+    once, and only segment pairs from different wells that share a grid cell
+    are tested, by vectorised segment intersection. The result is the same as
+    for the shapely based version: a pair of wells counts only if they cross
+    (i.e. not only touch at ends or run along each other), and for the well,
+    MDEPTH is from the well while Z_TVDSS is from the crossing well.
+
+    With a "parallel" wfilter, the crossing well is truncated relative to the
+    well before testing, which is done pair by pair for candidate pairs.
+    """
+
+    wells = self.wells
+    if wells is None:
+        return pd.DataFrame([], columns=INTERSECTION_COLUMNS)
+
+    traj = _Trajectories(wells)
+
+    if wfilter is not None and "parallel" in wfilter:
+        rows = _crossings_wfilter(traj, wfilter["parallel"], showprogress)
+    else:
+        segs = traj.segments()
+        pairs = _candidate_segment_pairs(segs)
+        logger.info("Number of candidate segment pairs: %s", pairs.shape[0])
+
+        chunks = [
+            pairs[start : start + PAIRCHUNK]
+            for start in range(0, pairs.shape[0], PAIRCHUNK)
+        ]
+        hits = _ensemble.load_many(
+            lambda chunk: _segment_hits(segs, chunk),
+            chunks,
+            workers=workers,
+            executor="thread",
+        )
+        rows = _crossings(traj, _concat_hits(hits))
+
+    dfr = pd.DataFrame(OrderedDict(zip(INTERSECTION_COLUMNS, rows)))
+    logger.info("All intersections found!")
+    return dfr
+
+
+class _Trajectories(object):
+    """Trajectories (X Y Z and MD) for many wells as concatenated arrays."""
+
+    def __init__(self, wells):
+        self.wells = wells
+        self.names = [well.name for well in wells]
+
+        xyzm = []
+        self.haswell = np.zeros(len(wells), dtype=bool)  # valid as 'well'
+        for iwell, well in enumerate(wells):
+            gstatus = well.geometrics()
+            if not gstatus:
+                logger.info("Skip %s (cannot compute geometrics)", well.name)
+            xyzm.append(self.well_xyzm(well, md=gstatus))
+            self.haswell[iwell] = gstatus and xyzm[-1][0].size >= 2
+
+        self.sizes = np.array([arr[0].size for arr in xyzm], dtype=np.int64)
+        self.starts = np.cumsum(self.sizes) - self.sizes
+        self.xcoord, self.ycoord, self.zcoord, self.mdepth = [
+            np.concatenate(arrs) for arrs in zip(*xyzm)
+        ]
+        self.wellno = np.repeat(np.arange(len(wells)), self.sizes)
+
+    @staticmethod
+    def well_xyzm(well, md=True):
+        """X Y Z (and MD if md=True, otherwise nan) arrays as float64"""
+        dfr = well.dataframe
+        xyz = [dfr[name].values.astype(np.float64) for name in _XYZ]
+        if md and well.mdlogname is not None:
+            mdv = dfr[well.mdlogname].values.astype(np.float64)
+        else:
+            mdv = np.full(xyz[0].size, np.nan)
+        return xyz + [mdv]
+
+    def segments(self, select=None):
+        """Segments between consecutive points in the same well.
+
+        Args:
+            select (np): If given, only use points where True
+        """
+        return _Segments(
+            self.xcoord, self.ycoord, self.zcoord, self.mdepth, self.wellno, select
+        )
+
+
+_XYZ = ("X_UTME", "Y_UTMN", "Z_TVDSS")
+
+
+class _Segments(object):
+    """Line segments, as start and end point arrays, with well number"""
+
+    def __init__(self, xcoord, ycoord, zcoord, mdepth, wellno, select=None):
+        if select is not None:
+            xcoord, ycoord, zcoord = xcoord[select], ycoord[select], zcoord[select]
+            mdepth, wellno = mdepth[select], wellno[select]
+
+        seg = np.flatnonzero(wellno[:-1] == wellno[1:])
+        self.size = seg.size
+        self.wellno = wellno[seg]
+        self.x0, self.x1 = xcoord[seg], xcoord[seg + 1]
+        self.y0, self.y1 = ycoord[seg], ycoord[seg + 1]
+        self.z0, self.z1 = zcoord[seg], zcoord[seg + 1]
+        self.m0, self.m1 = mdepth[seg], mdepth[seg + 1]
+
+        # first and last segments of each line; needed to tell ends from crossings
+        self.first = np.ones(seg.size, dtype=bool)
+        self.first[1:] = self.wellno[1:] != self.wellno[:-1]
+        self.last = np.ones(seg.size, dtype=bool)
+        self.last[:-1] = self.wellno[1:] != self.wellno[:-1]
+
+    def bbox(self):
+        return (
+            np.fmin(self.x0, self.x1),
+            np.fmin(self.y0, self.y1),
+            np.fmax(self.x0, self.x1),
+            np.fmax(self.y0, self.y1),
+        )
+
+
+def _candidate_segment_pairs(segs, maxcells=1 << 20):
+    """Find pairs of segments from different wells with overlapping bboxes.
+
+    The segment bounding boxes are registered in a uniform grid, and pairs are
+    made of segments sharing a grid cell. Returns an (npairs, 2) int array,
+    where each pair is unique and the first segment number is the lowest.
+    """
+
+    empty = np.zeros((0, 2), dtype=np.int64)
+    xmin, ymin, xmax, ymax = segs.bbox()
+    valid = np.flatnonzero(np.isfinite(xmin + ymin + xmax + ymax))
+    if valid.size < 2:
+        return empty
+
+    # cell size from typical segment length, but not too many cells in total
+    extent = np.fmax(xmax - xmin, ymax - ymin)[valid]
+    xrange = xmax[valid].max() - xmin[valid].min()
+    yrange = ymax[valid].max() - ymin[valid].min()
+    cellsize = max(
+        2.0 * np.median(extent), np.sqrt(max(xrange * yrange, 0.0) / maxcells)
+    )
+    if not cellsize > 0:
+        cellsize = max(xrange, yrange, 1.0)
+
+    xorig, yorig = xmin[valid].min(), ymin[valid].min()
+    ix0 = ((xmin[valid] - xorig) // cellsize).astype(np.int64)
+    ix1 = ((xmax[valid] - xorig) // cellsize).astype(np.int64)
+    iy0 = ((ymin[valid] - yorig) // cellsize).astype(np.int64)
+    iy1 = ((ymax[valid] - yorig) // cellsize).astype(np.int64)
+    nycell = int(iy1.max()) + 1
+
+    # one entry per (cell, segment)
+    ncx, ncy = ix1 - ix0 + 1, iy1 - iy0 + 1
+    ncell = ncx * ncy
+    entry = np.repeat(np.arange(valid.size), ncell)
+    offset = np.arange(entry.size) - np.repeat(np.cumsum(ncell) - ncell, ncell)
+    cellkey = (ix0[entry] + offset // ncy[entry]) * nycell + (
+        iy0[entry] + offset % ncy[entry]
+    )
+    seg = valid[entry]
+    wellno = segs.wellno[seg]
+
+    order = np.lexsort((wellno, cellkey))
+    cellkey, seg, wellno = cellkey[order], seg[order], wellno[order]
+
+    # for each entry, partners are the entries in the same cell after its own well
+    pos = np.arange(seg.size)
+    newcell = np.ones(seg.size, dtype=bool)
+    newcell[1:] = cellkey[1:] != cellkey[:-1]
+    newrun = newcell.copy()
+    newrun[1:] |= wellno[1:] != wellno[:-1]
+    cellend = _run_ends(newcell)
+    runend = _run_ends(newrun)
+
+    npartner = cellend - runend
+    first = np.repeat(seg, npartner)
+    partner_pos = np.repeat(runend, npartner) + (
+        np.arange(npartner.sum()) - np.repeat(np.cumsum(npartner) - npartner, npartner)
+    )
+    second = seg[partner_pos]
+    del pos
+
+    if first.size == 0:
+        return empty
+
+    lower, upper = np.minimum(first, second), np.maximum(first, second)
+    keep = (
+        (xmin[lower] <= xmax[upper])
+        & (xmin[upper] <= xmax[lower])
+        & (ymin[lower] <= ymax[upper])
+        & (ymin[upper] <= ymax[lower])
+    )
+    pairs = np.unique(lower[keep] * segs.size + upper[keep])
+    return np.stack([pairs // segs.size, pairs % segs.size], axis=1)
+
+
+def _run_ends(newrun):
+    """For each element, the (exclusive) end index of the run it belongs to"""
+    starts = np.flatnonzero(newrun)
+    ends = np.append(starts[1:], newrun.size)
+    return np.repeat(ends, np.diff(np.append(starts, newrun.size)))
+
+
+def _segment_hits(segs, pairs, segs2=None):
+    """Vectorised intersection of segment pairs, in XY.
+
+    The first segment in each pair is from segs and the second from segs2
+    (default segs). Returns a dict of arrays for the pairs that intersect in a
+    point, and a flag array for pairs that overlap along a line.
+    """
+
+    if segs2 is None:
+        segs2 = segs
+
+    sa, sb = pairs[:, 0], pairs[:, 1]
+
+    px, py = segs.x0[sa], segs.y0[sa]
+    rx, ry = segs.x1[sa] - px, segs.y1[sa] - py
+    qx, qy = segs2.x0[sb], segs2.y0[sb]
+    sx, sy = segs2.x1[sb] - qx, segs2.y1[sb] - qy
+
+    qpx, qpy = qx - px, qy - py
+    denom = rx * sy - ry * sx
+    tnum = qpx * sy - qpy * sx
+    unum = qpx * ry - qpy * rx
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tpar = tnum / denom
+        upar = unum / denom
+
+        hit = (denom != 0) & (tpar >= 0) & (tpar <= 1) & (upar >= 0) & (upar <= 1)
+
+        # collinear segments, overlapping by more than a point
+        rlen2 = rx * rx + ry * ry
+        tq0 = (qpx * rx + qpy * ry) / rlen2
+        tq1 = tq0 + (sx * rx + sy * ry) / rlen2
+        overlap = (
+            (denom == 0)
+            & (unum == 0)
+            & (rlen2 > 0)
+            & (np.fmax(np.fmin(tq0, tq1), 0.0) < np.fmin(np.fmax(tq0, tq1), 1.0))
+        )
+
+    sa, sb, tpar, upar = sa[hit], sb[hit], tpar[hit], upar[hit]
+
+    return {
+        "wella": segs.wellno[sa],
+        "wellb": segs2.wellno[sb],
+        "x": segs.x0[sa] + tpar * (segs.x1[sa] - segs.x0[sa]),
+        "y": segs.y0[sa] + tpar * (segs.y1[sa] - segs.y0[sa]),
+        "za": segs.z0[sa] + tpar * (segs.z1[sa] - segs.z0[sa]),
+        "zb": segs2.z0[sb] + upar * (segs2.z1[sb] - segs2.z0[sb]),
+        "ma": segs.m0[sa] + tpar * (segs.m1[sa] - segs.m0[sa]),
+        "mb": segs2.m0[sb] + upar * (segs2.m1[sb] - segs2.m0[sb]),
+        # a crossing needs a point in the interior of both lines, not at an end
+        "interior": ~((tpar == 0) & segs.first[sa])
+        & ~((tpar == 1) & segs.last[sa])
+        & ~((upar == 0) & segs2.first[sb])
+        & ~((upar == 1) & segs2.last[sb]),
+        "overlapa": segs.wellno[pairs[overlap, 0]],
+        "overlapb": segs2.wellno[pairs[overlap, 1]],
+    }
+
+
+_POINTKEYS = ("wella", "wellb", "x", "y", "za", "zb", "ma", "mb", "interior")
+
+
+def _concat_hits(hitlist):
+    if not hitlist:
+        return _segment_hits(
+            _Segments(*[np.zeros(0)] * 4 + [np.zeros(0, dtype=np.int64)]),
+            np.zeros((0, 2), dtype=np.int64),
+        )
+    return {key: np.concatenate([hits[key] for hits in hitlist]) for key in hitlist[0]}
+
+
+def _crossing_pairs(hits, nwell):
+    """Well pair keys (welllow * nwell + wellhigh) of wells that cross"""
+
+    lowa = np.minimum(hits["wella"], hits["wellb"])
+    lowb = np.maximum(hits["wella"], hits["wellb"])
+    crossing = np.unique((lowa * nwell + lowb)[hits["interior"]])
+
+    olow = np.minimum(hits["overlapa"], hits["overlapb"])
+    ohigh = np.maximum(hits["overlapa"], hits["overlapb"])
+    overlapping = np.unique(olow * nwell + ohigh)
+
+    return np.setdiff1d(crossing, overlapping)
+
+
+def _crossings(traj, hits):
+    """Rows for both directions of crossing well pairs (without wfilter)"""
+
+    nwell = len(traj.wells)
+    crossing = _crossing_pairs(hits, nwell)
+
+    key = np.minimum(hits["wella"], hits["wellb"]) * nwell + np.maximum(
+        hits["wella"], hits["wellb"]
+    )
+    use = np.isin(key, crossing)
+    hits = {name: hits[name][use] for name in _POINTKEYS}
+
+    # each hit gives a row for a as the well, and one for b as the well
+    well = np.concatenate([hits["wella"], hits["wellb"]])
+    cwell = np.concatenate([hits["wellb"], hits["wella"]])
+    mdepth = np.concatenate([hits["ma"], hits["mb"]])
+    zcoord = np.concatenate([hits["zb"], hits["za"]])
+    xcoord = np.concatenate([hits["x"], hits["x"]])
+    ycoord = np.concatenate([hits["y"], hits["y"]])
+
+    return _make_rows(traj, well, cwell, mdepth, xcoord, ycoord, zcoord)
+
+
+def _crossings_wfilter(traj, parallel, showprogress):
+    """Rows for crossing wells where the crossing well is truncated first.
+
+    Pairs are evaluated in well order as for the shapely version: if the
+    well does not cross the (truncated) other, the other way is skipped.
+    As truncation may change the path of the other well, candidate pairs are
+    wells with overlapping bounding boxes, cf. Well.may_overlap().
+    """
+
+    candidates = _overlapping_wells(traj)
+
+    progress = XTGShowProgress(
+        len(candidates), show=showprogress, leadtext="progress: ", skip=5
+    )
+
+    rows = []
+    for num, (iwell, jwell) in enumerate(candidates):
+        progress.flush(num)
+        if traj.names[iwell] == traj.names[jwell]:
+            continue
+
+        status = "skip"
+        if traj.haswell[iwell]:
+            status, irows = _crossing_truncated(traj, iwell, jwell, parallel)
+            if status == "cross":
+                rows.append(irows)
+
+        if traj.haswell[jwell] and status != "nocross":
+            status, jrows = _crossing_truncated(traj, jwell, iwell, parallel)
+            if status == "cross":
+                rows.append(jrows)
+
+    progress.finished()
+
+    if not rows:
+        return _make_rows(traj, *[np.zeros(0, dtype=np.int64)] * 2 + [np.zeros(0)] * 4)
+
+    # sorted by well, as the other way of a pair comes later
+    rows = [np.concatenate(cols) for cols in zip(*rows)]
+    order = np.argsort(_wellorder(traj, rows[0]), kind="stable")
+    return [col[order] for col in rows]
+
+
+def _wellorder(traj, names):
+    index = {name: num for num, name in enumerate(traj.names)}
+    return np.array([index[name] for name in names], dtype=np.int64)
+
+
+def _overlapping_wells(traj):
+    """Pairs (i, j), i < j, of wells with overlapping XY bounding boxes"""
+
+    nonempty = traj.sizes > 0
+    bounds = []
+    for arr in (traj.xcoord, traj.ycoord):
+        with np.errstate(invalid="ignore"):
+            starts = traj.starts[nonempty]
+            bmin = np.full(len(traj.wells), np.nan)
+            bmax = np.full(len(traj.wells), np.nan)
+            bmin[nonempty] = np.fmin.reduceat(arr, starts)
+            bmax[nonempty] = np.fmax.reduceat(arr, starts)
+        bounds.append((bmin, bmax))
+
+    (xmin, xmax), (ymin, ymax) = bounds
+    ivals, jvals = np.triu_indices(len(traj.wells), k=1)
+    overlap = (
+        (traj.sizes[ivals] >= 2)
+        & (traj.sizes[jvals] >= 2)
+        & ~(xmin[ivals] > xmax[jvals])
+        & ~(ymin[ivals] > ymax[jvals])
+        & ~(xmin[jvals] > xmax[ivals])
+        & ~(ymin[jvals] > ymax[ivals])
+    )
+    return list(zip(ivals[overlap].tolist(), jvals[overlap].tolist()))
+
+
+def _crossing_truncated(traj, iwell, jwell, parallel):
+    """Well iwell vs a copy of jwell truncated relative to it.
+
+    Returns a tuple (status, rows) where status is "skip" if the truncated
+    well is too short, "nocross" or "cross".
+    """
+
+    owell = traj.wells[jwell].copy()
+    owell.truncate_parallel_path(
+        traj.wells[iwell],
+        xtol=parallel.get("xtol"),
+        ytol=parallel.get("ytol"),
+        ztol=parallel.get("ztol"),
+        itol=parallel.get("itol"),
+        atol=parallel.get("atol"),
+    )
+
+    oxyzm = _Trajectories.well_xyzm(owell, md=False)
+    if oxyzm[0].size < 2:
+        return "skip", None
+
+    # the two lines as one set of segments, where the well comes first
+    select = traj.wellno == iwell
+    merged = [
+        np.concatenate([arr[select], oarr])
+        for arr, oarr in zip(
+            (traj.xcoord, traj.ycoord, traj.zcoord, traj.mdepth), oxyzm
+        )
+    ]
+    wellno = np.concatenate(
+        [np.full(select.sum(), iwell), np.full(oxyzm[0].size, jwell)]
+    )
+    segs = _Segments(*merged + [wellno])
+
+    pairs = _candidate_segment_pairs(segs)
+    hits = _segment_hits(segs, pairs)
+
+    if hits["overlapa"].size > 0 or not hits["interior"].any():
+        return "nocross", None
+
+    rows = _make_rows(
+        traj, hits["wella"], hits["wellb"], hits["ma"], hits["x"], hits["y"], hits["zb"]
+    )
+    return "cross", rows
+
+
+def _make_rows(traj, well, cwell, mdepth, xcoord, ycoord, zcoord):
+    """Columns for the result, for valid wells, sorted and without duplicates.
+
+    A crossing exactly at a trajectory point is found for both segments
+    sharing that point, hence duplicates are removed.
+    """
+
+    use = traj.haswell[well] & (traj.sizes[cwell] >= 2)
+    names = np.array(traj.names, dtype=object)
+    use &= names[well] != names[cwell]
+
+    well, cwell, mdepth = well[use], cwell[use], mdepth[use]
+    xcoord, ycoord, zcoord = xcoord[use], ycoord[use], zcoord[use]
+
+    order = np.lexsort((mdepth, cwell, well))
+    well, cwell, mdepth = well[order], cwell[order], mdepth[order]
+    xcoord, ycoord, zcoord = xcoord[order], ycoord[order], zcoord[order]
+
+    dupl = np.zeros(well.size, dtype=bool)
+    dupl[1:] = (
+        (well[1:] == well[:-1])
+        & (cwell[1:] == cwell[:-1])
+        & np.isclose(xcoord[1:], xcoord[:-1], rtol=0, atol=1e-6)
+        & np.isclose(ycoord[1:], ycoord[:-1], rtol=0, atol=1e-6)
+    )
+    keep = ~dupl
+
+    return [
+        names[well[keep]],
+        mdepth[keep],
+        names[cwell[keep]],
+        xcoord[keep],
+        ycoord[keep],
+        zcoord[keep],
+    ]
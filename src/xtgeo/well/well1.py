@@ -1004,6 +1004,8 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             tvdrange (tuple of floats): Resampling can be limited to TVD interval
 
         .. versionchanged:: 2.2.0 Added tvdrange
+        .. versionchanged:: 2.8.0 Interpolation is done with numpy, which is
+           faster and does not change pandas options
         """
         _well_oper.rescale(self, delta=delta, tvdrange=tvdrange)
 
@@ -1109,64 +1111,19 @@ class Well(object):  # pylint: disable=useless-object-inheritance
             if a zonelog is missing
         """
 
-        zlist = []
-        # get the relevant logs:
-
-        self.geometrics()
-
-        # as zlog is float64; need to convert to int array with high
-        # number as undef
-        if self.zonelogname is not None:
-            zlog = self._df[self.zonelogname].values
-            zlog[np.isnan(zlog)] = const.UNDEF_INT
-            zlog = np.rint(zlog).astype(int)
-        else:
-            return None
-
-        xvv = self._df["X_UTME"].values
-        yvv = self._df["Y_UTMN"].values
-        zvv = self._df["Z_TVDSS"].values
-        incl = self._df["Q_INCL"].values
-        mdv = self._df["Q_MDEPTH"].values
-
-        if self.mdlogname is not None:
-            mdv = self._df[self.mdlogname].values
-
-        if zonelist is None:
-            # need to declare as list; otherwise Py3 will get dict.keys
-            zonelist = list(self.get_logrecord(self.zonelogname).keys())
-
-        logger.info("Find values for %s", zonelist)
-
-        ztops, ztopnames, zisos, zisonames = _wellmarkers.extract_ztops(
-            self,
-            zonelist,
-            xvv,
-            yvv,
-            zvv,
-            zlog,
-            mdv,
-            incl,
+        dfr, nwell = _wellmarkers.zonation_points(
+            [self],
             tops=tops,
             incl_limit=incl_limit,
             prefix=top_prefix,
+            zonelist=zonelist,
             use_undef=use_undef,
         )
-
-        if tops:
-            zlist = ztops
-        else:
-            zlist = zisos
-
-        logger.debug(zlist)
-
-        if tops:
-            dfr = pd.DataFrame(zlist, columns=ztopnames)
-        else:
-            dfr = pd.DataFrame(zlist, columns=zisonames)
-
         logger.debug(dfr)
 
+        if nwell == 0:
+            return None
+
         return dfr
 
     def get_zone_interval(self, zonevalue, resample=1, extralogs=None):
@@ -1304,6 +1261,9 @@ class Well(object):  # pylint: disable=useless-object-inheritance
 
         Raises:
             RuntimeError: 'Error from C routine, code is ...'
+
+        .. versionchanged:: 2.8.0 The one layer helper grid is made once per
+           grid and re-used, see also :meth:`xtgeo.well.Wells.make_ijk_from_grid`
         """
         # renamed from get_ijk_from_grid
 
@@ -4,13 +4,12 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
-from distutils.version import StrictVersion
-
-import pandas as pd
-
 import xtgeo
+from xtgeo.common import _ensemble
 
 from . import _wells_utils
+from . import _wells_columnar
+from . import _wellmarkers
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
@@ -43,6 +42,8 @@ class Wells(object):
                 zonelogname=zonelogname,
                 strict=strict,
                 append=False,
+                workers=kwargs.get("workers", 1),
+                executor=kwargs.get("executor", "process"),
             )
 
     @property
@@ -123,10 +124,14 @@ class Wells(object):
         zonelogname=None,
         strict=True,
         append=True,
+        workers=1,
+        executor="process",
     ):
 
         """Import wells from a list of files (filelist).
 
+        The files can be read concurrently in a pool of workers, see workers.
+
         Args:
             filelist (list of str): List with file names
             fformat (str): File format, rms_ascii (rms well) is
@@ -138,31 +143,35 @@ class Wells(object):
                 in wells.
             append (bool): If True, new wells will be added to existing
                 wells.
+            workers (int): Number of workers; default is 1, which reads the
+                files one by one without a pool. None means number of CPUs.
+            executor (str): "process" (default) or "thread". Processes are
+                usually faster for many files, as parsing is CPU bound.
 
         Example:
             Here the from_file method is used to initiate the object
             directly::
 
             >>> mywells = Wells(['31_2-6.w', '31_2-7.w', '31_2-8.w'])
+
+        .. versionchanged:: 2.8.0 Added workers and executor
         """
 
         if not append:
             self._wells = []
 
+        jobs = [(wfile, fformat, mdlogname, zonelogname, strict) for wfile in filelist]
+        result = _ensemble.load_many(
+            _well_from_file_or_error, jobs, workers=workers, executor=executor
+        )
+
         # file checks are done within the Well() class
-        for wfile in filelist:
-            try:
-                wll = xtgeo.well.Well(
-                    wfile,
-                    fformat=fformat,
-                    mdlogname=mdlogname,
-                    zonelogname=zonelogname,
-                    strict=strict,
-                )
-                self._wells.append(wll)
-            except ValueError as err:
+        for wll, err in result:
+            if err is not None:
                 xtg.warn("SKIP this well: {}".format(err))
                 continue
+            self._wells.append(wll)
+
         if not self._wells:
             xtg.warn("No wells imported!")
 
@@ -207,29 +216,48 @@ class Wells(object):
         """
         logger.info("Ask for big dataframe for all wells")
 
-        bigdf = []
-        for well in self._wells:
-            dfr = well.dataframe.copy()
-            dfr["WELLNAME"] = well.name
-            logger.info(well.name)
-            if filled:
-                dfr = dfr.fillna(fill_value1)
-            bigdf.append(dfr)
-
-        if StrictVersion(pd.__version__) > StrictVersion("0.23.0"):
-            # pylint: disable=unexpected-keyword-arg
-            dfr = pd.concat(bigdf, ignore_index=True, sort=True)
-        else:
-            dfr = pd.concat(bigdf, ignore_index=True)
+        # the logs are stacked as arrays, which is much faster than concatenating
+        # one dataframe per well
+        cwells = _wells_columnar.ColumnarWells.from_wells(self._wells)
+        return cwells.get_dataframe(
+            filled=filled, fill_value1=fill_value1, fill_value2=fill_value2
+        )
 
-        # the concat itself may lead to NaN's:
-        if filled:
-            dfr = dfr.fillna(fill_value2)
+    def to_columnar(self):
+        """Get a columnar representation of all wells.
 
-        spec_order = ["WELLNAME", "X_UTME", "Y_UTMN", "Z_TVDSS"]
-        dfr = dfr[spec_order + [col for col in dfr if col not in spec_order]]
+        All logs are stacked in one contiguous numpy array per log, with an
+        offset index per well, and code maps for discrete logs. Collection
+        wide operations (filtering on log values, limit_tvd, downsample,
+        dataframe export) are then vectorised, which is much faster for many
+        wells. The result is a copy of the current wells.
 
-        return dfr
+        Returns:
+            A ColumnarWells instance
+
+        Example::
+
+            cwells = mywells.to_columnar()
+            cwells.limit_tvd(1300, 1400)
+            cwells.filter(cwells.get_log("PHIT") > 0.1)
+            dfr = cwells.get_dataframe()
+            mywells.from_columnar(cwells)  # back to Well objects, if needed
+
+        .. versionadded:: 2.8.0
+        """
+
+        return _wells_columnar.ColumnarWells.from_wells(self._wells)
+
+    def from_columnar(self, cwells):
+        """Replace the wells in the instance with wells from a columnar store.
+
+        Args:
+            cwells (ColumnarWells): Columnar store, see :meth:`to_columnar`.
+
+        .. versionadded:: 2.8.0
+        """
+
+        self._wells = cwells.to_wells()
 
     def quickplot(self, filename=None, title="QuickPlot"):
         """Fast plot of wells using matplotlib.
@@ -264,7 +292,119 @@ class Wells(object):
         for well in self.wells:
             well.downsample(interval=interval, keeplast=keeplast)
 
-    def wellintersections(self, wfilter=None, showprogress=False):
+    def rescale(self, delta=0.15, tvdrange=None, workers=1):
+        """Rescale (refine or coarse) all wells by sampling a delta along the
+        trajectory, in MD.
+
+        See :meth:`xtgeo.well.Well.rescale`. The wells may be rescaled in a
+        pool of threads, see workers.
+
+        Args:
+            delta (float): Step length
+            tvdrange (tuple of floats): Resampling can be limited to TVD interval
+            workers (int): Number of threads; default is 1, which rescales the
+                wells one by one. None means number of CPUs.
+
+        .. versionadded:: 2.8.0
+        """
+
+        _ensemble.load_many(
+            lambda well: well.rescale(delta=delta, tvdrange=tvdrange),
+            self._wells,
+            workers=workers,
+            executor="thread",
+        )
+
+    def make_ijk_from_grid(self, grid, grid_id="", workers=1, executor="process"):
+        """Look through a Grid and add grid I J K as discrete logs, all wells.
+
+        See :meth:`xtgeo.well.Well.make_ijk_from_grid`. The helper grid for the
+        search is made once (and kept with the grid), and the points of all
+        wells are searched in one go, optionally split in chunks of wells
+        that are searched in parallel.
+
+        Args:
+            grid (Grid): A XTGeo Grid instance
+            grid_id (str): Add a tag (optional) to the current log name
+            workers (int): Number of workers; default is 1 (no parallel search)
+            executor (str): "process" (default) or "thread". The search in C
+                holds the GIL, so threads will usually not be faster.
+
+        .. versionadded:: 2.8.0
+        """
+
+        _wells_utils.make_ijk_from_grid(
+            self, grid, grid_id=grid_id, workers=workers, executor=executor
+        )
+
+    def get_gridproperties(
+        self,
+        gridprops,
+        grid=("ICELL", "JCELL", "KCELL"),
+        prop_id="_model",
+        workers=1,
+        executor="process",
+    ):
+        """Look through a Grid and add a set of grid properties as logs, all wells.
+
+        See :meth:`xtgeo.well.Well.get_gridproperties`. Each property is
+        sampled for all wells at once. If grid is a Grid instance, the I J K
+        search is done as in :meth:`make_ijk_from_grid`.
+
+        Args:
+            gridprops (GridProperties): A XTGeo GridProperties instance (a
+                collection of properties) or a single GridProperty
+            grid (Grid or tuple): A XTGeo Grid instance or a reference
+                via tuple with names of logs that have the grid IJK numbering.
+            prop_id (str): Add a tag (optional) to the current log name, e.g
+                as PORO_model, where _model is the tag.
+            workers (int): Number of workers for the I J K search.
+            executor (str): "process" (default) or "thread".
+
+        .. versionadded:: 2.8.0
+        """
+
+        _wells_utils.get_gridproperties(
+            self,
+            gridprops,
+            grid=grid,
+            prop_id=prop_id,
+            workers=workers,
+            executor=executor,
+        )
+
+    def get_zonation_points(
+        self, tops=True, incl_limit=80, top_prefix="Top", zonelist=None, use_undef=False
+    ):
+        """Extract zonation points from Zonelog for all wells, in one call.
+
+        See :meth:`xtgeo.well.Well.get_zonation_points` for arguments. Wells
+        without a zonelog are skipped.
+
+        Returns:
+            A pandas dataframe (ready for the xyz/Points class), None
+            if no wells have a zonelog
+
+        .. versionadded:: 2.8.0
+        """
+
+        dfr, nwell = _wellmarkers.zonation_points(
+            self._wells,
+            tops=tops,
+            incl_limit=incl_limit,
+            prefix=top_prefix,
+            zonelist=zonelist,
+            use_undef=use_undef,
+        )
+
+        if nwell == 0:
+            return None
+
+        return dfr
+
+    def wellintersections(
+        self, wfilter=None, showprogress=False, engine="index", workers=1
+    ):
         """Get intersections between wells, return as dataframe table.
 
         Notes on wfilter: A wfilter is settings to improve result. In
@@ -282,15 +422,44 @@ class Wells(object):
             wfilter (dict): A dictionrary for filter options, in order to
                 improve result. See example above.
             showprogress (bool): Will show progress to screen if enabled.
+            engine (str): "index" (default) uses a spatial index of all
+                trajectory segments, and vectorised segment intersections.
+                "shapely" is the previous pairwise method, which is much
+                slower for many wells.
+            workers (int): Number of threads for the "index" engine; default
+                is 1, i.e. no pool.
 
         Returns:
             A Pandas dataframe object, with columns WELL, CWELL and UTMX UTMY
                 TVD coordinates for CWELL where CWELL crosses WELL,
-                and also MDEPTH for the WELL.
+                and also MDEPTH for the WELL. For the "index" engine, the
+                crossings for a pair of wells are sorted by MDEPTH.
+
+        .. versionchanged:: 2.8.0 Added engine and workers
         """
 
         dfr = _wells_utils.wellintersections(
-            self, wfilter=wfilter, showprogress=showprogress
+            self,
+            wfilter=wfilter,
+            showprogress=showprogress,
+            engine=engine,
+            workers=workers,
         )
 
         return dfr
+
+
+def _well_from_file_or_error(job):
+    # module level function, so it can be used in a process pool
+    wfile, fformat, mdlogname, zonelogname, strict = job
+    try:
+        wll = xtgeo.well.Well(
+            wfile,
+            fformat=fformat,
+            mdlogname=mdlogname,
+            zonelogname=zonelogname,
+            strict=strict,
+        )
+    except ValueError as err:
+        return None, err
+    return wll, None
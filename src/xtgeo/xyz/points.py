@@ -10,6 +10,7 @@ import numpy.ma as ma
 import pandas as pd
 
 import xtgeo
+from xtgeo.well import _wellmarkers
 
 # from xtgeo.common import XTGeoDialog
 # from xtgeo.surface import RegularSurface
@@ -479,8 +480,11 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods
 
         """Get tops or zone points data from a list of wells.
 
+        The zone transitions for all wells are found in one vectorised
+        operation.
+
         Args:
-            wells (list): List of XTGeo well objects
+            wells (list): List of XTGeo well objects, or a Wells instance
             tops (bool): Get the tops if True (default), otherwise zone
             incl_limit (float): Inclination limit for zones (thickness points)
             top_prefix (str): Prefix used for Tops
@@ -498,24 +502,23 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods
         if not wells:
             return None
 
-        dflist = []
-        for well in wells:
-            wp = well.get_zonation_points(
-                tops=tops,
-                incl_limit=incl_limit,
-                top_prefix=top_prefix,
-                zonelist=zonelist,
-                use_undef=use_undef,
-            )
+        if isinstance(wells, xtgeo.Wells):
+            wells = wells.wells
 
-            if wp is not None:
-                dflist.append(wp)
+        dfr, nwell = _wellmarkers.zonation_points(
+            wells,
+            tops=tops,
+            incl_limit=incl_limit,
+            prefix=top_prefix,
+            zonelist=zonelist,
+            use_undef=use_undef,
+        )
 
-        if dflist:
-            self._df = pd.concat(dflist, ignore_index=True)
-        else:
+        if nwell == 0:
             return None
 
+        self._df = dfr
+
         for col in self._df.columns:
             if col == "Zone":
                 self._attrs[col] = "int"
@@ -526,7 +529,7 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods
             else:
                 self._attrs[col] = "float"
 
-        return len(dflist)
+        return nwell
 
     def dfrac_from_wells(
         self,
@@ -38,6 +38,29 @@ def assert_almostequal(this, that, tol, txt=""):
     assert this == pytest.approx(that, abs=tol), txt
 
 
+def write_rmswell(wfile, wname, logs, rows):
+    """Write a small RMS ascii well file, for fixture wells made in tests.
+
+    Args:
+        wfile (str): Name of file
+        wname (str): Name of well; the well head is at the first sample
+        logs (list): Log definitions, e.g. ["ZONE DISC 1 ZA 2 ZB"]
+        rows (list): One tuple per sample with X, Y, Z and the log values
+
+    Returns:
+        The file name
+    """
+    lines = ["1.0", "Unknown", "{} {} {} 25.0".format(wname, *rows[0][:2])]
+    lines.append(str(len(logs)))
+    lines.extend(logs)
+    lines.extend(" ".join(str(val) for val in row) for row in rows)
+
+    with open(wfile, "w") as stream:
+        stream.write("\n".join(lines) + "\n")
+
+    return wfile
+
+
 # SKIP IF PYTHON2 -------------------------------------------------------------
 skipifpython2 = pytest.mark.skipif(six.PY2, reason="Test skipped for PY2")
 
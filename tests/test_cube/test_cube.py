@@ -124,6 +124,59 @@ def test_segyio_import(loadsfile1):
     tsetup.assert_almostequal(xcu.values.max(), 7.42017, 0.001)
 
 
+@tsetup.skipsegyio
+def test_segyio_import_lazy(loadsfile1):
+    """Import SEGY (case 1 Reek) as lazy, and compare with a full import."""
+
+    xcu = loadsfile1
+    lazy = xtgeo.cube_from_file(SFILE1, lazy=True)
+
+    assert not lazy.isloaded
+    assert lazy.values.shape == (408, 280, 70)
+    np.testing.assert_array_equal(lazy.values[10], xcu.values[10])
+    np.testing.assert_array_equal(lazy.values[:, 20], xcu.values[:, 20])
+    np.testing.assert_array_equal(lazy.values[:, :, 30], xcu.values[:, :, 30])
+    np.testing.assert_array_equal(lazy.values[5, 6], xcu.values[5, 6])
+    np.testing.assert_array_equal(
+        lazy.values[-3:100:2, ::-5, 4:9], xcu.values[-3:100:2, ::-5, 4:9]
+    )
+    tsetup.assert_almostequal(lazy.values.max(), 7.42017, 0.001)
+    tsetup.assert_almostequal(lazy.values.mean(), xcu.values.mean(), 0.0001)
+
+    # slicing and random lines read only the part of the cube needed
+    surf = xtgeo.RegularSurface(
+        ncol=40,
+        nrow=30,
+        xori=xcu.xori + 500,
+        yori=xcu.yori + 500,
+        xinc=25,
+        yinc=25,
+        rotation=xcu.rotation,
+        values=1700.0,
+    )
+    surf1 = surf.copy()
+    surf1.slice_cube(xcu, sampling="trilinear")
+    surf2 = surf.copy()
+    surf2.slice_cube(lazy, sampling="trilinear")
+    tsetup.assert_almostequal((surf1.values - surf2.values).std(), 0.0, 0.0001)
+    assert not lazy.isloaded
+
+    fence = np.array(
+        [
+            [xcu.xori + 400, xcu.yori + 600, 1700, 0],
+            [xcu.xori + 800, xcu.yori + 700, 1700, 400],
+        ]
+    )
+    rnd1 = xcu.get_randomline(fence, zmin=1600, zmax=1800)[4]
+    rnd2 = lazy.get_randomline(fence, zmin=1600, zmax=1800)[4]
+    np.testing.assert_array_equal(rnd1, rnd2)
+
+    lazy.load_values()
+    assert lazy.isloaded
+    np.testing.assert_array_equal(lazy.values, xcu.values)
+    np.testing.assert_array_equal(lazy.traceidcodes, xcu.traceidcodes)
+
+
 @tsetup.skipsegyio
 def test_segyio_import_export(loadsfile1):
     """Import and export SEGY (case 1 Reek) via SegIO library."""
@@ -112,6 +112,19 @@ def test_hcpvfz1():
 
     logger.info("Speed basic is {}".format(t2))
 
+    # serial gridding of layers shall give the same as parallel (default)
+    hcmap3 = hcmap2.copy()
+    hcmap3.hc_thickness_from_3dprops(
+        xprop=xcv,
+        yprop=ycv,
+        dzprop=dzv,
+        hcpfzprop=hcpfz,
+        zoneprop=zp,
+        zone_minmax=(1, 1),
+        workers=1,
+    )
+    np.testing.assert_allclose(hcmap3.values, hcmap.values)
+
     t1 = xtg.timer()
     hcmap2.hc_thickness_from_3dprops(
         xprop=xcv,
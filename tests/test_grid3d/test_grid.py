@@ -3,6 +3,7 @@ from __future__ import division, absolute_import
 from __future__ import print_function
 
 import os
+import gzip
 from os.path import join
 from collections import OrderedDict
 import math
@@ -349,6 +350,41 @@ def test_import_grdecl_and_bgrdecl():
     tsetup.assert_almostequal(dzv1.values.mean(), dzv2.values.mean(), 0.001)
 
 
+def test_import_grdecl_gzip():
+    """Eclipse import of gzip compressed GRDECL, compare with uncompressed"""
+
+    gzfile = join(TMPDIR, "reek_sim.grdecl.gz")
+    with open(REEKFIL2, "rb") as stream, gzip.open(gzfile, "wb") as gzstream:
+        gzstream.write(stream.read())
+
+    grd1 = Grid(REEKFIL2, fformat="grdecl")
+    grd2 = Grid(gzfile)  # format is guessed from extension before .gz
+
+    assert grd2.dimensions == (40, 64, 14)
+    assert grd2.nactive == 35812
+    np.testing.assert_array_equal(grd1._coordsv, grd2._coordsv)
+    np.testing.assert_array_equal(grd1._zcornsv, grd2._zcornsv)
+    np.testing.assert_array_equal(grd1._actnumsv, grd2._actnumsv)
+
+
+def test_import_grdecl_section_keywords():
+    """Eclipse import of GRDECL with section keywords (no data record) in it"""
+
+    sfile = join(TMPDIR, "reek_sim_sections.grdecl")
+    with open(REEKFIL2, "r") as stream, open(sfile, "w") as sstream:
+        sstream.write("RUNSPEC\nGRID\nNOECHO\n")
+        sstream.write(stream.read())
+        sstream.write("\nEDIT\nPROPS\nREGIONS\nSOLUTION\nSCHEDULE\n")
+
+    grd1 = Grid(REEKFIL2, fformat="grdecl")
+    grd2 = Grid(sfile, fformat="grdecl")
+
+    assert grd2.dimensions == (40, 64, 14)
+    np.testing.assert_array_equal(grd1._coordsv, grd2._coordsv)
+    np.testing.assert_array_equal(grd1._zcornsv, grd2._zcornsv)
+    np.testing.assert_array_equal(grd1._actnumsv, grd2._actnumsv)
+
+
 def test_eclgrid_import2():
     """Eclipse EGRID import, also change ACTNUM."""
     grd = Grid()
@@ -415,6 +451,37 @@ def test_geometrics_reek():
     tsetup.assert_almostequal(geom["xmin"], 456620, 1, "Xmin cell center")
 
 
+def test_geometry_cache_reek():
+    """Derived properties are cached until the geometry changes"""
+
+    grd = Grid(REEKFILE, fformat="egrid")
+    generation = grd.geometry_generation
+
+    dz1 = grd.get_dz()
+    dz1.values[0, 0, 0] = 9999.0  # shall not affect the cached dz
+
+    dz2 = grd.get_dz()
+    assert dz2.values[0, 0, 0] != 9999.0
+    assert ("dz", "dZ", True, True) in grd.get_cache_info()["keys"]
+
+    xc1, _yc, _zc = grd.get_xyz()
+    grd.translate_coordinates(translate=(100, 0, 0))
+    assert grd.geometry_generation > generation
+    assert not grd.get_cache_info()["keys"]
+
+    xc2, _yc, _zc = grd.get_xyz()
+    tsetup.assert_almostequal(xc2.values.mean(), xc1.values.mean() + 100, 0.01)
+
+    # the 24 corner properties are too large to be kept in the cache
+    nbytes = grd.get_cache_info()["nbytes"]
+    corners = grd.get_xyz_corners()
+    assert len(corners) == 24
+    assert grd.get_cache_info()["nbytes"] == nbytes
+
+    grd.clear_cache()
+    assert grd.get_cache_info()["nbytes"] == 0
+
+
 def test_activate_all_cells():
     """Make the grid active for all cells"""
 
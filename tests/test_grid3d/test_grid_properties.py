@@ -3,10 +3,13 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
+import shutil
 import sys
 import warnings
 
 import pytest
+import pandas as pd
 
 from xtgeo.grid3d import Grid
 from xtgeo.grid3d import GridProperties
@@ -181,6 +184,100 @@ def test_import_soil():
     assert soil.values.mean() == pytest.approx(0.121977, abs=0.001), txt
 
 
+def test_import_restart_batch_vs_single():
+    """Import many names and dates in one go, compare with one by one import"""
+    import numpy as np
+    from xtgeo.grid3d import GridProperty
+
+    g = Grid(GFILE1, fformat="egrid")
+
+    x = GridProperties()
+    names = ['SOIL', 'SGAS', 'SWAT', 'PRESSURE']
+    dates = [19991201, 20000201, 20010101]
+    x.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+
+    assert len(x.names) == len(names) * len(dates)
+
+    for date in dates:
+        for name in names:
+            single = GridProperty(RFILE1, fformat="unrst", name=name, date=date, grid=g)
+            batch = x.get_prop_by_name(name + "_" + str(date))
+            np.testing.assert_array_equal(batch.values.mask, single.values.mask)
+            np.testing.assert_allclose(batch.values, single.values)
+
+
+def test_import_restart_lazy():
+    """Lazy import of restart, values are read on demand within a budget"""
+    import numpy as np
+
+    g = Grid(GFILE1, fformat="egrid")
+
+    names = ['SOIL', 'SWAT', 'PRESSURE']
+    dates = [19991201, 20000201, 20010101]
+
+    eager = GridProperties()
+    eager.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+
+    lazy = GridProperties()
+    lazy.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g,
+                   lazy=True, maxmemory=2 * g.ntotal * 5 / 1024 ** 3)
+
+    assert lazy.names == eager.names
+    assert not any(prop.isloaded for prop in lazy.props)
+
+    for prop in lazy.props:
+        other = eager.get_prop_by_name(prop.name)
+        np.testing.assert_allclose(prop.values, other.values)
+        assert prop.name == other.name
+        assert prop.date == other.date
+
+    # budget is about two properties; the others are released
+    assert sum(prop.isloaded for prop in lazy.props) <= 2
+    assert lazy.props[0].isloaded is False
+
+    # a replaced array is kept
+    first = lazy.props[0]
+    first.values = first.values * 1.0
+    for prop in lazy.props[1:]:
+        prop.values.mean()
+    assert first.isloaded
+
+    # values changed in place are writeable, and are kept
+    second = lazy.props[1]
+    vals = second.values
+    vals += 1.0
+    expected = vals.copy()
+    for prop in lazy.props[2:]:
+        prop.values.mean()
+    assert second.isloaded
+    np.testing.assert_allclose(second.values, expected)
+
+
+def test_import_ensemble():
+    """Import the same property from many files concurrently, as a stack"""
+    import numpy as np
+    from xtgeo.grid3d import GridProperty
+
+    g = Grid(GFILE1, fformat="egrid")
+    files = [IFILE1] * 4
+
+    stacked, meta = GridProperties.ensemble_from_files(
+        files, "PORO", fformat="init", grid=g, workers=2
+    )
+    assert stacked.shape == (4, g.ncol, g.nrow, g.nlay)
+    assert [item["realisation"] for item in meta] == [0, 1, 2, 3]
+
+    single = GridProperty(IFILE1, fformat="init", name="PORO", grid=g)
+    np.testing.assert_allclose(stacked[3], single.values)
+
+    # grid as file name, read in separate processes
+    stacked2, _meta = GridProperties.ensemble_from_files(
+        files[:2], "PORO", fformat="init", grid=GFILE1, workers=2,
+        executor="process"
+    )
+    np.testing.assert_allclose(stacked2, stacked[:2])
+
+
 def test_scan_dates():
     """A static method to scan dates in a RESTART file"""
     t1 = xtg.timer()
@@ -202,6 +299,105 @@ def test_scan_keywords():
     assert df.loc[12, 'KEYWORD'] == 'SWAT'  # pylint: disable=no-member
 
 
+def test_scan_keywords_catalog():
+    """Keyword catalog for RESTART, with lookup on keyword and date"""
+    from xtgeo.grid3d import _grid3d_utils
+
+    cat = _grid3d_utils.scan_ecl_catalog(RFILE1)
+    df = GridProperties.scan_keywords(RFILE1, dataframe=True, dates=True)
+
+    assert len(cat) == len(df)
+    assert cat.dates[2] == 20000201
+    assert cat.has("SWAT", 20000201)
+    assert not cat.has("NOSUCHNAME", 20000201)
+
+    kwname, _kwtype, _nitems, bytestart, date = cat.get("SWAT", 20000201)
+    first = df[(df.KEYWORD == "SWAT") & (df.DATE == 20000201)].iloc[0]
+    assert kwname == "SWAT"
+    assert date == 20000201
+    assert bytestart == first["BYTESTART"]
+
+
+def test_scan_keywords_sidecar_cache(monkeypatch):
+    """Second scan of a RESTART file reuses the sidecar index, until file changes"""
+    from xtgeo.grid3d import _grid3d_utils
+
+    rfile = os.path.join(TDIR, "REEK_SCANCACHE.UNRST")
+    shutil.copyfile(RFILE1, rfile)
+    idxfile = rfile + _grid3d_utils.SCANCACHE_SUFFIX
+    if os.path.exists(idxfile):
+        os.remove(idxfile)
+
+    # the sidecar is opt-in
+    GridProperties.scan_keywords(rfile, dataframe=True, dates=True)
+    assert not os.path.exists(idxfile)
+
+    monkeypatch.setenv(_grid3d_utils.SCANCACHE_ENV, "1")
+    df1 = GridProperties.scan_keywords(rfile, dataframe=True, dates=True)
+    assert os.path.exists(idxfile)
+
+    # file mode shall follow the umask, as for other files
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(idxfile).st_mode & 0o777 == 0o666 & ~umask
+
+    df2 = GridProperties.scan_keywords(rfile, dataframe=True, dates=True)
+    assert df1.equals(df2)
+    assert GridProperties.scan_dates(rfile) == GridProperties.scan_dates(RFILE1)
+
+    # a truncated scan shall not be reused for a full scan, or vice versa
+    df4 = GridProperties.scan_keywords(rfile, dataframe=True, dates=True, maxkeys=10)
+    assert len(df4) == 10
+    df5 = GridProperties.scan_keywords(rfile, dataframe=True, dates=True)
+    assert df1.equals(df5)
+
+    # touching the file shall invalidate the index, so it is rewritten
+    mtime = os.path.getmtime(rfile)
+    os.utime(idxfile, (mtime - 100, mtime - 100))
+    os.utime(rfile, (mtime + 10, mtime + 10))
+    df3 = GridProperties.scan_keywords(rfile, dataframe=True, dates=True)
+    assert df1.equals(df3)
+    assert os.path.getmtime(idxfile) > mtime - 100
+
+
+def test_scan_keywords_cache_folder(monkeypatch):
+    """Sidecar index may be stored in a separate cache folder"""
+    from xtgeo.grid3d import _grid3d_utils
+
+    cachedir = os.path.join(TDIR, "scancache")
+    if os.path.isdir(cachedir):
+        shutil.rmtree(cachedir)
+    os.makedirs(cachedir)
+
+    monkeypatch.setenv(_grid3d_utils.SCANCACHE_ENV, cachedir)
+    df1 = GridProperties.scan_keywords(RFILE1, dataframe=True)
+    assert not os.path.exists(RFILE1 + _grid3d_utils.SCANCACHE_SUFFIX)
+    assert len(os.listdir(cachedir)) == 1
+
+    df2 = GridProperties.scan_keywords(RFILE1, dataframe=True)
+    assert df1.equals(df2)
+
+
+def test_eclbin_record_mmap_vs_cxtgeo():
+    """Reading records by memory map shall give same result as through C"""
+    import numpy as np
+    import xtgeo
+    from xtgeo.grid3d import _grid_eclbin_record as eclbin
+    from xtgeo.grid3d import _grid3d_utils
+
+    cat = _grid3d_utils.scan_ecl_catalog(RFILE1)
+    xfile = xtgeo._XTGeoCFile(RFILE1)
+
+    for kwname in ("INTEHEAD", "LOGIHEAD", "DOUBHEAD", "PRESSURE", "SWAT"):
+        _kw, kwtype, kwlen, kwbyte, _date = cat.get_first(kwname)
+        val1 = eclbin.eclbin_record(xfile, kwname, kwlen, kwtype, kwbyte)
+        val2 = eclbin.eclbin_record(xfile.fhandle, kwname, kwlen, kwtype, kwbyte)
+        assert val1.dtype == val2.dtype
+        np.testing.assert_array_equal(val1, val2)
+
+    xfile.close()
+
+
 def test_scan_keywords_roff():
     """A static method to scan quickly keywords in a ROFF file"""
     t1 = xtg.timer()
@@ -231,3 +427,40 @@ def test_get_dataframe():
     assert df['PRESSURE_19991201'].mean() == pytest.approx(334.523, abs=0.005)
 
 #    df = x.dataframe(activeonly=True, ijk=True, xyz=True)
+
+
+def test_get_dataframe_chunks():
+    """Get the gridproperties dataframe in chunks, and as Parquet file"""
+
+    g = Grid(GFILE1, fformat="egrid")
+
+    x = GridProperties()
+
+    names = ['SOIL', 'SWAT', 'PRESSURE']
+    dates = [19991201]
+    x.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+
+    for activeonly in (True, False):
+        df = x.get_dataframe(activeonly=activeonly, ijk=True, xyz=True, grid=g)
+        chunks = list(
+            x.get_dataframe_chunks(
+                activeonly=activeonly, ijk=True, xyz=True, grid=g, chunksize=4480
+            )
+        )
+        assert len(chunks) == 8  # 40 grid columns of 64 * 14 cells, 5 per chunk
+        pd.testing.assert_frame_equal(df, pd.concat(chunks, ignore_index=True))
+
+    pytest.importorskip("pyarrow")
+    pfile = os.path.join(TDIR, "reek_props.parquet")
+    x.to_table_file(pfile, activeonly=True, ijk=True, grid=g, chunksize=4480)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(pfile), x.get_dataframe(activeonly=True, ijk=True, grid=g)
+    )
+
+
+def test_table_file_without_pyarrow(monkeypatch):
+    """A clear ImportError is given when pyarrow is missing"""
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="requires the pyarrow package"):
+        GridProperties().to_table_file(os.path.join(TDIR, "none.parquet"))
@@ -89,6 +89,52 @@ def test_assign():
     assert x.dtype == np.float
 
 
+def test_get_buffer():
+    """Buffers for C shall equal the carray made by update_carray"""
+    import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+    from xtgeo.grid3d import _gridprop_lowlevel as gl
+
+    vals = np.arange(24, dtype=np.float64).reshape(2, 3, 4) + 0.7
+    vals = npma.masked_where(vals > 21, vals)
+    prop = GridProperty(ncol=2, nrow=3, nlay=4, values=vals)
+
+    for undef in (None, -999.0):
+        buf = gl.get_buffer(prop, undef=undef)
+        carr = gl.update_carray(prop, undef=undef)
+        cvals = _cxtgeo.swig_carr_to_numpy_1d(prop.ntotal, carr)
+        gl.delete_carray(prop, carr)
+        assert buf.dtype == np.float64
+        assert buf.flags.writeable
+        np.testing.assert_array_equal(buf, cvals)
+    assert (buf == -999.0).sum() == 3
+
+    # Fortran order is default, as in C; C order is the numpy order
+    np.testing.assert_array_equal(buf, prop.values.filled(-999.0).ravel(order="F"))
+    bufc = gl.get_buffer(prop, undef=-999.0, order="C")
+    np.testing.assert_array_equal(bufc, prop.values.filled(-999.0).ravel(order="C"))
+
+    # discrete casting (truncation, as astype) and undef for discrete
+    buf = gl.get_buffer(prop, discrete=True)
+    carr = gl.update_carray(prop, discrete=True)
+    cvals = _cxtgeo.swig_carr_to_numpy_i1d(prop.ntotal, carr)
+    gl.delete_carray(prop, carr)
+    assert buf.dtype == np.int32
+    np.testing.assert_array_equal(buf, cvals)
+    assert buf[0] == 0
+    assert (buf == xtgeo.UNDEF_INT).sum() == 3
+
+    # a copy, so changes in the buffer shall not affect the property
+    buf[0] = 99
+    assert prop.values[0, 0, 0] == pytest.approx(0.7)
+
+    # no copy when C order, no masked cells and right dtype; then read only
+    prop = GridProperty(ncol=2, nrow=3, nlay=4, values=np.ones((2, 3, 4)))
+    buf = gl.get_buffer(prop, order="C")
+    assert np.shares_memory(buf, prop.values)
+    assert not buf.flags.writeable
+    assert not np.shares_memory(gl.get_buffer(prop), prop.values)
+
+
 def test_create_actnum():
     """Test creating ACTNUM"""
     x = GridProperty()
@@ -259,6 +305,47 @@ def test_eclinit_import_reek():
     logger.info(pv.values.mean())
 
 
+def test_import_single_precision():
+    """Import with single precision storage, and keep it in operations."""
+
+    gg = Grid(testfile5, fformat="egrid")
+
+    po = GridProperty(testfile6, name="PORO", grid=gg, precision="single")
+    assert po.values.dtype == np.float32
+    podouble = GridProperty(testfile6, name="PORO", grid=gg)
+    assert po.values.mean() == pytest.approx(podouble.values.mean(), abs=0.00001)
+
+    po.values = po.values * 2.0
+    po.values = po.values.astype(np.float64)
+    assert po.dtype == np.float32
+    assert po.copy().dtype == np.float32
+
+    po.precision = "double"
+    assert po.dtype == np.float64
+
+    zone = GridProperty(testfile8, name="Zone", precision="single")
+    assert zone.isdiscrete
+    assert zone.dtype == np.int16
+    assert zone.codes[3] == "Below_Low_reek"
+
+    zone.to_file(os.path.join(td, "reek_zone_single.roff"), name="Zone")
+    zone2 = GridProperty(os.path.join(td, "reek_zone_single.roff"), name="Zone")
+    assert zone2.dtype == np.int32
+    np.testing.assert_array_equal(zone.values, zone2.values)
+
+    # the dtype is fixed, so codes outside the initial range are kept
+    zone.values[0, 0, 0] = 300
+    zone.values = zone.values.astype(np.int32) * 1
+    assert zone.dtype == np.int16
+    assert zone.values[0, 0, 0] == 300
+
+    zone.values = zone.values.astype(np.int32) + 300
+    assert zone.dtype == np.int16
+    assert zone.values[0, 0, 0] == 600
+    with pytest.raises(ValueError, match="precision double"):
+        zone.values = np.ma.zeros(zone.values.shape, dtype=np.int32) + 40000
+
+
 def test_eclinit_simple_importexport():
     """Property import and export with anoother name"""
 
@@ -335,6 +422,40 @@ def test_grdecl_import_reek():
     tsetup.assert_almostequal(poro.values.mean(), porox.values.mean(), 0.001)
 
 
+def test_grdecl_import_repeats_comments():
+    """Property GRDECL import with comments, sections and N*value repeats"""
+
+    grd = Grid()
+    grd.create_box(dimension=(4, 3, 2))
+
+    pfile = os.path.join(td, "repeats.grdecl")
+    with open(pfile, "w") as stream:
+        stream.write("-- a comment\nECHO\nGRID\nPERMX\n 24*100 /\nEDIT\n")
+        stream.write("PROPS\nPORO  -- porosity\n 12*0.25\n 0.1 0.2 10*0.3 /\n")
+
+    poro = GridProperty(pfile, name="PORO", fformat="grdecl", grid=grd)
+
+    assert poro.values.count() == 24
+    assert (poro.values[:, :, 0] == 0.25).all()
+    assert poro.values[0, 0, 1] == 0.1
+    assert poro.values[1, 0, 1] == 0.2
+    tsetup.assert_almostequal(poro.values.sum(), 12 * 0.25 + 0.3 + 10 * 0.3, 0.0001)
+
+
+def test_grdecl_import_repeated_keyword():
+    """Property GRDECL import where the keyword repeats; the first is used"""
+
+    grd = Grid()
+    grd.create_box(dimension=(4, 3, 2))
+
+    pfile = os.path.join(td, "repeated.grdecl")
+    with open(pfile, "w") as stream:
+        stream.write("PORO\n 24*0.1 /\nPERMX\n 24*100 /\nPORO\n 24*0.2 /\n")
+
+    poro = GridProperty(pfile, name="PORO", fformat="grdecl", grid=grd)
+    assert (poro.values == 0.1).all()
+
+
 # def test_export_roff():
 #     """Property import from Eclipse. Then export to roff."""
 
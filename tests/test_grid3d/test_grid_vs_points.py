@@ -2,6 +2,10 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+from os.path import join
+
+import pytest
+
 import xtgeo
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -134,3 +138,42 @@ def test_get_ijk_from_points_small():
     g1 = xtgeo.grid3d.Grid(SMALL2)
     ijk = g1.get_ijk_from_points(po, activeonly=False)
     assert ijk["JY"][1] == 3
+
+
+def test_get_ijk_from_points_cellindex():
+    """Cell index is reused, stored to file and used by parallel lookups"""
+
+    g1 = xtgeo.grid3d.Grid(REEKGRID)
+    df2 = g1.get_dataframe(ijk=False, xyz=True)
+
+    po = xtgeo.Points()
+    po.dataframe = df2
+
+    ijk1 = g1.get_ijk_from_points(po, includepoints=False)
+    index = g1._tmp["cellindex"]
+
+    # same geometry, the index is not remade
+    g1.get_ijk_from_points(po, includepoints=False)
+    assert g1._tmp["cellindex"] is index
+    assert index.generation == g1.geometry_generation
+
+    fname = join(TDMP, "reek_cellindex.npz")
+    g1.cellindex_to_file(fname)
+
+    g2 = xtgeo.grid3d.Grid(REEKGRID)
+    g2.cellindex_from_file(fname)
+    ijk2 = g2.get_ijk_from_points(po, includepoints=False, workers=3)
+
+    assert ijk1.equals(ijk2)
+
+    # process and thread pools (geometry in shared memory or not) give the same
+    for executor in ("process", "thread"):
+        ijk3 = g1.get_ijk_from_points(
+            po, includepoints=False, workers=3, executor=executor
+        )
+        assert ijk1.equals(ijk3)
+
+    # changed geometry, the stored index does not fit any more
+    g2.translate_coordinates(translate=(10, 0, 0))
+    with pytest.raises(ValueError):
+        g2.cellindex_from_file(fname)
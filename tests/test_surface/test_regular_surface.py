@@ -181,6 +181,27 @@ def test_irapbin_import_metadatafirst():
     tsetup.assert_almostequal(sur[nsurf - 1].values[11, 0], 1678.89733887, 0.00001)
 
 
+@pytest.mark.parametrize(
+    "sfile, fformat",
+    [(TESTSET3, None), (TESTSET6A, None), (TESTSET4B, "ijxyz")],
+)
+def test_import_metadatafirst_other_formats(sfile, fformat):
+    """Import Irap ascii, Petromod and IJXYZ, first with metadata only."""
+
+    full = xtgeo.RegularSurface(sfile, fformat=fformat)
+
+    lazy = xtgeo.RegularSurface(sfile, fformat=fformat, values=False)
+    assert (lazy.ncol, lazy.nrow) == (full.ncol, full.nrow)
+    assert (lazy.xori, lazy.yori) == (full.xori, full.yori)
+    assert lazy.rotation == full.rotation
+    assert lazy.nactive is None
+
+    lazy.load_values()
+    assert lazy.compare_topology(full)
+    assert lazy.nactive == full.nactive
+    assert (lazy.values == full.values).all()
+
+
 def test_irapbin_export_test():
     """Import Reek Irap binary using different numpy details, test timing"""
     logger.info("Import and export...")
@@ -383,6 +404,28 @@ def test_irapbin_io():
     tsetup.assert_equal(cc.ncol, 554)
 
 
+def test_irapbin_io_engine_python():
+    """Import and export Irap binary with numpy engine, compare with C engine."""
+
+    xcx = xtgeo.RegularSurface()
+    xcx.from_file(TESTSET1, fformat="irap_binary")
+
+    xpy = xtgeo.RegularSurface()
+    xpy.from_file(TESTSET1, fformat="irap_binary", engine="python")
+
+    assert xpy.compare_topology(xcx)
+    assert xpy.yflip == xcx.yflip
+    assert (xpy.values.mask == xcx.values.mask).all()
+    assert (xpy.values == xcx.values).all()
+
+    xcx.to_file(os.path.join(TMPD, "reek1_cxtgeo.gri"))
+    xcx.to_file(os.path.join(TMPD, "reek1_python.gri"), engine="python")
+
+    with open(os.path.join(TMPD, "reek1_cxtgeo.gri"), "rb") as stream1:
+        with open(os.path.join(TMPD, "reek1_python.gri"), "rb") as stream2:
+            assert stream1.read() == stream2.read()
+
+
 def test_get_values1d():
     """Get the 1D array, different variants as masked, notmasked, order, etc"""
 
@@ -2,10 +2,12 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
 import sys
 import pytest
 from os.path import join as ojn
 
+import numpy as np
 import numpy.ma as ma
 
 import xtgeo
@@ -172,6 +174,146 @@ def test_slice_attr_window_max(load_cube_rsgy1):
     tsetup.assert_almostequal(xs1.values.mean(), 0.08494559, 0.0001)
 
 
+def _stacked_attvalues(attr, stacked):
+    """Reference window attribute, computed with numpy.ma along the stack."""
+    if attr in ('maxpos', 'sumpos', 'meanpos'):
+        stacked = ma.masked_less(stacked, 0.0)
+    elif attr in ('maxneg', 'sumneg', 'meanneg'):
+        stacked = ma.masked_greater_equal(stacked, 0.0)
+    elif attr in ('maxabs', 'sumabs', 'meanabs'):
+        stacked = abs(stacked)
+
+    if attr == 'rms':
+        return np.sqrt(ma.mean(np.square(stacked), axis=2))
+    if attr in ('min', 'maxneg'):
+        return ma.min(stacked, axis=2)
+    if attr.startswith('max'):
+        return ma.max(stacked, axis=2)
+    if attr.startswith('sum'):
+        return ma.sum(stacked, axis=2)
+    if attr == 'var':
+        return ma.var(stacked, axis=2)
+    return ma.mean(stacked, axis=2)
+
+
+def test_window_attributes_vs_stacked():
+    """Window attributes accumulated per slice vs numpy.ma on a stack."""
+    from xtgeo.surface import _regsurf_cube
+
+    rng = np.random.RandomState(42)
+    slices = []
+    for _ in range(7):
+        vals = rng.normal(size=(5, 4))
+        slices.append(ma.masked_where(rng.uniform(size=(5, 4)) < 0.2, vals))
+    slices.append(ma.masked_all((5, 4)))
+    stacked = ma.dstack(slices)
+
+    window = _regsurf_cube._WindowAttributes(_regsurf_cube.ALLATTRS, (5, 4))
+    for values in slices:
+        window.add(values)
+    result = window.result()
+
+    for attr in _regsurf_cube.ALLATTRS:
+        expected = _stacked_attvalues(attr, stacked)
+        mask = ma.getmaskarray(expected)
+        assert (ma.getmaskarray(result[attr]) == mask).all(), attr
+        assert np.allclose(result[attr][~mask], expected[~mask]), attr
+
+    with pytest.raises(ValueError):
+        _regsurf_cube._WindowAttributes(['foo'], (5, 4))
+
+
+@tsetup.skipsegyio
+@tsetup.skipifroxar
+def test_slice_attr_window_all_vs_stacked(load_cube_rsgy1):
+    """Window attributes (accumulated per slice) vs stacked slices."""
+    from xtgeo.surface import _regsurf_cube
+
+    xs1 = RegularSurface(rtop1)
+    kube = load_cube_rsgy1
+
+    zrange, ndiv = 10.0, 4
+    attrs = xs1.slice_cube_window(kube, attribute='all', zrange=zrange,
+                                  ndiv=ndiv, sampling='trilinear')
+
+    zincr = zrange / ndiv
+    slices = []
+    for shift in [0.0] + [zincr * (i + 1) for i in range(ndiv)] + \
+            [-zincr * (i + 1) for i in range(ndiv)]:
+        xsh = xs1.copy()
+        xsh.values += shift
+        xsh.slice_cube(kube, sampling='trilinear')
+        slices.append(xsh.values)
+    stacked = ma.dstack(slices)
+
+    for attr in _regsurf_cube.ALLATTRS:
+        expected = _stacked_attvalues(attr, stacked)
+        assert (attrs[attr].values.mask == ma.getmaskarray(expected)).all()
+        tsetup.assert_almostequal(attrs[attr].values.mean(), expected.mean(),
+                                  1e-8)
+
+
+@tsetup.skipsegyio
+@tsetup.skipifroxar
+def test_slice_many_surfaces_parallel(load_cube_rsgy1):
+    """Slice a cube along many surfaces in a pool, compare with one by one."""
+
+    kube = load_cube_rsgy1
+    surfs = xtgeo.Surfaces([rtop1, rbas1, rbas2])
+
+    for executor in ('process', 'thread'):
+        slices = surfs.slice_cube(kube, sampling='trilinear', workers=2,
+                                  executor=executor)
+        attrs = surfs.slice_cube_window(kube, attribute=['max', 'rms'],
+                                        zrange=5.0, workers=2,
+                                        executor=executor)
+        assert len(slices) == len(attrs) == 3
+
+        for surf, sliced, attr in zip(surfs.surfaces, slices, attrs):
+            xs1 = surf.copy()
+            xs1.slice_cube(kube, sampling='trilinear')
+            assert (sliced.values == xs1.values).all()
+
+            xs2 = surf.copy()
+            expected = xs2.slice_cube_window(kube, attribute=['max', 'rms'],
+                                             zrange=5.0)
+            assert (attr['rms'].values == expected['rms'].values).all()
+
+    # input surfaces are not changed
+    tsetup.assert_almostequal(surfs.surfaces[0].values.mean(),
+                              RegularSurface(rtop1).values.mean(), 1e-8)
+
+
+@tsetup.skipsegyio
+@tsetup.skipifroxar
+def test_slice_many_surfaces_shared_fallback(load_cube_rsgy1, monkeypatch):
+    """Shared cube falls back to temp dir, and is removed if it cannot be made."""
+
+    from xtgeo.common import _ensemble
+
+    kube = load_cube_rsgy1
+    surfs = xtgeo.Surfaces([rtop1, rbas1])
+
+    # no room in shared memory
+    monkeypatch.setattr(_ensemble, 'SHMDIR', ojn(td, 'no_such_shm'))
+    slices = surfs.slice_cube(kube, workers=2)
+    expected = surfs.surfaces[0].copy()
+    expected.slice_cube(kube)
+    assert (slices[0].values == expected.values).all()
+
+    # a full file system gives an exception, and no file is left
+    def _nospace(*_args):
+        raise OSError(28, 'No space left on device')
+
+    monkeypatch.setattr(_ensemble.os, 'posix_fallocate', _nospace,
+                        raising=False)
+    monkeypatch.setattr(_ensemble.tempfile, 'tempdir', td)
+    before = set(os.listdir(td))
+    with pytest.raises(OSError):
+        surfs.slice_cube(kube, workers=2)
+    assert set(os.listdir(td)) == before
+
+
 @tsetup.bigtest
 @tsetup.skipsegyio
 @tsetup.skipifroxar
@@ -6,8 +6,10 @@ import math
 from os.path import join
 
 import numpy as np
+import pytest
 
 import xtgeo
+from xtgeo.surface import _regsurf_import
 import test_common.test_xtg as tsetup
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -76,6 +78,47 @@ def test_create_init_mixlist():
     assert isinstance(surfs, xtgeo.Surfaces)
 
 
+def test_create_init_filelist_workers():
+    """Read many files concurrently, compare with serial read and stack values"""
+
+    flist = [TESTSET1A, TESTSET1B, TESTSET1A, TESTSET1B]
+    serial = xtgeo.Surfaces(flist, workers=1)
+
+    for executor in ("thread", "process"):
+        surfs = xtgeo.Surfaces(flist, workers=3, executor=executor)
+        assert len(surfs.surfaces) == 4
+
+        stacked, meta = surfs.get_stacked_values()
+        assert stacked.shape == (4, serial.surfaces[0].ncol, serial.surfaces[0].nrow)
+        assert meta[1]["filesrc"] == serial.surfaces[1].filesrc
+
+        for num, surf in enumerate(serial.surfaces):
+            np.testing.assert_array_equal(stacked[num].mask, surf.values.mask)
+            np.testing.assert_allclose(stacked[num], surf.values)
+
+
+def test_stacked_values_empty():
+    """Stacking values of no surfaces shall give a clear error"""
+
+    with pytest.raises(ValueError, match="no surfaces"):
+        xtgeo.Surfaces().get_stacked_values()
+
+
+def test_surfaces_catalog():
+    """Scan the geometry of surface files, without reading values"""
+
+    cat = xtgeo.surfaces_catalog([TESTSET1A, TESTSET1B, "nofile.gri"])
+    assert len(cat) == 2
+    assert cat["FILE"].tolist() == [TESTSET1A, TESTSET1B]
+    assert cat["NCOL"].tolist() == [554, 554]
+
+    surfs = xtgeo.Surfaces([TESTSET1A, TESTSET1B], lazy=True)
+    assert surfs.catalog()[["NCOL", "NROW"]].equals(cat[["NCOL", "NROW"]])
+
+    cat = xtgeo.surfaces_catalog(join(TESTPATH, "surfaces/reek/1/*reek_rota.gri"))
+    assert len(cat) >= 2
+
+
 def test_statistics():
     """Find the mean etc measures of the surfaces"""
 
@@ -89,6 +132,49 @@ def test_statistics():
     tsetup.assert_almostequal(res["std"].values.min(), 3.7039, 0.0001)
 
 
+def test_statistics_lazy_percentiles():
+    """Streaming statistics with percentiles, surfaces read one by one"""
+
+    flist = [TESTSET1A, TESTSET1B, TESTSET1A]
+    surfs = xtgeo.Surfaces(flist, lazy=True)
+    assert not any(surf._isloaded for surf in surfs.surfaces)
+
+    res = surfs.statistics(percentiles=[10, 50, 90], maxmemory=0.0001)
+    assert not any(surf._isloaded for surf in surfs.surfaces)
+
+    xlist = np.array(
+        [np.ma.filled(xtgeo.RegularSurface(fil).values, np.nan) for fil in flist]
+    )
+    tsetup.assert_almostequal(res["mean"].values.mean(), np.nanmean(xlist), 0.0001)
+    np.testing.assert_allclose(
+        res["p50"].values.filled(np.nan),
+        np.nanpercentile(xlist, 50, axis=0),
+        rtol=1e-6,
+    )
+    np.testing.assert_allclose(
+        res["max"].values.filled(np.nan), np.nanmax(xlist, axis=0)
+    )
+    assert res["count"].values.max() == 3
+
+    # lazy and loaded surfaces shall give identical results
+    eager = xtgeo.Surfaces(flist).statistics(percentiles=[10, 50, 90])
+    for key in ("p10", "p50", "p90"):
+        np.testing.assert_array_equal(
+            res[key].values.filled(np.nan), eager[key].values.filled(np.nan)
+        )
+
+    # percentile bands of lazy Irap binary surfaces are read directly from file
+    reader = _regsurf_import.irap_binary_rowreader(TESTSET1A)
+    np.testing.assert_array_equal(reader(3, 10), xlist[0][:, 3:10])
+
+    # apply reads lazy surfaces one by one, and releases them again
+    mean = surfs.apply(np.nanmean, axis=0)
+    assert not any(surf._isloaded for surf in surfs.surfaces)
+    np.testing.assert_allclose(
+        mean.values.filled(np.nan), np.nanmean(xlist, axis=0), rtol=1e-12
+    )
+
+
 def test_more_statistics():
     """Find the mean etc measures of the surfaces"""
 
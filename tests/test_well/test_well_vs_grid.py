@@ -5,9 +5,9 @@ from __future__ import print_function
 from os.path import join
 
 import pytest
+import pandas as pd
 
-
-from xtgeo.well import Well
+from xtgeo.well import Well, Wells
 from xtgeo.grid3d import Grid, GridProperty
 from xtgeo.common import XTGeoDialog
 
@@ -29,6 +29,7 @@ EQGULLTESTPATH = "../xtgeo-testdata-equinor/data"
 # =========================================================================
 
 WFILE = join(TESTPATH, "wells/reek/1/OP_1.w")
+WFILES = [join(TESTPATH, "wells/reek/1/OP_{}.w".format(num)) for num in (1, 2, 3)]
 GFILE = join(TESTPATH, "3dgrids/reek/REEK.EGRID")
 PFILE = join(TESTPATH, "3dgrids/reek/REEK.INIT")
 
@@ -116,3 +117,31 @@ def test_well_get_gridprops(loadwell1, loadgrid1, loadporo1):
     tsetup.assert_almostequal(mywell.dataframe.iloc[4775]["PORO_model"], 0.2741, 0.001)
     assert mywell.dataframe.iloc[4775]["ACTNUM_model"] == 1
     assert mywell.isdiscrete("ACTNUM_model") is True
+
+
+def test_wells_get_gridprops(loadgrid1, loadporo1):
+    """Sample grid properties for many wells in one go, compare with per well"""
+
+    mywells = Wells(WFILES)
+    mygrid = loadgrid1
+    myporo = loadporo1
+
+    mywells.get_gridproperties(myporo, mygrid)
+    mywells.make_ijk_from_grid(mygrid, workers=2)
+
+    for wfile, well in zip(WFILES, mywells.wells):
+        mywell = Well(wfile)
+        mywell.get_gridproperties(myporo, mygrid)
+        mywell.make_ijk_from_grid(mygrid)
+        pd.testing.assert_frame_equal(well.dataframe, mywell.dataframe)
+
+    # wells in a thread pool, geometry not shared, give the same
+    thwells = Wells(WFILES)
+    thwells.make_ijk_from_grid(mygrid, workers=2, executor="thread")
+    for thwell, well in zip(thwells.wells, mywells.wells):
+        for log in ("ICELL", "JCELL", "KCELL"):
+            assert thwell.dataframe[log].equals(well.dataframe[log])
+
+    df = mywells.wells[0].dataframe
+    assert int(df.iloc[4850]["ICELL"]) == 29
+    tsetup.assert_almostequal(df.iloc[4775]["PORO_model"], 0.2741, 0.001)
@@ -6,6 +6,8 @@ import glob
 from os.path import join as ojoin
 
 import pytest
+import numpy as np
+import pandas as pd
 
 from xtgeo.well import Well
 from xtgeo.well import Wells
@@ -49,6 +51,19 @@ def test_import_wells(loadwells1):
     assert 'WELL33' in mywells.names
 
 
+def test_import_wells_concurrent():
+    """Import wells from files concurrently, compare with one by one."""
+
+    wfiles = sorted(glob.glob(WFILES))
+
+    serial = Wells(wfiles, workers=1)
+    for executor in ('thread', 'process'):
+        mywells = Wells(wfiles, workers=4, executor=executor)
+        assert mywells.names == serial.names
+        for well1, well2 in zip(mywells.wells, serial.wells):
+            pd.testing.assert_frame_equal(well1.dataframe, well2.dataframe)
+
+
 def test_get_dataframe_allwells(loadwells1):
     """Get a single dataframe for all wells"""
 
@@ -64,6 +79,98 @@ def test_get_dataframe_allwells(loadwells1):
     logger.debug(df)
 
 
+def test_columnar_wells(loadwells1):
+    """Columnar store of wells, compare with operations per well."""
+
+    mywells = Wells()
+    mywells.wells = [well.copy() for well in loadwells1]
+
+    cwells = mywells.to_columnar()
+    assert cwells.names == mywells.names
+    assert cwells.nrow == sum(well.nrow for well in mywells.wells)
+
+    cwells.limit_tvd(1300, 1400)
+    cwells.downsample(interval=6)
+
+    mywells.limit_tvd(1300, 1400)
+    mywells.downsample(interval=6)
+
+    pd.testing.assert_frame_equal(cwells.get_dataframe(), mywells.get_dataframe())
+
+    newwells = Wells()
+    newwells.from_columnar(cwells)
+    for well1, well2 in zip(newwells.wells, mywells.wells):
+        pd.testing.assert_frame_equal(well1.dataframe, well2.dataframe)
+
+
+def test_rescale_wells(loadwells1):
+    """Rescale all wells in batch, compare with rescale per well."""
+
+    mywells = Wells()
+    mywells.wells = [well.copy() for well in loadwells1]
+    mywells.rescale(delta=2, tvdrange=(1300, 1400), workers=4)
+
+    for well1, well2 in zip(mywells.wells, loadwells1):
+        well2 = well2.copy()
+        well2.rescale(delta=2, tvdrange=(1300, 1400))
+        pd.testing.assert_frame_equal(well1.dataframe, well2.dataframe)
+
+
+@pytest.fixture()
+def loadresc1():
+    """A small well with MD log, an undefined value and a zone log"""
+    phit = [0.1, 0.2, -999, 0.3, 0.25, 0.2, 0.15, 0.1]
+    zone = [1, 1, 2, 2, 2, 3, 3, 3]
+    rows = []
+    for inum in range(8):
+        zval = 1000.0 + 5 * inum
+        mdval = 1500.0 + 10 * inum
+        rows.append((1000.0 + inum, 2000.0, zval, mdval, phit[inum], zone[inum]))
+
+    wfile = tsetup.write_rmswell(
+        ojoin(td, "resc_1.w"),
+        "RESC-1",
+        ["MDEPTH UNK lin", "PHIT UNK lin", "ZONE DISC 1 ZA 2 ZB 3 ZC"],
+        rows,
+    )
+    return Well(wfile, mdlogname="MDEPTH")
+
+
+def test_rescale_wells_golden(loadresc1):
+    """Rescale a fixture well, compare with expected values"""
+
+    mywells = Wells()
+    mywells.wells = [loadresc1.copy()]
+    mywells.rescale(delta=3, tvdrange=(1010, 1025))
+
+    # resampled part is MD 1520 - 1550, in 10 steps; the first sample of it
+    # has PHIT undefined in the old dataframe, and is kept as a duplicate row
+    steps = np.arange(10) / 3.0
+    phit = np.interp(steps, [0, 1, 2, 3], [0.25, 0.3, 0.25, 0.2])
+    zval = 1010 + 5 * steps
+    mdval = 1520 + 10 * steps
+    expected = pd.DataFrame(
+        {
+            "X_UTME": np.concatenate(([1000, 1001, 1002], 1002 + steps, [1006, 1007])),
+            "Y_UTMN": np.full(15, 2000.0),
+            "Z_TVDSS": np.concatenate(([1000, 1005, 1010], zval, [1030, 1035])),
+            "PHIT": np.concatenate(([0.1, 0.2, np.nan], phit, [0.15, 0.1])),
+            "ZONE": np.repeat([1.0, 2.0, 3.0], [2, 9, 4]),
+            "MDEPTH": np.concatenate(([1500, 1510, 1520], mdval, [1560, 1570])),
+        }
+    )
+    pd.testing.assert_frame_equal(mywells.wells[0].dataframe, expected)
+
+    # discrete logs are rounded to the nearest code after interpolation
+    mywells.wells = [loadresc1.copy()]
+    mywells.rescale(delta=4)
+    dfr = mywells.wells[0].dataframe
+    assert len(dfr) == 18
+    assert dfr["ZONE"].tolist() == [1.0] * 4 + [2.0] * 7 + [3.0] * 7
+    assert dfr["PHIT"].iloc[1] == pytest.approx(0.141176, abs=1.0e-6)
+    assert dfr["MDEPTH"].iloc[-1] == 1570.0
+
+
 @tsetup.plotskipifroxar
 def test_quickplot_wells(loadwells1):
     """Import wells from file to Wells and quick plot."""
@@ -87,6 +194,27 @@ def test_wellintersections(loadwells1):
     dfr.to_csv(ojoin(td, 'wells_crossings.csv'))
 
 
+def test_wellintersections_engines(loadwells1):
+    """Well crossings by spatial index shall match the shapely version"""
+
+    wfilter = {'parallel': {'xtol': 4.0, 'ytol': 4.0, 'ztol': 2.0, 'itol': 10,
+                            'atol': 5.0}}
+
+    mywells = Wells()
+    mywells.wells = loadwells1
+    mywells.limit_tvd(1300, 1400)
+    mywells.downsample(interval=6)
+
+    for wfl in (None, wfilter):
+        dfr1 = mywells.wellintersections(wfilter=wfl, engine='shapely')
+        dfr2 = mywells.wellintersections(wfilter=wfl, engine='index', workers=2)
+
+        cols = ['WELL', 'CWELL', 'MDEPTH']
+        dfr1 = dfr1.sort_values(cols).reset_index(drop=True)
+        dfr2 = dfr2.sort_values(cols).reset_index(drop=True)
+        pd.testing.assert_frame_equal(dfr1, dfr2)
+
+
 def test_wellintersections_tvdrange_nowfilter(loadwells1):
     """Find well crossing using coarser sampling to Fence"""
 
@@ -2,11 +2,18 @@
 from __future__ import division, absolute_import
 from __future__ import print_function
 
+import os
 import glob
+
+import pytest
+import pandas as pd
+
 from xtgeo.xyz import Points
-from xtgeo.well import Well
+from xtgeo.well import Well, Wells
 from xtgeo.common import XTGeoDialog
 
+import test_common.test_xtg as tsetup
+
 xtg = XTGeoDialog()
 logger = xtg.basiclogger(__name__)
 
@@ -104,6 +111,92 @@ def test_get_zone_thickness_one_well():
     logger.info('Number of well made to tops: {}'.format(nwell))
 
 
+def test_get_zone_tops_some_wells_vs_one_by_one():
+    """Tops from many wells in one go shall match the wells one by one"""
+
+    wlist = []
+    for w in sorted(glob.glob(wfiles2)):
+        wlist.append(Well(w, zonelogname='Zonelog'))
+
+    for tops in (True, False):
+        mypoints = Points()
+        nwell = mypoints.from_wells(wlist, tops=tops, use_undef=True)
+        assert nwell == len(wlist)
+
+        single = pd.concat(
+            [w.get_zonation_points(tops=tops, use_undef=True) for w in wlist],
+            ignore_index=True,
+        )
+        pd.testing.assert_frame_equal(mypoints.dataframe, single)
+
+        mywells = Wells()
+        mywells.wells = wlist
+        pd.testing.assert_frame_equal(
+            mywells.get_zonation_points(tops=tops, use_undef=True), single
+        )
+
+
+# a vertical fixture well, with jumps over zones, a gap of UNDEF and decreasing
+# zones; the expected values below are from the zonation code in xtgeo 2.7
+GOLDZONES = [-999, 1, 1, 2, 2, 4, 4, -999, 3, 3, 1, 1, 2, 2]
+
+
+@pytest.fixture()
+def loadgoldwell():
+    """A vertical well with MD and a zone log (GOLDZONES), 10 m sampling"""
+    rows = []
+    for inum, zone in enumerate(GOLDZONES):
+        zval = 1000.0 + 10 * inum
+        rows.append((1000.0, 2000.0, zval, zval + 500.0, zone))
+
+    wfile = tsetup.write_rmswell(
+        os.path.join(td, "gold_1.w"),
+        "GOLD-1",
+        ["MDEPTH UNK lin", "Zonelog DISC 1 ZA 2 ZB 3 ZC 4 ZD"],
+        rows,
+    )
+    return Well(wfile, zonelogname="Zonelog", mdlogname="MDEPTH")
+
+
+def test_get_zonation_points_golden(loadgoldwell):
+    """Tops and thickness points for a fixture well, vs expected values"""
+
+    well = loadgoldwell
+
+    dfr = well.get_zonation_points(tops=True)
+    assert dfr["Z_TVDSS"].tolist() == [1030, 1050, 1050, 1090, 1090, 1120]
+    assert dfr["M_MDEPTH"].tolist() == [1530, 1550, 1550, 1590, 1590, 1620]
+    assert dfr["Zone"].tolist() == [2, 3, 4, 3, 2, 2]
+    assert dfr["TopName"].tolist() == ["TopZ" + name for name in "BCDCBB"]
+    assert (dfr["Q_INCL"] == 0.0).all()
+    assert (dfr["Q_AZI"] == -999.0).all()
+    assert (dfr["WellName"] == "GOLD-1").all()
+
+    dfr = well.get_zonation_points(tops=True, use_undef=True)
+    zvals = [1010, 1030, 1050, 1050, 1060, 1060, 1060, 1060, 1080, 1080, 1080]
+    assert dfr["Z_TVDSS"].tolist() == zvals + [1090, 1090, 1120]
+    assert dfr["Zone"].tolist() == [1, 2, 3, 4, 4, 3, 2, 1, 1, 2, 3, 3, 2, 2]
+
+    dfr = well.get_zonation_points(tops=False)
+    assert dfr["Z_TVDSS"].tolist() == [20, 0, 40, 0]
+    assert dfr["M_MDEPTH_AVG"].tolist() == [1540, 1550, 1570, 1590]
+    assert dfr["Q_MD1"].tolist() == [1530, 1550, 1550, 1590]
+    assert dfr["Q_MD2"].tolist() == [1550, 1550, 1590, 1590]
+    assert dfr["Zone"].tolist() == [2, 3, 3, 2]
+    assert dfr["ZoneName"].tolist() == ["ZB", "ZC", "ZC", "ZB"]
+
+    dfr = well.get_zonation_points(tops=False, use_undef=True)
+    assert dfr["Z_TVDSS"].tolist() == [20, 20, 0, 0, 0, 0, 0, 0, 0]
+    mdavg = [1520, 1540, 1550, 1560, 1560, 1560, 1580, 1580, 1590]
+    assert dfr["M_MDEPTH_AVG"].tolist() == mdavg
+    assert dfr["Zone"].tolist() == [1, 2, 3, 3, 2, 1, 1, 2, 2]
+
+    # same result from many wells in one go
+    mypoints = Points()
+    mypoints.from_wells([well, well.copy()], tops=True)
+    assert mypoints.dataframe["Zone"].tolist() == [2, 3, 4, 3, 2, 2] * 2
+
+
 def test_get_zone_thickness_some_wells():
     """Import some wells and get the zone thicknesses"""
 